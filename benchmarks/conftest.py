@@ -0,0 +1,43 @@
+"""
+Benchmark suite configuration for FVS-Python.
+
+Benchmarks run under pytest-benchmark (``pip install fvs-python[benchmark]``)
+and are kept out of the normal test run. Results are stored as JSON under
+benchmarks/baselines/<machine>/ so later runs can be compared against them.
+
+Record a baseline:
+    pytest benchmarks --benchmark-save=baseline
+
+Compare against the latest stored run, failing on regressions over 15%:
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=median:15%
+
+Deselect the slow per-tree benchmarks with ``-m "not slow"``.
+"""
+import warnings
+from pathlib import Path
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ['test_*.py']
+
+
+# Default location of stored benchmark runs
+BASELINE_DIR = Path(__file__).parent / 'baselines'
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: marks benchmarks as slow (deselect with -m "not slow")')
+    # Store runs next to the suite unless --benchmark-storage was given
+    if getattr(config.option, 'benchmark_storage', None) == 'file://./.benchmarks':
+        config.option.benchmark_storage = f'file://{BASELINE_DIR}'
+
+
+@pytest.fixture(autouse=True)
+def quiet_warnings():
+    """Silence the volume library fallback warning during timing."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        yield
@@ -0,0 +1,121 @@
+"""
+Benchmarks for the growth kernels: single trees, stands and stand batches.
+"""
+import numpy as np
+import pytest
+from fvs_python.tree import Tree
+from benchmarks.utils import make_stand, make_batch, grown_batch, copy_batch
+
+
+def test_single_tree_growth(benchmark):
+    """One 5-year growth period of a single large tree."""
+    def setup():
+        return (Tree(dbh=5.0, height=30.0, species='LP', age=10),), {}
+
+    benchmark.pedantic(
+        lambda tree: tree.grow(site_index=70, competition_factor=0.5, ba=100, pbal=50),
+        setup=setup, rounds=20
+    )
+
+
+@pytest.mark.parametrize('n_trees', [100, pytest.param(1000, marks=pytest.mark.slow)])
+def test_stand_growth(benchmark, n_trees):
+    """One growth cycle of a per-tree Stand."""
+    benchmark.pedantic(lambda stand: stand.grow(years=5),
+                       setup=lambda: ((make_stand(n_trees),), {}), rounds=3)
+
+
+@pytest.mark.parametrize('n_records', [100, 1000, 10000])
+def test_batch_growth(benchmark, n_records):
+    """One growth cycle of a StandBatch of ten stands."""
+    benchmark.pedantic(lambda batch: batch.grow(years=5),
+                       setup=lambda: ((make_batch(n_records),), {}), rounds=20)
+
+
+def test_stand_competition(benchmark):
+    """Competition metrics of a 100-tree Stand."""
+    stand = make_stand(100)
+    benchmark(stand._calculate_competition_metrics)
+
+
+@pytest.mark.parametrize('n_records', [1000, 10000])
+def test_batch_competition(benchmark, n_records):
+    """Competition metrics of a StandBatch."""
+    batch = grown_batch(n_records)
+    benchmark(batch.calculate_competition_metrics)
+
+
+def test_stand_mortality(benchmark):
+    """Mortality of a 100-tree Stand."""
+    stand = make_stand(100)
+    trees = list(stand.trees)
+
+    def setup():
+        stand.trees = list(trees)
+        return (), {}
+
+    benchmark.pedantic(stand._apply_mortality, setup=setup, rounds=50)
+
+
+@pytest.mark.parametrize('n_records', [1000, 10000])
+def test_batch_mortality(benchmark, n_records):
+    """Mortality of a StandBatch, including array compaction."""
+    batch = grown_batch(n_records)
+    benchmark.pedantic(lambda b: b._apply_mortality(),
+                       setup=lambda: ((copy_batch(batch),), {}), rounds=50)
+
+
+def test_stand_volume(benchmark):
+    """Per-tree volume of a 100-tree Stand."""
+    stand = make_stand(100)
+    stand.grow(years=15)
+    benchmark(stand.calculate_volume)
+
+
+@pytest.mark.parametrize('n_records', [1000, 10000])
+def test_batch_volume(benchmark, n_records):
+    """Volume of every record in a StandBatch."""
+    batch = grown_batch(n_records)
+    benchmark(batch.calculate_volume)
+
+
+@pytest.mark.parametrize('n_records', [1000, 10000])
+def test_batch_sdi_mortality(benchmark, n_records):
+    """Deterministic SDI-based mortality of a StandBatch."""
+    batch = grown_batch(n_records)
+    batch.mortality_model = 'sdi'
+    benchmark.pedantic(lambda b: b._apply_mortality(),
+                       setup=lambda: ((copy_batch(batch),), {}), rounds=50)
+
+
+def test_batch_regeneration(benchmark):
+    """Insertion of 100 seedling cohorts into a 10000-record StandBatch."""
+    batch = grown_batch(10000)
+    stands = np.arange(100) % batch.n_stands
+    benchmark.pedantic(lambda b: b.add_regeneration(stands, 50.0),
+                       setup=lambda: ((copy_batch(batch),), {}), rounds=20)
+
+
+def test_batch_thinning(benchmark):
+    """Thinning from below to 60 sq ft of basal area in a 10000-record StandBatch."""
+    batch = grown_batch(10000)
+    benchmark.pedantic(lambda b: b.thin(60.0),
+                       setup=lambda: ((copy_batch(batch),), {}), rounds=20)
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'numba'])
+def test_batch_growth_kernels(benchmark, backend):
+    """One growth cycle of a 10000-record StandBatch with each kernel backend."""
+    from fvs_python import kernels
+
+    if backend not in kernels.available_backends():
+        pytest.skip('numba is not installed')
+    previous = kernels.get_kernel_backend()
+    kernels.set_kernel_backend(backend)
+    try:
+        batch = make_batch(10000)
+        batch.grow(years=5)  # Compile the JIT kernels outside the timing
+        benchmark.pedantic(lambda b: b.grow(years=5),
+                           setup=lambda: ((make_batch(10000),), {}), rounds=20)
+    finally:
+        kernels.set_kernel_backend(previous)
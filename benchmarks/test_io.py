@@ -0,0 +1,54 @@
+"""
+Benchmarks for configuration loading, yield-table grids and exports.
+"""
+import pytest
+from fvs_python.config_loader import ConfigLoader
+from fvs_python.data_export import DataExporter
+from fvs_python.simulation_engine import SimulationEngine
+from benchmarks.utils import make_yield_table
+
+
+EXPORT_ROWS = 10000
+
+
+def test_config_loading(benchmark):
+    """Creating a configuration loader and loading one species."""
+    def load():
+        loader = ConfigLoader()
+        loader.load_species_config('LP')
+        loader._load_config_file(loader.cfg_dir / 'growth_model_parameters.yaml')
+
+    benchmark(load)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    with SimulationEngine(tmp_path) as engine:
+        yield engine
+
+
+def test_yield_table_grid(benchmark, engine):
+    """Small per-tree yield table grid (2 site indices x 2 densities, 10 years)."""
+    benchmark.pedantic(engine.simulate_yield_table, kwargs=dict(
+        species='LP', site_indices=[60, 70], planting_densities=[20, 40],
+        years=10, save_outputs=False
+    ), rounds=3)
+
+
+def test_yield_table_grid_batch(benchmark, engine):
+    """Batched yield table grid (4 species x 3 site indices x 3 densities, 50 years)."""
+    benchmark.pedantic(engine.simulate_yield_table, kwargs=dict(
+        species=['LP', 'SP', 'SA', 'LL'], site_indices=[60, 70, 80],
+        planting_densities=[300, 500, 700], years=50, save_outputs=False, batch=True
+    ), rounds=3)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'json', 'ndjson', 'excel', 'parquet'])
+def test_export(benchmark, tmp_path, fmt):
+    """Exporting a 10,000-row yield table."""
+    if fmt == 'parquet':
+        pytest.importorskip('pyarrow')
+    exporter = DataExporter(tmp_path)
+    table = make_yield_table(EXPORT_ROWS)
+    export = getattr(exporter, f'export_to_{fmt}')
+    benchmark.pedantic(export, args=(table, 'yield'), rounds=3)
@@ -0,0 +1,56 @@
+"""
+Shared setup for the benchmark suite.
+"""
+import copy
+import random
+
+import numpy as np
+import pandas as pd
+
+from fvs_python.stand import Stand
+from fvs_python.stand_batch import StandBatch
+
+
+def make_stand(n_trees: int, seed: int = 42) -> Stand:
+    """Create a planted loblolly pine stand of n_trees trees."""
+    random.seed(seed)
+    return Stand.initialize_planted(trees_per_acre=n_trees, site_index=70, species='LP')
+
+
+def make_batch(n_records: int, n_stands: int = 10, seed: int = 42) -> StandBatch:
+    """Create a batch of n_stands planted stands holding n_records records in total."""
+    scenarios = [
+        {'species': ('LP', 'SP', 'SA', 'LL')[i % 4], 'site_index': 60 + 5 * (i % 5),
+         'trees_per_acre': n_records // n_stands}
+        for i in range(n_stands)
+    ]
+    return StandBatch.initialize_planted(scenarios, seed=seed)
+
+
+def grown_batch(n_records: int) -> StandBatch:
+    """Create a batch grown for 15 years, past the small-tree stage."""
+    batch = make_batch(n_records)
+    batch.grow(years=15)
+    return batch
+
+
+def copy_batch(batch: StandBatch) -> StandBatch:
+    """Deep copy a batch so mutating benchmarks start from the same state."""
+    return copy.deepcopy(batch)
+
+
+def make_yield_table(n_rows: int) -> pd.DataFrame:
+    """Create a synthetic yield table with the standard result columns."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'age': np.tile(np.arange(0, 55, 5), n_rows // 11 + 1)[:n_rows],
+        'tpa': rng.uniform(100, 700, n_rows),
+        'mean_dbh': rng.uniform(0.5, 14, n_rows),
+        'mean_height': rng.uniform(1, 90, n_rows),
+        'basal_area': rng.uniform(0, 200, n_rows),
+        'volume': rng.uniform(0, 6000, n_rows),
+        'ccf': rng.uniform(0, 300, n_rows),
+        'species': np.resize(['LP', 'SP', 'SA', 'LL'], n_rows),
+        'site_index': np.resize([60.0, 70.0, 80.0], n_rows),
+        'initial_tpa': np.resize([300, 500, 700], n_rows),
+    })
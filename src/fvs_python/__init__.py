@@ -6,6 +6,7 @@ Forest Vegetation Simulator (FVS) Southern variant.
 """
 
 from .stand import Stand
+from .stand_batch import StandBatch
 from .tree import Tree
 from .config_loader import get_config_loader, load_stand_config, load_tree_config
 from .height_diameter import create_height_diameter_model, curtis_arney_height, wykoff_height
@@ -24,6 +25,7 @@ __author__ = "FVS-Python Development Team"
 
 __all__ = [
     "Stand",
+    "StandBatch",
     "Tree", 
     "get_config_loader",
     "load_stand_config",
@@ -0,0 +1,114 @@
+"""
+Background worker pipeline for output I/O.
+Runs exports and plot rendering off the simulation thread.
+"""
+import queue
+import threading
+from typing import Any, Callable, List
+
+from .logging_config import get_logger
+
+
+# Sentinel telling a worker thread to exit
+_STOP = object()
+
+
+class BackgroundWriter:
+    """Runs queued output tasks on background worker threads.
+
+    Tasks go into a bounded queue. When the queue is full, submit() blocks
+    until a worker takes a task, so a fast simulation cannot build up an
+    unbounded backlog of pending exports (backpressure).
+
+    Plots rendered by workers are drawn on Agg canvases without pyplot (see
+    growth_plots._new_figure), so they do not depend on the GUI backend.
+    """
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 8, name: str = 'fvs-io'):
+        """Start the worker threads.
+
+        Args:
+            max_workers: Number of worker threads
+            max_pending: Maximum number of queued tasks before submit() blocks
+            name: Prefix for worker thread names
+        """
+        self.logger = get_logger(__name__)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._errors: List[BaseException] = []
+        self._errors_lock = threading.Lock()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{name}-{i}", daemon=True)
+            for i in range(max(1, max_workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs):
+        """Queue a task, blocking while the queue is full.
+
+        Args:
+            func: Function to call on a worker thread
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        if self._closed:
+            raise RuntimeError("BackgroundWriter is closed")
+        self._queue.put((func, args, kwargs))
+
+    def _worker(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is _STOP:
+                    return
+                func, args, kwargs = task
+                func(*args, **kwargs)
+            except Exception as e:
+                self.logger.error(f"Background task {getattr(func, '__name__', func)} failed: {e}")
+                with self._errors_lock:
+                    self._errors.append(e)
+            finally:
+                self._queue.task_done()
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued tasks not yet started."""
+        return self._queue.qsize()
+
+    def flush(self) -> List[BaseException]:
+        """Wait until all queued tasks have finished.
+
+        Returns:
+            Exceptions raised by tasks since the last flush
+        """
+        self._queue.join()
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+        return errors
+
+    def close(self) -> List[BaseException]:
+        """Wait for pending tasks and stop the worker threads.
+
+        Returns:
+            Exceptions raised by tasks since the last flush
+        """
+        if self._closed:
+            return []
+        errors = self.flush()
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        return errors
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
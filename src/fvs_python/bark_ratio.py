@@ -5,7 +5,8 @@ diameter outside bark (DOB) and diameter inside bark (DIB).
 """
 import json
 import math
-from typing import Dict, Any, Optional
+import numpy as np
+from typing import Dict, Any, Optional, Sequence
 from pathlib import Path
 from .config_loader import get_config_loader
 
@@ -149,6 +150,32 @@ class BarkRatioModel:
         
         return max(0.0, bark_thickness)
     
+    def calculate_dib_from_dob_array(self, dob: np.ndarray) -> np.ndarray:
+        """Calculate diameters inside bark for an array of diameters outside bark.
+        
+        Vectorized equivalent of calculate_dib_from_dob.
+        
+        Args:
+            dob: Diameters outside bark (inches)
+            
+        Returns:
+            Diameters inside bark (inches)
+        """
+        return _dib_from_dob(np.asarray(dob, dtype=float), self.coefficients['b1'], self.coefficients['b2'])
+    
+    def calculate_dob_from_dib_array(self, dib: np.ndarray) -> np.ndarray:
+        """Calculate diameters outside bark for an array of diameters inside bark.
+        
+        Vectorized equivalent of calculate_dob_from_dib.
+        
+        Args:
+            dib: Diameters inside bark (inches)
+            
+        Returns:
+            Diameters outside bark (inches)
+        """
+        return _dob_from_dib(np.asarray(dib, dtype=float), self.coefficients['b1'], self.coefficients['b2'])
+    
     def get_species_coefficients(self) -> Dict[str, float]:
         """Get the bark ratio coefficients for this species.
         
@@ -193,6 +220,101 @@ class BarkRatioModel:
         return self.calculate_dob_from_dib(dbh_ib)
 
 
+def _dib_from_dob(dob: np.ndarray, b1, b2) -> np.ndarray:
+    """DIB = b1 + b2 * DOB, limited to [0, DOB]; zero where DOB <= 0."""
+    dib = np.maximum(0.0, np.minimum(b1 + b2 * dob, dob))
+    return np.where(dob > 0, dib, 0.0)
+
+
+def _dob_from_dib(dib: np.ndarray, b1, b2) -> np.ndarray:
+    """DOB = (DIB - b1) / b2, at least DIB; zero where DIB <= 0."""
+    b2 = np.asarray(b2, dtype=float)
+    # A zero slope leaves the diameter unchanged
+    safe_b2 = np.where(b2 != 0, b2, 1.0)
+    dob = np.where(b2 != 0, np.maximum(dib, (dib - b1) / safe_b2), dib)
+    return np.where(dib > 0, dob, 0.0)
+
+
+class SpeciesBarkRatios:
+    """Bark ratio coefficients of several species gathered into arrays.
+    
+    Converts whole tree arrays between outside and inside bark diameters,
+    looking up each tree's coefficients by species id (an index into
+    species_codes).
+    """
+    
+    def __init__(self, species_codes: Sequence[str]):
+        """Gather coefficients for each species.
+        
+        Args:
+            species_codes: Species code of each species id
+        """
+        self.species_codes = list(species_codes)
+        models = [get_bark_ratio_model(code) for code in self.species_codes]
+        self.b1 = np.array([model.coefficients['b1'] for model in models], dtype=float)
+        self.b2 = np.array([model.coefficients['b2'] for model in models], dtype=float)
+    
+    def dib_from_dob(self, dob: np.ndarray, species_id: np.ndarray) -> np.ndarray:
+        """Convert diameters outside bark to inside bark.
+        
+        Args:
+            dob: Diameters outside bark (inches)
+            species_id: Index into species_codes for each tree
+            
+        Returns:
+            Diameters inside bark (inches)
+        """
+        return _dib_from_dob(np.asarray(dob, dtype=float), self.b1[species_id], self.b2[species_id])
+    
+    def dob_from_dib(self, dib: np.ndarray, species_id: np.ndarray) -> np.ndarray:
+        """Convert diameters inside bark to outside bark.
+        
+        Args:
+            dib: Diameters inside bark (inches)
+            species_id: Index into species_codes for each tree
+            
+        Returns:
+            Diameters outside bark (inches)
+        """
+        return _dob_from_dib(np.asarray(dib, dtype=float), self.b1[species_id], self.b2[species_id])
+    
+    def bark_ratio(self, dob: np.ndarray, species_id: np.ndarray) -> np.ndarray:
+        """Calculate bark ratios (DIB/DOB), bounded to 0.80-0.99.
+        
+        Args:
+            dob: Diameters outside bark (inches)
+            species_id: Index into species_codes for each tree
+            
+        Returns:
+            Bark ratios; 1.0 where DOB <= 0
+        """
+        dob = np.asarray(dob, dtype=float)
+        dib = self.dib_from_dob(dob, species_id)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.clip(dib / dob, 0.80, 0.99)
+        return np.where(dob > 0, ratio, 1.0)
+
+
+# Shared models keyed by species code (see get_bark_ratio_model)
+_bark_ratio_models: Dict[str, BarkRatioModel] = {}
+
+
+def get_bark_ratio_model(species_code: str = "LP") -> BarkRatioModel:
+    """Get the shared bark ratio model for a species, loading it on first use.
+    
+    Args:
+        species_code: Species code (e.g., "LP", "SP", "SA", etc.)
+        
+    Returns:
+        BarkRatioModel instance shared by all callers
+    """
+    model = _bark_ratio_models.get(species_code)
+    if model is None:
+        model = BarkRatioModel(species_code)
+        _bark_ratio_models[species_code] = model
+    return model
+
+
 def create_bark_ratio_model(species_code: str = "LP") -> BarkRatioModel:
     """Factory function to create a bark ratio model for a species.
     
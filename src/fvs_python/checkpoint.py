@@ -0,0 +1,208 @@
+"""
+Checkpoint and resume support for batch simulations.
+Stores StandBatch state and completed results in a compact on-disk format.
+"""
+import json
+import os
+import hashlib
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Union
+
+from .stand_batch import StandBatch
+from .exceptions import InvalidDataError
+from .logging_config import get_logger
+
+
+# Record arrays saved from a StandBatch
+_STATE_ARRAYS = ('stand_index', 'species_id', 'dbh', 'height', 'crown_ratio', 'tree_age', 'tpa', 'age', 'site_index')
+
+
+def _json_default(obj):
+    """Convert numpy values in run metadata to Python values.
+
+    Raises:
+        TypeError: For any other type, so no value is silently stringified
+    """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def run_fingerprint(scenarios: List[Dict[str, Any]], years: int, time_step: int,
+                    seed: Optional[int], chunk_size: Optional[int],
+                    schedule: Optional[Dict[str, Any]] = None) -> str:
+    """Create a fingerprint of the run parameters.
+
+    A checkpoint can only be resumed by a run with the same fingerprint.
+
+    Args:
+        scenarios: Scenario dictionaries
+        years: Simulation length
+        time_step: Growth period length
+        seed: Random seed
+        chunk_size: Number of stands per chunk
+        schedule: Management schedule of the run
+
+    Returns:
+        Hex digest identifying the run
+    """
+    run = {
+        'scenarios': scenarios,
+        'years': years,
+        'time_step': time_step,
+        'seed': seed,
+        'chunk_size': chunk_size
+    }
+    if schedule is not None:
+        run['schedule'] = schedule
+    payload = json.dumps(run, sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CheckpointStore:
+    """Reads and writes checkpoints for the chunks of a batch run.
+
+    Each chunk is stored as two files in the checkpoint directory:
+
+    - ``chunk_NNNNN.npz``: tree arrays and the metrics of completed cycles
+    - ``chunk_NNNNN.json``: run fingerprint, progress and RNG state
+
+    Files are written to a temporary name and then renamed, so a crash while
+    writing leaves the previous checkpoint intact. The JSON file is written
+    last and is the marker that the checkpoint is usable.
+    """
+
+    def __init__(self, checkpoint_dir: Union[str, Path], fingerprint: str):
+        """Initialize the checkpoint store.
+
+        Args:
+            checkpoint_dir: Directory for checkpoint files
+            fingerprint: Fingerprint of the run (see run_fingerprint)
+        """
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.checkpoint_dir.mkdir(exist_ok=True, parents=True)
+        self.fingerprint = fingerprint
+        self.logger = get_logger(__name__)
+
+    def _paths(self, chunk: int):
+        base = self.checkpoint_dir / f"chunk_{chunk:05d}"
+        return base.with_suffix('.npz'), base.with_suffix('.json')
+
+    def save(self, chunk: int, batch: StandBatch, metrics: List[Dict[str, np.ndarray]],
+             complete: bool = False, cycles: Optional[int] = None):
+        """Save the state of a chunk.
+
+        Args:
+            chunk: Chunk number
+            batch: Batch being simulated
+            metrics: Stand metrics collected so far, one dictionary per
+                     reported cycle
+            complete: Whether the chunk has finished. Completed chunks only
+                      keep their metrics, not their tree arrays.
+            cycles: Number of cycles grown. Defaults to one per reported
+                    cycle after the initial state.
+        """
+        npz_path, json_path = self._paths(chunk)
+
+        arrays = {}
+        if not complete:
+            for name in _STATE_ARRAYS:
+                arrays['state_' + name] = getattr(batch, name)
+        for key in (metrics[0] if metrics else ()):
+            arrays['metric_' + key] = np.stack([m[key] for m in metrics])
+
+        tmp_npz = npz_path.with_suffix('.tmp.npz')
+        np.savez_compressed(tmp_npz, **arrays)
+        os.replace(tmp_npz, npz_path)
+
+        meta = {
+            'fingerprint': self.fingerprint,
+            'complete': complete,
+            'cycles': len(metrics) - 1 if cycles is None else cycles,
+            'species': batch.stand_species,
+            'stand_ids': batch.stand_ids,
+            'species_codes': batch.species_codes,
+            'mortality_model': batch.mortality_model,
+            'stochastic_mortality': batch.stochastic_mortality,
+            'rng_state': batch.rng.bit_generator.state
+        }
+        tmp_json = json_path.with_suffix('.tmp.json')
+        with open(tmp_json, 'w') as f:
+            json.dump(meta, f, default=_json_default)
+        os.replace(tmp_json, json_path)
+
+        self.logger.debug(f"Saved checkpoint for chunk {chunk} after {meta['cycles']} cycles")
+
+    def load(self, chunk: int) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint of a chunk.
+
+        Args:
+            chunk: Chunk number
+
+        Returns:
+            None if no checkpoint exists. Otherwise a dictionary with keys
+            'complete', 'cycles', 'metrics' (list of per-reported-cycle dictionaries)
+            and 'batch' (restored StandBatch, None for completed chunks).
+
+        Raises:
+            InvalidDataError: If the checkpoint belongs to a different run
+        """
+        npz_path, json_path = self._paths(chunk)
+        if not json_path.exists() or not npz_path.exists():
+            return None
+
+        with open(json_path) as f:
+            meta = json.load(f)
+        if meta.get('fingerprint') != self.fingerprint:
+            raise InvalidDataError(
+                f"checkpoint {json_path}",
+                "it was written by a run with different parameters"
+            )
+
+        with np.load(npz_path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+
+        metric_keys = [name[len('metric_'):] for name in arrays if name.startswith('metric_')]
+        n_reported = len(arrays['metric_' + metric_keys[0]]) if metric_keys else 0
+        metrics = [
+            {key: arrays['metric_' + key][i] for key in metric_keys}
+            for i in range(n_reported)
+        ]
+
+        batch = None
+        if not meta['complete']:
+            batch = StandBatch(
+                stand_index=arrays['state_stand_index'],
+                dbh=arrays['state_dbh'],
+                height=arrays['state_height'],
+                crown_ratio=arrays['state_crown_ratio'],
+                tree_age=arrays['state_tree_age'],
+                tpa=arrays['state_tpa'],
+                site_indices=arrays['state_site_index'],
+                species=meta['species'],
+                stand_ids=meta['stand_ids']
+            )
+            batch.age = arrays['state_age']
+            # Regeneration may have added species the stands were not created with
+            batch._add_species(meta.get('species_codes', []))
+            if 'state_species_id' in arrays:
+                batch.species_id = arrays['state_species_id']
+            batch.mortality_model = meta.get('mortality_model', batch.mortality_model)
+            batch.stochastic_mortality = meta.get('stochastic_mortality', batch.stochastic_mortality)
+            batch.rng.bit_generator.state = meta['rng_state']
+
+        self.logger.info(f"Loaded checkpoint for chunk {chunk} after {meta['cycles']} cycles")
+        return {
+            'complete': meta['complete'],
+            'cycles': meta['cycles'],
+            'metrics': metrics,
+            'batch': batch
+        }
+
+    def clear(self):
+        """Remove all chunk checkpoints from the checkpoint directory."""
+        for path in self.checkpoint_dir.glob('chunk_*'):
+            path.unlink()
@@ -11,6 +11,10 @@ from typing import Optional
 from .simulation_engine import SimulationEngine
 from .logging_config import setup_logging, get_logger
 from .config_loader import convert_yaml_to_toml, get_config_loader
+from .sinks import create_sink
+from .profiling import profile_call
+from .timing import PhaseTimer, enable_timing, timing_enabled
+from .kernels import set_kernel_backend
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -27,9 +31,15 @@ Examples:
   # Generate yield table
   fvs-python yield-table --species LP SP --site-indices 60 70 80 --densities 300 500 700
 
+  # Resume an interrupted, checkpointed yield table
+  fvs-python yield-table --checkpoint-dir checkpoints --resume
+
   # Compare scenarios
   fvs-python compare scenarios.json
 
+  # Profile a yield table, writing output/profile.txt and output/profile.collapsed
+  fvs-python profile yield-table --species LP --densities 300 500
+
   # List available species
   fvs-python list-species
 
@@ -52,6 +62,22 @@ Examples:
         action='store_true',
         help='Use structured JSON logging format'
     )
+    parser.add_argument(
+        '--async-logging',
+        action='store_true',
+        help='Format and write log records on a background thread'
+    )
+    parser.add_argument(
+        '--background-io',
+        action='store_true',
+        help='Write exports and plots on a background worker thread'
+    )
+    parser.add_argument(
+        '--kernels',
+        choices=['numpy', 'numba', 'auto'],
+        default=None,
+        help='Batch growth kernel backend (numba requires fvs-python[jit]; default: FVS_KERNELS or numpy)'
+    )
     parser.add_argument(
         '--version', '-v',
         action='version',
@@ -64,53 +90,7 @@ Examples:
         help="Run a single stand simulation",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
-    run_parser.add_argument(
-        "--years", 
-        type=int, 
-        default=50,
-        help="Total simulation length in years (default: 50)"
-    )
-    run_parser.add_argument(
-        "--timestep", 
-        type=int, 
-        default=5,
-        help="Years between measurements (default: 5)"
-    )
-    run_parser.add_argument(
-        "--species", 
-        type=str, 
-        default="LP",
-        choices=["LP", "SP", "SA", "LL"],
-        help="Species code (default: LP for Loblolly Pine)"
-    )
-    run_parser.add_argument(
-        "--site-index", 
-        type=float, 
-        default=70.0,
-        help="Site index (base age 25) in feet (default: 70)"
-    )
-    run_parser.add_argument(
-        "--trees-per-acre", "--tpa",
-        type=int, 
-        default=500,
-        help="Initial trees per acre (default: 500)"
-    )
-    run_parser.add_argument(
-        "--output-dir", 
-        type=Path, 
-        default=None,
-        help="Output directory for results (default: ./output)"
-    )
-    run_parser.add_argument(
-        "--no-plots",
-        action='store_true',
-        help="Skip generating plots"
-    )
-    run_parser.add_argument(
-        "--no-save",
-        action='store_true',
-        help="Skip saving output files"
-    )
+    _add_simulate_arguments(run_parser)
     
     # Yield table command
     yield_parser = subparsers.add_parser(
@@ -118,38 +98,60 @@ Examples:
         help="Generate yield tables for multiple scenarios",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
-    yield_parser.add_argument(
-        "--species",
-        nargs='+',
-        default=['LP'],
-        help="Species codes to include"
+    _add_yield_table_arguments(yield_parser)
+    
+    # Profile command: runs simulate or yield-table under a profiler
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="Profile a simulate or yield-table run",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
-    yield_parser.add_argument(
-        "--site-indices",
-        nargs='+',
+    profile_parser.add_argument(
+        "--profiler",
+        choices=['deterministic', 'sampling'],
+        default='deterministic',
+        help="cProfile (every call) or a low-overhead stack sampler"
+    )
+    profile_parser.add_argument(
+        "--interval",
         type=float,
-        default=[60, 70, 80],
-        help="Site indices to test"
+        default=5.0,
+        help="Milliseconds between samples for the sampling profiler"
     )
-    yield_parser.add_argument(
-        "--densities",
-        nargs='+',
-        type=int,
-        default=[300, 500, 700],
-        help="Planting densities to test (trees per acre)"
+    profile_parser.add_argument(
+        "--sort",
+        choices=['cumulative', 'tottime', 'calls'],
+        default='cumulative',
+        help="Sort order of the deterministic profiler's summary"
     )
-    yield_parser.add_argument(
-        "--years", "-y",
-        type=int, 
-        default=50,
-        help="Simulation length in years"
+    profile_parser.add_argument(
+        "--limit",
+        type=int,
+        default=40,
+        help="Number of functions listed in the text summary"
     )
-    yield_parser.add_argument(
-        "--output-dir", 
-        type=Path, 
+    profile_parser.add_argument(
+        "--profile-output",
+        type=Path,
         default=None,
-        help="Output directory for results"
+        help="Path prefix of the profile files (default: <output-dir>/profile)"
     )
+    profile_targets = profile_parser.add_subparsers(dest="target", required=True)
+    profile_run_parser = profile_targets.add_parser(
+        "simulate",
+        aliases=["run"],
+        help="Profile a single stand simulation",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    _add_simulate_arguments(profile_run_parser)
+    profile_run_parser.set_defaults(profile_command=cmd_simulate)
+    profile_yield_parser = profile_targets.add_parser(
+        "yield-table",
+        help="Profile yield table generation",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    _add_yield_table_arguments(profile_yield_parser)
+    profile_yield_parser.set_defaults(profile_command=cmd_yield_table)
     
     # List species command
     list_parser = subparsers.add_parser(
@@ -215,6 +217,132 @@ Examples:
     return parser
 
 
+def _add_simulate_arguments(parser: argparse.ArgumentParser):
+    """Add the arguments of the simulate command to a parser."""
+    parser.add_argument(
+        "--years", 
+        type=int, 
+        default=50,
+        help="Total simulation length in years (default: 50)"
+    )
+    parser.add_argument(
+        "--timestep", 
+        type=int, 
+        default=5,
+        help="Years between measurements (default: 5)"
+    )
+    parser.add_argument(
+        "--species", 
+        type=str, 
+        default="LP",
+        choices=["LP", "SP", "SA", "LL"],
+        help="Species code (default: LP for Loblolly Pine)"
+    )
+    parser.add_argument(
+        "--site-index", 
+        type=float, 
+        default=70.0,
+        help="Site index (base age 25) in feet (default: 70)"
+    )
+    parser.add_argument(
+        "--trees-per-acre", "--tpa",
+        type=int, 
+        default=500,
+        help="Initial trees per acre (default: 500)"
+    )
+    parser.add_argument(
+        "--output-dir", 
+        type=Path, 
+        default=None,
+        help="Output directory for results (default: ./output)"
+    )
+    parser.add_argument(
+        "--no-plots",
+        action='store_true',
+        help="Skip generating plots"
+    )
+    parser.add_argument(
+        "--no-save",
+        action='store_true',
+        help="Skip saving output files"
+    )
+    parser.add_argument(
+        "--tree-list",
+        action='store_true',
+        help="Record each cycle's trees to a tree-list file"
+    )
+
+
+def _add_yield_table_arguments(parser: argparse.ArgumentParser):
+    """Add the arguments of the yield-table command to a parser."""
+    parser.add_argument(
+        "--species",
+        nargs='+',
+        default=['LP'],
+        help="Species codes to include"
+    )
+    parser.add_argument(
+        "--site-indices",
+        nargs='+',
+        type=float,
+        default=[60, 70, 80],
+        help="Site indices to test"
+    )
+    parser.add_argument(
+        "--densities",
+        nargs='+',
+        type=int,
+        default=[300, 500, 700],
+        help="Planting densities to test (trees per acre)"
+    )
+    parser.add_argument(
+        "--years", "-y",
+        type=int, 
+        default=50,
+        help="Simulation length in years"
+    )
+    parser.add_argument(
+        "--output-dir", 
+        type=Path, 
+        default=None,
+        help="Output directory for results"
+    )
+    parser.add_argument(
+        "--stream",
+        type=Path,
+        default=None,
+        help="Stream rows to a .csv, .ndjson, .parquet or .sqlite file as they are produced"
+    )
+    parser.add_argument(
+        "--batch",
+        action='store_true',
+        help="Grow all scenarios together in one vectorized batch"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Number of scenarios grown together in batch mode"
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=Path,
+        default=None,
+        help="Directory for checkpoints (implies --batch)"
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=1,
+        help="Number of growth cycles between checkpoints"
+    )
+    parser.add_argument(
+        "--resume",
+        action='store_true',
+        help="Resume from existing checkpoints, skipping finished stands and cycles"
+    )
+
+
 def cmd_simulate(args) -> int:
     """Run a single stand simulation."""
     logger = get_logger(__name__)
@@ -223,17 +351,18 @@ def cmd_simulate(args) -> int:
         output_dir = args.output_dir or Path('./output')
         output_dir.mkdir(exist_ok=True, parents=True)
         
-        engine = SimulationEngine(output_dir)
-        
-        results = engine.simulate_stand(
-            species=args.species,
-            trees_per_acre=args.trees_per_acre,
-            site_index=args.site_index,
-            years=args.years,
-            time_step=args.timestep,
-            save_outputs=not args.no_save,
-            plot_results=not args.no_plots
-        )
+        # Closing the engine waits for background exports and plots
+        with SimulationEngine(output_dir, background_io=args.background_io) as engine:
+            results = engine.simulate_stand(
+                species=args.species,
+                trees_per_acre=args.trees_per_acre,
+                site_index=args.site_index,
+                years=args.years,
+                time_step=args.timestep,
+                save_outputs=not args.no_save,
+                plot_results=not args.no_plots,
+                tree_list=args.tree_list
+            )
         
         logger.info("Simulation completed. Final metrics:")
         final_row = results.iloc[-1]
@@ -258,14 +387,31 @@ def cmd_yield_table(args) -> int:
         output_dir = args.output_dir or Path('./output')
         output_dir.mkdir(exist_ok=True, parents=True)
         
-        engine = SimulationEngine(output_dir)
-        
-        yield_table = engine.simulate_yield_table(
-            species=args.species,
-            site_indices=args.site_indices,
-            planting_densities=args.densities,
-            years=args.years
-        )
+        with SimulationEngine(output_dir, background_io=args.background_io) as engine:
+            if args.stream is not None:
+                with create_sink(args.stream) as sink:
+                    sink.write_many(engine.iter_yield_table(
+                        species=args.species,
+                        site_indices=args.site_indices,
+                        planting_densities=args.densities,
+                        years=args.years,
+                        batch=args.batch,
+                        chunk_size=args.chunk_size or 1000
+                    ))
+                logger.info(f"Streamed {sink.rows_written} yield table rows to {args.stream}")
+                return 0
+            
+            yield_table = engine.simulate_yield_table(
+                species=args.species,
+                site_indices=args.site_indices,
+                planting_densities=args.densities,
+                years=args.years,
+                batch=args.batch,
+                chunk_size=args.chunk_size,
+                checkpoint_dir=args.checkpoint_dir,
+                checkpoint_interval=args.checkpoint_interval,
+                resume=args.resume
+            )
         
         logger.info(f"Yield table generated with {len(yield_table)} rows")
         logger.info(f"Species: {', '.join(args.species)}")
@@ -279,6 +425,48 @@ def cmd_yield_table(args) -> int:
         return 1
 
 
+def cmd_profile(args) -> int:
+    """Run simulate or yield-table under a profiler and report where time went."""
+    logger = get_logger(__name__)
+    
+    output_dir = args.output_dir or Path('./output')
+    prefix = args.profile_output or output_dir / 'profile'
+    
+    # Phases from every engine the command creates are gathered in one timer
+    was_enabled = timing_enabled()
+    enable_timing(True)
+    timer = PhaseTimer()
+    
+    def run_command():
+        with timer.activate():
+            return args.profile_command(args)
+    
+    try:
+        status, files = profile_call(
+            run_command,
+            prefix,
+            profiler=args.profiler,
+            interval=args.interval / 1000.0,
+            sort=args.sort,
+            limit=args.limit
+        )
+    except Exception as e:
+        logger.error(f"Profiling failed: {e}")
+        return 1
+    finally:
+        enable_timing(was_enabled)
+    
+    print("Per-phase timing:")
+    print(timer.format_report())
+    print()
+    print(f"Profile summary: {files['summary']}")
+    print(f"Collapsed stacks (flame graph input): {files['collapsed']}")
+    if 'stats' in files:
+        print(f"Raw statistics: {files['stats']}")
+    
+    return status
+
+
 def cmd_list_species(args) -> int:
     """List available species."""
     logger = get_logger(__name__)
@@ -399,14 +587,24 @@ def main() -> int:
     setup_logging(
         log_level=args.log_level,
         log_file=output_dir / 'fvs-python.log',
-        structured=args.structured_logs
+        structured=args.structured_logs,
+        async_logging=args.async_logging
     )
     
+    if args.kernels is not None:
+        try:
+            set_kernel_backend(args.kernels)
+        except ImportError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    
     # Route to appropriate command handler
     if args.command == "simulate":
         return cmd_simulate(args)
     elif args.command == "yield-table":
         return cmd_yield_table(args)
+    elif args.command == "profile":
+        return cmd_profile(args)
     elif args.command == "list-species":
         return cmd_list_species(args)
     elif args.command == "convert-config":
@@ -4,9 +4,11 @@ Implements CCF equations from the FVS Southern variant for individual tree and s
 """
 import json
 import math
-from typing import Dict, Any, Optional, List, Tuple
+import numpy as np
+from typing import Dict, Any, Optional, List, Sequence, Tuple
 from pathlib import Path
 from .config_loader import get_config_loader
+from .crown_width import CrownWidthModel, create_crown_width_model
 
 
 class CrownCompetitionFactorModel:
@@ -14,6 +16,7 @@ class CrownCompetitionFactorModel:
     
     def __init__(self):
         """Initialize the CCF model with parameters from configuration."""
+        self._crown_width_models: Dict[str, CrownWidthModel] = {}
         self._load_parameters()
     
     def _load_parameters(self):
@@ -53,6 +56,14 @@ class CrownCompetitionFactorModel:
             }
         }
     
+    def _crown_width_model(self, species_code: str) -> CrownWidthModel:
+        """Get the crown width model of a species, loading it on first use."""
+        model = self._crown_width_models.get(species_code)
+        if model is None:
+            model = create_crown_width_model(species_code)
+            self._crown_width_models[species_code] = model
+        return model
+    
     def calculate_individual_ccf(self, dbh: float, open_crown_width: Optional[float] = None, 
                                species_code: str = "LP") -> float:
         """Calculate Crown Competition Factor for an individual tree.
@@ -77,8 +88,7 @@ class CrownCompetitionFactorModel:
         
         # Calculate or use provided open crown width
         if open_crown_width is None:
-            from .crown_width import calculate_open_crown_width
-            open_crown_width = calculate_open_crown_width(species_code, dbh)
+            open_crown_width = self._crown_width_model(species_code).calculate_open_grown_crown_width(dbh)
         
         # Apply equation 4.5.1
         ccf_individual = self.coefficient * (open_crown_width ** 2)
@@ -117,6 +127,53 @@ class CrownCompetitionFactorModel:
         
         return stand_ccf
     
+    def calculate_tree_ccf_array(self, dbh: np.ndarray, species_id: np.ndarray,
+                                 species_codes: Sequence[str]) -> np.ndarray:
+        """Calculate individual tree CCF (equation 4.5.1) for arrays of trees.
+        
+        Open-grown crown widths come from each species' OCW equation,
+        evaluated once per species over all of its trees.
+        
+        Args:
+            dbh: Diameters at breast height (inches)
+            species_id: Index into species_codes for each tree
+            species_codes: Species code of each species id
+            
+        Returns:
+            Individual tree CCF values
+        """
+        dbh = np.asarray(dbh, dtype=float)
+        species_id = np.asarray(species_id)
+        ocw = np.zeros_like(dbh)
+        for sid in np.unique(species_id):
+            mask = species_id == sid
+            model = self._crown_width_model(species_codes[sid])
+            ocw[mask] = model.calculate_open_grown_crown_width_array(dbh[mask])
+        
+        tree_ccf = np.where(dbh <= self.dbh_threshold, self.small_tree_ccf, self.coefficient * ocw**2)
+        return np.where(dbh > 0, tree_ccf, 0.0)
+    
+    def calculate_stand_ccf_array(self, dbh: np.ndarray, species_id: np.ndarray,
+                                  expansion_factor: Optional[np.ndarray] = None,
+                                  species_codes: Sequence[str] = ("LP",)) -> Tuple[float, np.ndarray]:
+        """Calculate stand CCF from arrays of tree attributes.
+        
+        Vectorized equivalent of calculate_stand_ccf.
+        
+        Args:
+            dbh: Diameters at breast height (inches)
+            species_id: Index into species_codes for each tree
+            expansion_factor: Trees per acre represented by each tree (default 1)
+            species_codes: Species code of each species id
+            
+        Returns:
+            Tuple of (stand CCF, individual tree CCF array)
+        """
+        tree_ccf = self.calculate_tree_ccf_array(dbh, species_id, species_codes)
+        if expansion_factor is None:
+            return float(tree_ccf.sum()), tree_ccf
+        return float(np.dot(tree_ccf, expansion_factor)), tree_ccf
+    
     def calculate_ccf_from_stand_object(self, stand) -> float:
         """Calculate stand CCF from a Stand object.
         
@@ -233,8 +290,7 @@ class CrownCompetitionFactorModel:
         if mean_dbh <= self.dbh_threshold:
             individual_ccf = self.small_tree_ccf
         else:
-            from .crown_width import calculate_open_crown_width
-            ocw = calculate_open_crown_width(species_code, mean_dbh)
+            ocw = self._crown_width_model(species_code).calculate_open_grown_crown_width(mean_dbh)
             individual_ccf = self.coefficient * (ocw ** 2)
         
         if individual_ccf <= 0:
@@ -258,6 +314,18 @@ class CrownCompetitionFactorModel:
         }
 
 
+# Shared model used by Stand and StandBatch
+_ccf_model = None
+
+
+def get_ccf_model() -> CrownCompetitionFactorModel:
+    """Get the shared CCF model instance."""
+    global _ccf_model
+    if _ccf_model is None:
+        _ccf_model = CrownCompetitionFactorModel()
+    return _ccf_model
+
+
 def create_ccf_model() -> CrownCompetitionFactorModel:
     """Factory function to create a CCF model.
     
@@ -5,6 +5,7 @@ Implements Weibull-based crown model and other crown ratio equations from the SN
 import math
 import json
 import random
+import numpy as np
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 from scipy.stats import weibull_min
@@ -255,6 +256,27 @@ class CrownRatioModel:
         # Bound to specified range
         return max(0.2, min(0.9, crown_ratio))
     
+    def predict_regeneration_crown_ratio_array(self, pccf, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Predict crown ratios for arrays of newly established trees.
+        
+        Array version of predict_regeneration_crown_ratio, drawing the random
+        component for all trees at once.
+        
+        Args:
+            pccf: Crown competition factor where each tree is established
+            rng: Random number generator (default: a new unseeded generator)
+            
+        Returns:
+            Array of crown ratios as proportions (0.2-0.9)
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+        pccf = np.asarray(pccf, dtype=float)
+        
+        # Equation 4.3.3.1: CR = 0.89722 - 0.0000461 * PCCF + RAN
+        crown_ratio = 0.89722 - 0.0000461 * pccf + rng.normal(0.0, 0.05, pccf.shape)
+        return np.clip(crown_ratio, 0.2, 0.9)
+    
     def update_crown_ratio_change(self, current_cr: float, predicted_cr: float, 
                                 height_growth: float, cycle_length: int = 5) -> float:
         """Calculate crown ratio change with bounds checking.
@@ -4,11 +4,37 @@ Implements forest-grown and open-grown crown width equations from the FVS Southe
 """
 import json
 import math
+import numpy as np
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 from .config_loader import get_config_loader
 
 
+# OCW equation number prefixes using the linear form (equation 4.4.4)
+_LINEAR_OCW_TYPES = ('012', '068', '094', '132', '110', '131', '221')
+
+
+def _parse_bounds(bounds: str, variable: str) -> Tuple[float, float]:
+    """Parse a coefficient table bounds entry such as 'FCW < 55' or 'DBH < 30'.
+    
+    Args:
+        bounds: Bounds string from the coefficient table
+        variable: Name of the bounded crown width ('FCW' or 'OCW')
+        
+    Returns:
+        Tuple of (maximum crown width, maximum DBH); infinite when not bounded
+    """
+    max_width = max_dbh = math.inf
+    try:
+        if f'{variable} <' in bounds:
+            max_width = float(bounds.split(f'{variable} <')[1].strip())
+        elif 'DBH <' in bounds:
+            max_dbh = float(bounds.split('DBH <')[1].strip())
+    except (ValueError, IndexError):
+        pass
+    return max_width, max_dbh
+
+
 class CrownWidthModel:
     """Crown width model implementing FVS Southern variant equations."""
     
@@ -46,6 +72,8 @@ class CrownWidthModel:
         else:
             # Fallback parameters if file not found
             self._load_fallback_parameters()
+        
+        self._compile_equations()
     
     def _load_fallback_parameters(self):
         """Load fallback parameters if crown width file not available."""
@@ -81,6 +109,64 @@ class CrownWidthModel:
             }
         }
     
+    def _compile_equations(self):
+        """Resolve equation forms, coefficients and bounds once per species.
+        
+        Missing coefficients become 0.0 and the bounds strings are parsed
+        here, so evaluating crown width does no dictionary lookups or
+        string parsing.
+        """
+        fg = self.forest_grown
+        a3 = fg.get('a3')
+        if fg.get('a4') is not None or fg.get('a5') is not None:
+            # Equation 4.4.1 (Bechtold): crown ratio and/or Hopkins index terms
+            self._fcw_form = 'bechtold'
+        elif a3 is not None:
+            # Equation 4.4.2 (Bragg): FCW = a1 + (a2 * DBH^a3)
+            self._fcw_form = 'bragg'
+        else:
+            self._fcw_form = 'linear'
+        self._fcw_coefficients = tuple(
+            float(fg.get(key) or 0.0) for key in ('a1', 'a2', 'a3', 'a4', 'a5')
+        )
+        self._fcw_max, self._fcw_max_dbh = _parse_bounds(fg.get('bounds', ''), 'FCW')
+        
+        og = self.open_grown
+        equation_num = og.get('equation_number', '13105')
+        a3 = og.get('a3')
+        if equation_num.endswith('61') and a3 is not None:
+            # Equation 4.4.5 (Smith et al. 1992), metric units
+            self._ocw_form = 'smith'
+        elif equation_num[:3] in _LINEAR_OCW_TYPES or equation_num.endswith('01'):
+            # Equation 4.4.4: OCW = a1 + (a2 * DBH)
+            self._ocw_form = 'linear'
+        elif a3 is not None:
+            # Equation 4.4.3: OCW = a1 + (a2 * DBH^a3)
+            self._ocw_form = 'power'
+        else:
+            self._ocw_form = 'linear'
+        self._ocw_coefficients = tuple(float(og.get(key) or 0.0) for key in ('a1', 'a2', 'a3'))
+        self._ocw_max, self._ocw_max_dbh = _parse_bounds(og.get('bounds', ''), 'OCW')
+    
+    def _fcw_equation(self, dbh, crown_ratio, hopkins_index):
+        """Evaluate the species' FCW equation (scalars or arrays), without bounds."""
+        a1, a2, a3, a4, a5 = self._fcw_coefficients
+        if self._fcw_form == 'bechtold':
+            return a1 + (a2 * dbh) + (a3 * dbh**2) + (a4 * crown_ratio) + (a5 * hopkins_index)
+        if self._fcw_form == 'bragg':
+            return a1 + (a2 * dbh**a3)
+        return a1 + (a2 * dbh)
+    
+    def _ocw_equation(self, dbh):
+        """Evaluate the species' OCW equation (scalars or arrays), without bounds."""
+        a1, a2, a3 = self._ocw_coefficients
+        if self._ocw_form == 'smith':
+            dbh_cm = dbh * 2.54
+            return (a1 + (a2 * dbh_cm) + (a3 * dbh_cm**2)) * 3.28084
+        if self._ocw_form == 'power':
+            return a1 + (a2 * dbh**a3)
+        return a1 + (a2 * dbh)
+    
     def calculate_hopkins_index(self, elevation: float, latitude: float, longitude: float) -> float:
         """Calculate Hopkins Index for geographic adjustment.
         
@@ -112,77 +198,38 @@ class CrownWidthModel:
         if dbh <= 0:
             return 0.0
         
-        coeffs = self.forest_grown
-        equation_num = coeffs.get('equation_number', '13101')
-        
-        # Get equation type from first 3 digits
-        eq_type = equation_num[:3]
-        
-        # Extract coefficients
-        a1 = coeffs.get('a1', 0.0)
-        a2 = coeffs.get('a2', 0.0)
-        a3 = coeffs.get('a3')
-        a4 = coeffs.get('a4')
-        a5 = coeffs.get('a5')
-        
-        # Determine equation type and calculate FCW
-        # Use Bechtold equation (4.4.1) if species has a4 or a5 coefficients (crown ratio or Hopkins index terms)
-        # Use Bragg equation (4.4.2) if species only has a1, a2, a3 coefficients
-        if (a4 is not None or a5 is not None):
-            # Equation 4.4.1: FCW = a1 + (a2 * DBH) + (a3 * DBH^2) + (a4 * CR) + (a5 * HI)
-            fcw = a1 + (a2 * dbh)
-            
-            if a3 is not None:
-                fcw += a3 * dbh**2
-            if a4 is not None:
-                fcw += a4 * crown_ratio
-            if a5 is not None:
-                fcw += a5 * hopkins_index
-        else:
-            # Equation 4.4.2: FCW = a1 + (a2 * DBH^a3)
-            if a3 is not None:
-                fcw = a1 + (a2 * dbh**a3)
-            else:
-                fcw = a1 + (a2 * dbh)
-        
-        # Apply scaling for small trees (DBH < 5.0)
         if dbh < 5.0:
-            fcw_at_5 = self.calculate_forest_grown_crown_width(5.0, crown_ratio, hopkins_index)
-            fcw = fcw_at_5 * (dbh / 5.0)
-        
-        # Apply bounds if specified
-        bounds = coeffs.get('bounds', '')
-        if 'FCW <' in bounds:
-            try:
-                max_fcw = float(bounds.split('FCW <')[1].strip())
-                fcw = min(fcw, max_fcw)
-            except (ValueError, IndexError):
-                pass
-        elif 'DBH <' in bounds:
-            try:
-                max_dbh = float(bounds.split('DBH <')[1].strip())
-                if dbh >= max_dbh:
-                    # Use the equation at the maximum allowed DBH
-                    bounded_dbh = max_dbh - 0.1
-                    # Recalculate with bounded DBH to avoid infinite recursion
-                    if (a4 is not None or a5 is not None):
-                        fcw = a1 + (a2 * bounded_dbh)
-                        if a3 is not None:
-                            fcw += a3 * bounded_dbh**2
-                        if a4 is not None:
-                            fcw += a4 * crown_ratio
-                        if a5 is not None:
-                            fcw += a5 * hopkins_index
-                    else:
-                        if a3 is not None:
-                            fcw = a1 + (a2 * bounded_dbh**a3)
-                        else:
-                            fcw = a1 + (a2 * bounded_dbh)
-            except (ValueError, IndexError):
-                pass
-        
+            # Small trees are scaled from the bounded width at 5 inches
+            fcw_at_5 = min(self._fcw_equation(5.0, crown_ratio, hopkins_index), self._fcw_max)
+            return max(0.0, fcw_at_5) * (dbh / 5.0)
+        
+        # Trees at or above a DBH bound use the equation just below it
+        if dbh >= self._fcw_max_dbh:
+            dbh = self._fcw_max_dbh - 0.1
+        fcw = min(self._fcw_equation(dbh, crown_ratio, hopkins_index), self._fcw_max)
         return max(0.0, fcw)
     
+    def calculate_forest_grown_crown_width_array(self, dbh: np.ndarray, crown_ratio=50.0,
+                                                 hopkins_index=0.0) -> np.ndarray:
+        """Calculate forest-grown crown width (FCW) for arrays of trees.
+        
+        Vectorized equivalent of calculate_forest_grown_crown_width.
+        
+        Args:
+            dbh: Diameters at breast height (inches)
+            crown_ratio: Crown ratios (percent, 0-100), scalar or array
+            hopkins_index: Hopkins Index, scalar or array
+            
+        Returns:
+            Forest-grown crown widths (feet)
+        """
+        dbh = np.asarray(dbh, dtype=float)
+        small = dbh < 5.0
+        d = np.where(small, 5.0, np.where(dbh >= self._fcw_max_dbh, self._fcw_max_dbh - 0.1, dbh))
+        fcw = np.minimum(self._fcw_equation(d, crown_ratio, hopkins_index), self._fcw_max)
+        fcw = np.where(small, np.maximum(0.0, fcw) * (dbh / 5.0), fcw)
+        return np.where(dbh > 0, np.maximum(0.0, fcw), 0.0)
+    
     def calculate_open_grown_crown_width(self, dbh: float) -> float:
         """Calculate open-grown crown width (OCW).
         
@@ -195,75 +242,35 @@ class CrownWidthModel:
         if dbh <= 0:
             return 0.0
         
-        coeffs = self.open_grown
-        equation_num = coeffs.get('equation_number', '13105')
-        
-        # Get equation type from first 3 digits
-        eq_type = equation_num[:3]
-        
-        # Extract coefficients
-        a1 = coeffs.get('a1', 0.0)
-        a2 = coeffs.get('a2', 0.0)
-        a3 = coeffs.get('a3')
-        a4 = coeffs.get('a4')
-        a5 = coeffs.get('a5')
-        
-        # Determine equation type and calculate OCW
-        # Check if it's equation 4.4.5 (Smith et al. 1992) - has specific equation numbers ending in 61
-        if equation_num.endswith('61') and a3 is not None:
-            # Equation 4.4.5: OCW = a1 + (a2 * DBH * 2.54) + (a3 * (DBH * 2.54)^2) * 3.28084
-            dbh_cm = dbh * 2.54  # Convert to cm
-            ocw = a1 + (a2 * dbh_cm)
-            if a3 is not None:
-                ocw += a3 * dbh_cm**2
-            ocw *= 3.28084  # Convert to feet
-        elif eq_type in ['012', '068', '094', '132', '110', '131', '221'] or equation_num.endswith('01'):
-            # Equation 4.4.4: OCW = a1 + (a2 * DBH)
-            ocw = a1 + (a2 * dbh)
-        elif a3 is not None:
-            # Equation 4.4.3: OCW = a1 + (a2 * DBH^a3)
-            ocw = a1 + (a2 * dbh**a3)
-        else:
-            # Default linear equation: OCW = a1 + (a2 * DBH)
-            ocw = a1 + (a2 * dbh)
-        
-        # Apply scaling for small trees (DBH < 3.0)
         if dbh < 3.0:
-            ocw_at_3 = self.calculate_open_grown_crown_width(3.0)
-            ocw = ocw_at_3 * (dbh / 3.0)
-        
-        # Apply bounds if specified
-        bounds = coeffs.get('bounds', '')
-        if 'OCW <' in bounds:
-            try:
-                max_ocw = float(bounds.split('OCW <')[1].strip())
-                ocw = min(ocw, max_ocw)
-            except (ValueError, IndexError):
-                pass
-        elif 'DBH <' in bounds:
-            try:
-                max_dbh = float(bounds.split('DBH <')[1].strip())
-                if dbh >= max_dbh:
-                    # Use the equation at the maximum allowed DBH
-                    bounded_dbh = max_dbh - 0.1
-                    # Recalculate with bounded DBH to avoid infinite recursion
-                    if equation_num.endswith('61') and a3 is not None:
-                        dbh_cm = bounded_dbh * 2.54
-                        ocw = a1 + (a2 * dbh_cm)
-                        if a3 is not None:
-                            ocw += a3 * dbh_cm**2
-                        ocw *= 3.28084
-                    elif eq_type in ['012', '068', '094', '132', '110', '131', '221'] or equation_num.endswith('01'):
-                        ocw = a1 + (a2 * bounded_dbh)
-                    elif a3 is not None:
-                        ocw = a1 + (a2 * bounded_dbh**a3)
-                    else:
-                        ocw = a1 + (a2 * bounded_dbh)
-            except (ValueError, IndexError):
-                pass
-        
+            # Small trees are scaled from the bounded width at 3 inches
+            ocw_at_3 = min(self._ocw_equation(3.0), self._ocw_max)
+            return max(0.0, ocw_at_3) * (dbh / 3.0)
+        
+        # Trees at or above a DBH bound use the equation just below it
+        if dbh >= self._ocw_max_dbh:
+            dbh = self._ocw_max_dbh - 0.1
+        ocw = min(self._ocw_equation(dbh), self._ocw_max)
         return max(0.0, ocw)
     
+    def calculate_open_grown_crown_width_array(self, dbh: np.ndarray) -> np.ndarray:
+        """Calculate open-grown crown width (OCW) for an array of diameters.
+        
+        Vectorized equivalent of calculate_open_grown_crown_width.
+        
+        Args:
+            dbh: Diameters at breast height (inches)
+            
+        Returns:
+            Open-grown crown widths (feet)
+        """
+        dbh = np.asarray(dbh, dtype=float)
+        small = dbh < 3.0
+        d = np.where(small, 3.0, np.where(dbh >= self._ocw_max_dbh, self._ocw_max_dbh - 0.1, dbh))
+        ocw = np.minimum(self._ocw_equation(d), self._ocw_max)
+        ocw = np.where(small, np.maximum(0.0, ocw) * (dbh / 3.0), ocw)
+        return np.where(dbh > 0, np.maximum(0.0, ocw), 0.0)
+    
     def calculate_ccf_contribution(self, dbh: float) -> float:
         """Calculate Crown Competition Factor contribution for a single tree.
         
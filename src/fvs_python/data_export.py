@@ -4,14 +4,405 @@ Provides various formats for exporting simulation results.
 """
 import json
 import csv
+import math
+import shutil
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterable, Optional, Union
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 from .logging_config import get_logger
+from .timing import timed
+
+# Fast JSON encoder (optional)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Arrow types for known result columns; other columns keep their inferred type
+ARROW_COLUMN_TYPES = {
+    'age': 'int32',
+    'tpa': 'float64',
+    'mean_dbh': 'float64',
+    'mean_height': 'float64',
+    'basal_area': 'float64',
+    'volume': 'float64',
+    'ccf': 'float64',
+    'species': 'string',
+    'site_index': 'float64',
+    'initial_tpa': 'int32',
+    'scenario': 'string',
+}
+
+
+def _import_pyarrow():
+    """Import pyarrow and pyarrow.parquet, raising a helpful error if missing."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Arrow output require pyarrow. Install it with "
+            "'pip install fvs-python[parquet]'."
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def to_arrow_table(data: Union[pd.DataFrame, List[Dict]], schema=None):
+    """Convert results to an Arrow table with a typed schema.
+
+    Args:
+        data: DataFrame or list of row dictionaries
+        schema: Schema to cast to. If None, known columns get the types in
+                ARROW_COLUMN_TYPES and other columns keep their inferred type.
+
+    Returns:
+        pyarrow.Table
+    """
+    pa, _ = _import_pyarrow()
+    if isinstance(data, pd.DataFrame):
+        table = pa.Table.from_pandas(data, preserve_index=False)
+    else:
+        table = pa.Table.from_pylist(data)
+
+    if schema is None:
+        fields = [
+            pa.field(field.name, getattr(pa, ARROW_COLUMN_TYPES[field.name])())
+            if field.name in ARROW_COLUMN_TYPES else field
+            for field in table.schema
+        ]
+        schema = pa.schema(fields)
+    return table.select(schema.names).cast(schema)
+
+
+def _is_parquet_dataset(path: Path) -> bool:
+    """Check whether a directory holds only a partitioned Parquet dataset.
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if every entry below path is a 'column=value' partition
+        directory or a .parquet file
+    """
+    for entry in path.rglob('*'):
+        if entry.is_dir():
+            if '=' not in entry.name:
+                return False
+        elif entry.suffix != '.parquet':
+            return False
+    return True
+
+
+def _finite_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace NaN and infinite floats with None, as orjson writes them."""
+    return {key: None if isinstance(value, float) and not math.isfinite(value) else value
+            for key, value in row.items()}
+
+
+def _json_default(obj):
+    """JSON fallback for values that are not native Python types."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        return float(obj) if np.isfinite(obj) else None
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
+    elif isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    return str(obj)
+
+
+class NDJSONWriter:
+    """Writes records as newline-delimited JSON, one compact object per line.
+
+    Records are encoded and written incrementally, so memory use does not
+    depend on the size of the export. Uses orjson when it is installed and
+    the standard library encoder otherwise. DataFrame columns are converted
+    to native Python values with tolist(), so the fallback hook for numpy
+    types is rarely needed. Both encoders write NaN and infinite values
+    (e.g. volume in cycles that skip it) as null.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = 10000):
+        """Open the output file.
+
+        Args:
+            path: Output .ndjson file (overwritten)
+            chunk_size: Number of DataFrame rows converted at a time
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.chunk_size = max(1, chunk_size)
+        self.rows_written = 0
+        self._file = open(self.path, 'wb')
+
+        if orjson is not None:
+            options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            self._encode = lambda row: orjson.dumps(row, default=_json_default, option=options)
+        else:
+            encoder = json.JSONEncoder(separators=(',', ':'), default=_json_default,
+                                       allow_nan=False)
+            self._encode = lambda row: (encoder.encode(_finite_row(row)) + '\n').encode('utf-8')
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]):
+        """Append row dictionaries.
+
+        Args:
+            rows: Iterable of row dictionaries (e.g. from a generator)
+        """
+        encode = self._encode
+        write = self._file.write
+        count = 0
+        for row in rows:
+            write(encode(row))
+            count += 1
+        self.rows_written += count
+
+    def write_frame(self, df: pd.DataFrame):
+        """Append the rows of a DataFrame, converting chunk_size rows at a time.
+
+        Args:
+            df: DataFrame to write
+        """
+        columns = [str(c) for c in df.columns]
+        for start in range(0, len(df), self.chunk_size):
+            chunk = df.iloc[start:start + self.chunk_size]
+            values = [chunk[c].tolist() for c in df.columns]
+            self.write_rows(dict(zip(columns, row)) for row in zip(*values))
+
+    def close(self):
+        """Close the output file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class ExcelStreamWriter:
+    """Writes large tables to an .xlsx workbook in constant memory.
+
+    Uses openpyxl's write-only mode: rows are appended to each sheet in order
+    and never held as cell objects, so memory use does not grow with the
+    number of rows. Sheets longer than Excel's row limit continue on
+    ``<name>_2``, ``<name>_3``, and so on.
+
+    When charts are requested, the chart metrics are averaged by age while
+    rows stream past, and the charts are drawn from a small summary sheet
+    instead of from every data row.
+    """
+
+    # Excel row limit, including the header row
+    MAX_ROWS = 1048576
+
+    # Metrics charted against age when include_charts is set
+    CHART_COLUMNS = ['tpa', 'basal_area', 'volume', 'mean_height']
+
+    def __init__(self, path: Union[str, Path], include_charts: bool = False, chunk_size: int = 10000):
+        """Create the workbook.
+
+        Args:
+            path: Output .xlsx file
+            include_charts: Whether to add summary sheets with charts on close
+            chunk_size: Number of DataFrame rows converted at a time
+
+        Raises:
+            ImportError: If openpyxl is not installed
+        """
+        from openpyxl import Workbook
+
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.include_charts = include_charts
+        self.chunk_size = max(1, chunk_size)
+        self.rows_written = 0
+        self._workbook = Workbook(write_only=True)
+        self._summaries: Dict[str, pd.DataFrame] = {}
+
+    def write_sheet(self, sheet_name: str, data: Union[pd.DataFrame, Iterable[pd.DataFrame]]):
+        """Stream a table into a new sheet.
+
+        Args:
+            sheet_name: Name of the sheet
+            data: DataFrame, or an iterable of DataFrame blocks sharing columns
+        """
+        blocks = [data] if isinstance(data, pd.DataFrame) else data
+        worksheet = None
+        columns = None
+        part = 1
+        sheet_rows = 0
+
+        for block in blocks:
+            if columns is None:
+                columns = [str(c) for c in block.columns]
+            for start in range(0, len(block), self.chunk_size):
+                chunk = block.iloc[start:start + self.chunk_size]
+                if self.include_charts:
+                    self._accumulate(sheet_name, chunk)
+                values = [chunk[c].tolist() for c in chunk.columns]
+                for row in zip(*values):
+                    if worksheet is None or sheet_rows >= self.MAX_ROWS:
+                        title = sheet_name if part == 1 else f"{sheet_name}_{part}"
+                        worksheet = self._workbook.create_sheet(title[:31])
+                        worksheet.append(columns)
+                        part += 1
+                        sheet_rows = 1
+                    worksheet.append(row)
+                    sheet_rows += 1
+                self.rows_written += len(chunk)
+
+        if worksheet is None and columns is not None:
+            self._workbook.create_sheet(sheet_name[:31]).append(columns)
+
+    def _accumulate(self, sheet_name: str, chunk: pd.DataFrame):
+        """Add a chunk's per-age sums and counts to the chart summary."""
+        columns = [c for c in self.CHART_COLUMNS if c in chunk.columns]
+        if 'age' not in chunk.columns or not columns:
+            return
+        grouped = chunk.groupby('age')[columns]
+        totals = grouped.sum().join(grouped.size().rename('_count'))
+        if sheet_name in self._summaries:
+            totals = self._summaries[sheet_name].add(totals, fill_value=0)
+        self._summaries[sheet_name] = totals
+
+    def _write_charts(self):
+        """Write a mean-by-age summary sheet with a line chart per metric."""
+        from openpyxl.chart import LineChart, Reference
+
+        for sheet_name, totals in self._summaries.items():
+            means = totals.drop(columns='_count').div(totals['_count'], axis=0).sort_index()
+            worksheet = self._workbook.create_sheet(f"{sheet_name[:23]}_summary")
+            worksheet.append(['age'] + list(means.columns))
+            for age, row in zip(means.index.tolist(), means.values.tolist()):
+                worksheet.append([age] + row)
+
+            n_rows = len(means) + 1
+            ages = Reference(worksheet, min_col=1, min_row=2, max_row=n_rows)
+            anchor_col = chr(ord('A') + len(means.columns) + 2)
+            for i, column in enumerate(means.columns):
+                chart = LineChart()
+                chart.title = f"Mean {column.replace('_', ' ')} by age"
+                chart.x_axis.title = 'Age (years)'
+                chart.y_axis.title = column
+                chart.add_data(Reference(worksheet, min_col=i + 2, min_row=1, max_row=n_rows),
+                               titles_from_data=True)
+                chart.set_categories(ages)
+                worksheet.add_chart(chart, f"{anchor_col}{1 + i * 16}")
+
+    def close(self):
+        """Add any charts and save the workbook."""
+        if self._workbook is None:
+            return
+        if self.include_charts:
+            self._write_charts()
+        if not self._workbook.worksheets:
+            self._workbook.create_sheet('Data')
+        self._workbook.save(self.path)
+        self._workbook = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class ParquetDatasetWriter:
+    """Appends results to a Parquet file or partitioned Parquet dataset.
+
+    Each call to write() adds one row group (single file) or one file per
+    partition (partitioned dataset), so results can be written incrementally
+    as they are produced. The schema of the first write is used for all
+    later writes. An existing file or dataset at the path is replaced, so a
+    re-export never keeps partitions of an earlier run; a directory holding
+    anything else is left alone.
+    """
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 compression: str = 'zstd',
+                 partition_cols: Optional[List[str]] = None):
+        """Initialize the writer.
+
+        Args:
+            path: Output .parquet file, or dataset directory when partitioned
+                  (either is replaced)
+            compression: Parquet compression codec ('zstd', 'snappy', 'gzip', 'none')
+            partition_cols: Columns to partition by (e.g. ['species', 'site_index'])
+
+        Raises:
+            FileExistsError: If a partitioned path is a file or a directory
+                             that is not a Parquet dataset
+        """
+        self._pa, self._pq = _import_pyarrow()
+        self.path = Path(path)
+        self.compression = compression
+        self.partition_cols = list(partition_cols) if partition_cols else None
+        self.schema = None
+        self.rows_written = 0
+        self._writer = None
+        self._part = 0
+
+        if self.partition_cols:
+            if self.path.is_dir() and _is_parquet_dataset(self.path):
+                shutil.rmtree(self.path)
+            elif self.path.exists():
+                raise FileExistsError(f"Not replacing {self.path}: it is not a Parquet dataset")
+            self.path.mkdir(parents=True)
+        else:
+            self.path.parent.mkdir(exist_ok=True, parents=True)
+
+    def write(self, data: Union[pd.DataFrame, List[Dict]]):
+        """Append rows to the output.
+
+        Args:
+            data: DataFrame or list of row dictionaries
+        """
+        if len(data) == 0:
+            return
+        table = to_arrow_table(data, self.schema)
+        if self.schema is None:
+            self.schema = table.schema
+
+        if self.partition_cols:
+            self._pq.write_to_dataset(
+                table,
+                root_path=str(self.path),
+                partition_cols=self.partition_cols,
+                basename_template=f"part-{self._part:05d}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+                compression=self.compression
+            )
+            self._part += 1
+        else:
+            if self._writer is None:
+                self._writer = self._pq.ParquetWriter(str(self.path), self.schema,
+                                                      compression=self.compression)
+            self._writer.write_table(table)
+
+        self.rows_written += table.num_rows
+
+    def close(self):
+        """Finish the output file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
 
 
 class DataExporter:
@@ -27,6 +418,7 @@ class DataExporter:
         self.output_dir.mkdir(exist_ok=True, parents=True)
         self.logger = get_logger(__name__)
     
+    @timed('export_csv')
     def export_to_csv(self, 
                      data: Union[pd.DataFrame, List[Dict]], 
                      filename: str,
@@ -43,10 +435,8 @@ class DataExporter:
         """
         filepath = self.output_dir / f"{filename}.csv"
         
-        if isinstance(data, list):
-            df = pd.DataFrame(data)
-        else:
-            df = data.copy()
+        # Written as-is, so no defensive copy is needed
+        df = pd.DataFrame(data) if isinstance(data, list) else data
         
         with open(filepath, 'w', newline='') as f:
             if include_metadata:
@@ -63,6 +453,7 @@ class DataExporter:
         self.logger.info(f"Exported {len(df)} records to {filepath}")
         return filepath
     
+    @timed('export_json')
     def export_to_json(self, 
                       data: Union[pd.DataFrame, List[Dict], Dict], 
                       filename: str,
@@ -116,6 +507,37 @@ class DataExporter:
         self.logger.info(f"Exported data to {filepath}")
         return filepath
     
+    @timed('export_ndjson')
+    def export_to_ndjson(self,
+                        data: Union[pd.DataFrame, Iterable[Dict]],
+                        filename: str,
+                        chunk_size: int = 10000) -> Path:
+        """Export data as newline-delimited JSON (one record per line).
+        
+        Unlike export_to_json, records are encoded and written incrementally
+        without pretty-printing, so large tables and row generators can be
+        exported with flat memory use.
+        
+        Args:
+            data: DataFrame, list of dicts, or iterable of row dicts
+            filename: Output filename
+            chunk_size: Number of DataFrame rows converted at a time
+            
+        Returns:
+            Path to exported file
+        """
+        filepath = self.output_dir / f"{filename}.ndjson"
+        
+        with NDJSONWriter(filepath, chunk_size) as writer:
+            if isinstance(data, pd.DataFrame):
+                writer.write_frame(data)
+            else:
+                writer.write_rows(data)
+        
+        self.logger.info(f"Exported {writer.rows_written} records to {filepath}")
+        return filepath
+    
+    @timed('export_xml')
     def export_to_xml(self, 
                      data: Union[pd.DataFrame, List[Dict]], 
                      filename: str,
@@ -168,6 +590,7 @@ class DataExporter:
         self.logger.info(f"Exported {len(records)} records to {filepath}")
         return filepath
     
+    @timed('export_excel')
     def export_to_excel(self, 
                        data: Union[pd.DataFrame, Dict[str, pd.DataFrame]], 
                        filename: str,
@@ -177,7 +600,7 @@ class DataExporter:
         Args:
             data: Data to export (single DataFrame or dict of DataFrames for multiple sheets)
             filename: Output filename
-            include_charts: Whether to include basic charts (requires openpyxl)
+            include_charts: Whether to add mean-by-age summary sheets with charts
             
         Returns:
             Path to exported file
@@ -185,23 +608,17 @@ class DataExporter:
         filepath = self.output_dir / f"{filename}.xlsx"
         
         try:
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+            # Write-only workbook: rows are streamed, not held as cell objects
+            with self.excel_writer(filename, include_charts) as writer:
                 if isinstance(data, pd.DataFrame):
                     # Single sheet
-                    data.to_excel(writer, sheet_name='Data', index=False)
-                    
-                    if include_charts:
-                        self._add_excel_charts(writer.book['Data'], data)
-                        
+                    writer.write_sheet('Data', data)
                 else:
-                    # Multiple sheets
+                    # Multiple sheets (values may be iterables of DataFrame blocks)
                     for sheet_name, df in data.items():
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
-                        
-                        if include_charts:
-                            self._add_excel_charts(writer.book[sheet_name], df)
+                        writer.write_sheet(sheet_name, df)
                 
-            self.logger.info(f"Exported data to Excel file {filepath}")
+            self.logger.info(f"Exported {writer.rows_written} rows to Excel file {filepath}")
             return filepath
             
         except ImportError:
@@ -213,16 +630,112 @@ class DataExporter:
                 first_sheet = next(iter(data.values()))
                 return self.export_to_csv(first_sheet, filename)
     
+    def excel_writer(self, filename: str, include_charts: bool = False) -> ExcelStreamWriter:
+        """Open a write-only Excel workbook for sheet-by-sheet streaming.
+        
+        Args:
+            filename: Output filename (without extension)
+            include_charts: Whether to add mean-by-age summary sheets with charts
+            
+        Returns:
+            ExcelStreamWriter; use as a context manager or call close()
+        """
+        return ExcelStreamWriter(self.output_dir / f"{filename}.xlsx", include_charts)
+    
+    @timed('export_parquet')
+    def export_to_parquet(self,
+                         data: Union[pd.DataFrame, List[Dict]],
+                         filename: str,
+                         compression: str = 'zstd',
+                         partition_cols: Optional[List[str]] = None) -> Path:
+        """Export data to Parquet format with a typed schema.
+        
+        Args:
+            data: Data to export (DataFrame or list of dicts)
+            filename: Output filename
+            compression: Parquet compression codec
+            partition_cols: Columns to partition by (e.g. ['species', 'site_index']).
+                           If given, a dataset directory is written instead of a file.
+            
+        Returns:
+            Path to exported file or dataset directory
+        """
+        filepath = self._parquet_path(filename, partition_cols)
+        with ParquetDatasetWriter(filepath, compression, partition_cols) as writer:
+            writer.write(data)
+        
+        self.logger.info(f"Exported {writer.rows_written} records to {filepath}")
+        return filepath
+    
+    @timed('export_arrow')
+    def export_to_arrow(self,
+                       data: Union[pd.DataFrame, List[Dict]],
+                       filename: str,
+                       compression: Optional[str] = 'zstd') -> Path:
+        """Export data to Arrow IPC (Feather v2) format with a typed schema.
+        
+        Args:
+            data: Data to export (DataFrame or list of dicts)
+            filename: Output filename
+            compression: IPC buffer compression ('zstd', 'lz4' or None)
+            
+        Returns:
+            Path to exported file
+        """
+        pa, _ = _import_pyarrow()
+        filepath = self.output_dir / f"{filename}.arrow"
+        
+        table = to_arrow_table(data)
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.OSFile(str(filepath), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+                writer.write_table(table)
+        
+        self.logger.info(f"Exported {table.num_rows} records to {filepath}")
+        return filepath
+    
+    def parquet_writer(self,
+                      filename: str,
+                      compression: str = 'zstd',
+                      partition_cols: Optional[List[str]] = None) -> ParquetDatasetWriter:
+        """Open a writer that appends results to Parquet incrementally.
+        
+        Args:
+            filename: Output filename
+            compression: Parquet compression codec
+            partition_cols: Columns to partition by
+            
+        Returns:
+            ParquetDatasetWriter (use as a context manager)
+        """
+        return ParquetDatasetWriter(self._parquet_path(filename, partition_cols),
+                                    compression, partition_cols)
+    
+    def _parquet_path(self, filename: str, partition_cols: Optional[List[str]]) -> Path:
+        """Get the Parquet file, or dataset directory when partitioned.
+        
+        Raises:
+            ValueError: If a dataset directory would be the output directory
+        """
+        if not partition_cols:
+            return self.output_dir / f"{filename}.parquet"
+        filepath = self.output_dir / filename
+        if not str(filename).strip() or filepath.resolve() == self.output_dir.resolve():
+            raise ValueError(f"Partitioned Parquet export needs a dataset name, got {filename!r}")
+        return filepath
+    
     def export_yield_table(self, 
                           yield_table: pd.DataFrame,
                           format: str = 'csv',
-                          filename: Optional[str] = None) -> Path:
+                          filename: Optional[str] = None,
+                          include_charts: bool = False) -> Path:
         """Export yield table with proper formatting.
         
         Args:
             yield_table: Yield table DataFrame
-            format: Export format ('csv', 'json', 'xml', 'excel')
+            format: Export format ('csv', 'json', 'ndjson', 'xml', 'excel', 'parquet', 'arrow')
             filename: Custom filename (optional)
+            include_charts: Whether to add summary charts (Excel only)
             
         Returns:
             Path to exported file
@@ -232,11 +745,11 @@ class DataExporter:
             filename = f"yield_table_{timestamp}"
         
         # Round numeric columns for better presentation
-        display_table = yield_table.copy()
         numeric_columns = ['mean_dbh', 'mean_height', 'basal_area', 'volume']
-        for col in numeric_columns:
-            if col in display_table.columns:
-                display_table[col] = display_table[col].round(2)
+        display_table = yield_table.assign(**{
+            col: yield_table[col].round(2)
+            for col in numeric_columns if col in yield_table.columns
+        })
         
         # Sort by logical order
         if all(col in display_table.columns for col in ['species', 'site_index', 'initial_tpa', 'age']):
@@ -249,24 +762,17 @@ class DataExporter:
         elif format.lower() == 'xml':
             return self.export_to_xml(display_table, filename, 'yield_table', 'yield_entry')
         elif format.lower() == 'excel':
-            return self.export_to_excel(display_table, filename)
+            return self.export_to_excel(display_table, filename, include_charts)
+        elif format.lower() == 'ndjson':
+            return self.export_to_ndjson(display_table, filename)
+        elif format.lower() == 'parquet':
+            return self.export_to_parquet(display_table, filename)
+        elif format.lower() == 'arrow':
+            return self.export_to_arrow(display_table, filename)
         else:
             raise ValueError(f"Unsupported format: {format}")
     
     def _json_serializer(self, obj):
         """JSON serializer for numpy types."""
-        if isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, pd.Timestamp):
-            return obj.isoformat()
-        return str(obj)
-    
-    def _add_excel_charts(self, worksheet, data: pd.DataFrame):
-        """Add basic charts to Excel worksheet (placeholder for future implementation)."""
-        # This would require openpyxl chart functionality
-        # Implementation would depend on specific chart requirements
-        pass
\ No newline at end of file
+        return _json_default(obj)
+
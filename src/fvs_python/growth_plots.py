@@ -4,6 +4,8 @@ Provides comprehensive plotting capabilities for FVS-Python results.
 """
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 import seaborn as sns
@@ -21,6 +23,40 @@ except OSError:
         
 sns.set_palette("husl")
 
+
+def _new_figure(save_path, nrows=1, ncols=1, figsize=None):
+    """Create a figure and its axes.
+    
+    Figures that are saved are drawn on an Agg canvas and never registered
+    with pyplot, so they can be rendered on a background thread whatever
+    the interactive backend. Figures without a save path are created
+    through pyplot to be shown.
+    
+    Args:
+        save_path: Path the figure will be saved to, or None to show it
+        nrows: Number of subplot rows
+        ncols: Number of subplot columns
+        figsize: Figure size in inches
+        
+    Returns:
+        Tuple of (figure, axes)
+    """
+    if save_path:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.subplots(nrows, ncols)
+    return plt.subplots(nrows, ncols, figsize=figsize)
+
+
+def _finish_figure(fig, save_path, **savefig_kwargs):
+    """Save a figure from _new_figure, or show and close it without a save path."""
+    if save_path:
+        fig.savefig(save_path, **savefig_kwargs)
+    else:
+        plt.show()
+        plt.close(fig)
+
+
 def plot_stand_trajectories(metrics_over_time, save_path=None):
     """Plot key stand metrics over time.
     
@@ -37,7 +73,7 @@ def plot_stand_trajectories(metrics_over_time, save_path=None):
     basal_area = [m['basal_area'] for m in metrics_over_time]
     
     # Create subplots
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    fig, ((ax1, ax2), (ax3, ax4)) = _new_figure(save_path, 2, 2, figsize=(12, 10))
     fig.suptitle('Stand Development Trajectories', fontsize=14)
     
     # Trees per acre
@@ -66,14 +102,8 @@ def plot_stand_trajectories(metrics_over_time, save_path=None):
     ax4.set_ylabel('Basal Area (sq ft/acre)')
     ax4.grid(True)
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    else:
-        plt.show()
-    
-    plt.close()
+    fig.tight_layout()
+    _finish_figure(fig, save_path, dpi=300, bbox_inches='tight')
 
 
 def plot_yield_table_comparison(yield_table: pd.DataFrame, 
@@ -217,32 +247,45 @@ def plot_size_distributions(stand, save_path=None):
     dbhs = [tree.dbh for tree in stand.trees]
     heights = [tree.height for tree in stand.trees]
     
+    _plot_distributions(dbhs, heights, None, stand.age, save_path)
+
+
+def plot_tree_list_distributions(records, save_path=None):
+    """Plot DBH and height distributions from tree-list records.
+    
+    Args:
+        records: Structured array from TreeListReader.read() for one cycle
+        save_path: Optional path to save the plot
+    """
+    if len(records) == 0:
+        return
+    
+    _plot_distributions(records['dbh'], records['height'], records['tpa'],
+                        int(records['age'][0]), save_path)
+
+
+def _plot_distributions(dbhs, heights, weights, age, save_path=None):
+    """Draw DBH and height histograms, weighting trees by TPA if given."""
     # Create subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
-    fig.suptitle(f'Stand Size Distributions at Age {stand.age}', fontsize=14)
+    fig, (ax1, ax2) = _new_figure(save_path, 1, 2, figsize=(12, 5))
+    fig.suptitle(f'Stand Size Distributions at Age {age}', fontsize=14)
     
     # DBH distribution
-    ax1.hist(dbhs, bins=20, edgecolor='black')
+    ax1.hist(dbhs, bins=20, weights=weights, edgecolor='black')
     ax1.set_xlabel('DBH (inches)')
     ax1.set_ylabel('Number of Trees')
     ax1.set_title('DBH Distribution')
     ax1.grid(True)
     
     # Height distribution
-    ax2.hist(heights, bins=20, edgecolor='black')
+    ax2.hist(heights, bins=20, weights=weights, edgecolor='black')
     ax2.set_xlabel('Height (feet)')
     ax2.set_ylabel('Number of Trees')
     ax2.set_title('Height Distribution')
     ax2.grid(True)
     
-    plt.tight_layout()
-    
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-    else:
-        plt.show()
-    
-    plt.close()
+    fig.tight_layout()
+    _finish_figure(fig, save_path, dpi=300, bbox_inches='tight')
 
 
 def plot_yield_table_comparison(yield_table: pd.DataFrame, 
@@ -390,20 +433,15 @@ def plot_mortality_patterns(metrics_over_time, save_path=None):
         mortality_rates.append(rate)
     
     # Create plot
-    plt.figure(figsize=(10, 6))
-    plt.plot(ages[1:], mortality_rates, 'r-', label='Annual Mortality Rate')
-    plt.xlabel('Stand Age (years)')
-    plt.ylabel('Annual Mortality Rate')
-    plt.title('Stand Mortality Patterns')
-    plt.grid(True)
-    plt.legend()
-    
-    if save_path:
-        plt.savefig(save_path)
-    else:
-        plt.show()
-    
-    plt.close()
+    fig, ax = _new_figure(save_path, figsize=(10, 6))
+    ax.plot(ages[1:], mortality_rates, 'r-', label='Annual Mortality Rate')
+    ax.set_xlabel('Stand Age (years)')
+    ax.set_ylabel('Annual Mortality Rate')
+    ax.set_title('Stand Mortality Patterns')
+    ax.grid(True)
+    ax.legend()
+    
+    _finish_figure(fig, save_path)
 
 def plot_competition_effects(stand, save_path=None):
     """Plot relationship between tree size and competition.
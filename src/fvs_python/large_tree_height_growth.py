@@ -5,6 +5,7 @@ following the approach of Wensel and others (1987).
 """
 import json
 import math
+import numpy as np
 from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 from .config_loader import get_config_loader
@@ -56,6 +57,9 @@ class LargeTreeHeightGrowthModel:
         
         # Load site index ranges and validation
         self._load_site_index_ranges()
+        
+        # Chapman-Richards coefficients for potential height, loaded once
+        self._small_tree_coefficients = self._get_small_tree_coefficients()
     
     def _load_fallback_methodology(self):
         """Load fallback methodology if main file not available."""
@@ -204,8 +208,7 @@ class LargeTreeHeightGrowthModel:
         # Validate and bound site index
         site_index = self._validate_site_index(site_index)
         
-        # Load small tree height growth coefficients
-        small_tree_coeffs = self._get_small_tree_coefficients()
+        small_tree_coeffs = self._small_tree_coefficients
         
         # Estimate tree height if not provided
         if tree_height is None:
@@ -501,6 +504,150 @@ class LargeTreeHeightGrowthModel:
         
         return max(0.0, htg)
     
+    def _estimate_height_from_dbh_array(self, dbh: np.ndarray) -> np.ndarray:
+        """Vectorized _estimate_height_from_dbh."""
+        with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+            height = 4.5 + 243.860648 * np.exp(-4.28460566 * (dbh ** -0.47130185))
+        return np.maximum(4.5, np.where(dbh > 0, height, 4.5))
+    
+    def _estimate_age_from_height_array(self, height: np.ndarray, site_index: np.ndarray,
+                                        coeffs: Dict[str, float]) -> np.ndarray:
+        """Vectorized inverse Chapman-Richards age estimate (see _estimate_age_from_height).
+        
+        Heights at or above the asymptote get the mature default of 50 years;
+        heights outside the equation's domain get the rough fallback estimate.
+        """
+        c1, c2, c3, c4, c5 = coeffs['c1'], coeffs['c2'], coeffs['c3'], coeffs['c4'], coeffs['c5']
+        
+        with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+            ratio = height / (c1 * (site_index ** c2))
+            inner_term = ratio ** (1.0 / (c4 * (site_index ** c5)))
+            age = np.clip((1.0 / c3) * np.log(1.0 - inner_term), 5.0, 200.0) if c3 != 0 else np.nan
+        
+        mature = (ratio >= 1.0) | (inner_term >= 1.0)
+        invalid = ~mature & ~np.isfinite(age)
+        age = np.where(mature, 50.0, age)
+        return np.where(invalid, np.maximum(10.0, height * 0.5), age)
+    
+    def calculate_potential_height_growth_array(self, dbh: np.ndarray, site_index,
+                                                tree_age: Optional[np.ndarray] = None,
+                                                tree_height: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate potential height growth for arrays of trees.
+        
+        Vectorized equivalent of calculate_potential_height_growth. Trees for
+        which the Chapman-Richards difference is undefined use the fallback
+        relationship, selected with a mask.
+        
+        Args:
+            dbh: Diameters at breast height (inches)
+            site_index: Site index (base age 25) in feet, scalar or array
+            tree_age: Tree ages (years); estimated from height where not provided
+            tree_height: Tree heights (feet); estimated from DBH where not provided
+            
+        Returns:
+            Potential height growth of each tree (feet)
+        """
+        dbh = np.asarray(dbh, dtype=float)
+        si_min = self.site_index_range.get('si_min', 40)
+        si_max = self.site_index_range.get('si_max', 125)
+        site_index = np.clip(np.asarray(site_index, dtype=float), si_min, si_max)
+        coeffs = self._small_tree_coefficients
+        
+        if tree_height is None:
+            tree_height = self._estimate_height_from_dbh_array(dbh)
+        if tree_age is None:
+            tree_age = self._estimate_age_from_height_array(np.asarray(tree_height, dtype=float),
+                                                            site_index, coeffs)
+        tree_age = np.clip(np.asarray(tree_age, dtype=float), 15.0, 150.0)
+        
+        # POTHT = c1 * SI^c2 * (1 - exp(c3 * AGET))^(c4 * SI^c5), five years apart
+        c1, c2, c3, c4, c5 = coeffs['c1'], coeffs['c2'], coeffs['c3'], coeffs['c4'], coeffs['c5']
+        scale = c1 * (site_index ** c2)
+        shape = c4 * (site_index ** c5)
+        with np.errstate(over='ignore', invalid='ignore'):
+            current_potht = scale * (1.0 - np.exp(c3 * tree_age)) ** shape
+            future_potht = scale * (1.0 - np.exp(c3 * (tree_age + 5))) ** shape
+        growth = future_potht - current_potht
+        
+        # Slower growth for very large trees and moderated growth on very high sites
+        growth = growth * np.where(dbh > 15.0, np.maximum(0.3, 1.0 - (dbh - 15.0) * 0.02), 1.0)
+        growth = growth * np.where(site_index > 80.0, np.maximum(0.7, 1.0 - (site_index - 80.0) * 0.005), 1.0)
+        growth = np.clip(growth, 0.1, 4.0)
+        
+        # Fallback relationship where the Chapman-Richards form is undefined
+        fallback = np.clip(
+            (site_index / 70.0) * 1.5
+            * np.maximum(0.2, 1.0 - (tree_age - 20.0) * 0.01)
+            * np.maximum(0.3, 1.0 - (dbh - 8.0) * 0.03),
+            0.1, 3.0
+        )
+        growth = np.where(np.isfinite(current_potht) & np.isfinite(future_potht), growth, fallback)
+        return np.maximum(0.0, growth)
+    
+    def calculate_crown_ratio_modifier_array(self, crown_ratio: np.ndarray) -> np.ndarray:
+        """Calculate the crown ratio modifier (equation 4.7.2.2) for an array of crown ratios.
+        
+        Args:
+            crown_ratio: Crown ratios as proportions (0-1)
+            
+        Returns:
+            Crown ratio modifiers (bounded to < 1.0)
+        """
+        crown_ratio = np.clip(np.asarray(crown_ratio, dtype=float), 0.05, 0.95)
+        return np.minimum((crown_ratio ** 3.0) * np.exp(-5.0 * crown_ratio), 0.999)
+    
+    def calculate_relative_height_modifier_array(self, relative_height: np.ndarray,
+                                                 species_code: Optional[str] = None) -> np.ndarray:
+        """Calculate the relative height modifier (equations 4.7.2.3 - 4.7.2.7) for an array.
+        
+        Args:
+            relative_height: Tree heights relative to top 40 trees in stand
+            species_code: Species code for shade tolerance lookup
+            
+        Returns:
+            Relative height modifiers (0.0 to 1.0); 0.5 where the equation is undefined
+        """
+        coeffs = self.get_shade_tolerance_coefficients(self.get_species_shade_tolerance(species_code))
+        rhr, rhyxs, rhm = coeffs['RHR'], coeffs['RHYXS'], coeffs['RHM']
+        rhb, rhxs, rhk = coeffs['RHB'], coeffs['RHXS'], coeffs['RHK']
+        relative_height = np.asarray(relative_height, dtype=float)
+        
+        with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+            fctrkx = ((rhk / rhyxs) ** (rhm - 1)) - 1 if rhyxs != 0 else np.nan
+            fctrrb = (-1.0 * rhr) / (1 - rhb) if rhb != 1 else np.nan
+            fctrxb = (relative_height ** (1 - rhb)) - (rhxs ** (1 - rhb))
+            fctrm = 1 / (1 - rhm) if rhm != 1 else np.nan
+            hgmdrh = rhk * ((1 + fctrkx * np.exp(fctrrb * fctrxb)) ** fctrm)
+        
+        return np.where(np.isfinite(hgmdrh), np.clip(hgmdrh, 0.0, 1.0), 0.5)
+    
+    def calculate_height_growth_array(self, dbh: np.ndarray, crown_ratio: np.ndarray,
+                                      relative_height: np.ndarray, site_index,
+                                      species_code: Optional[str] = None,
+                                      tree_age: Optional[np.ndarray] = None,
+                                      tree_height: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate periodic height growth for arrays of large trees.
+        
+        Vectorized equivalent of calculate_height_growth (equation 4.7.2.1):
+        HTG = POTHTG * (0.25 * HGMDCR + 0.75 * HGMDRH)
+        
+        Args:
+            dbh: Diameters at breast height (inches)
+            crown_ratio: Crown ratios as proportions (0-1)
+            relative_height: Tree heights relative to top 40 trees
+            site_index: Site index (base age 25) in feet, scalar or array
+            species_code: Species code for shade tolerance
+            tree_age: Tree ages (years); estimated from height if not provided
+            tree_height: Tree heights (feet); estimated from DBH if not provided
+            
+        Returns:
+            Periodic height growth of each tree (feet)
+        """
+        pothtg = self.calculate_potential_height_growth_array(dbh, site_index, tree_age, tree_height)
+        hgmdcr = self.calculate_crown_ratio_modifier_array(crown_ratio)
+        hgmdrh = self.calculate_relative_height_modifier_array(relative_height, species_code)
+        return np.maximum(0.0, pothtg * (0.25 * hgmdcr + 0.75 * hgmdrh))
+    
     def get_species_shade_tolerance(self, species_code: Optional[str] = None) -> str:
         """Get shade tolerance classification for a species.
         
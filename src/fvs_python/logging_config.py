@@ -2,14 +2,47 @@
 Logging configuration for FVS-Python.
 Provides structured logging with different levels and formats.
 """
+import atexit
+import contextvars
 import logging
 import logging.config
+import logging.handlers
 import json
+import queue
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional
 
 
+# Whether setup_logging has configured logging in this process
+_logging_configured = False
+
+# Background listener used when logging asynchronously
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+# Whether per-tree model transition events are logged (see set_transition_events)
+_transition_events = False
+
+# Simulation context (species, stand_id, ...) of the current thread or asyncio task
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
+    'fvs_log_context', default={}
+)
+
+
+class SimulationContextFilter(logging.Filter):
+    """Adds the active SimulationLogContext fields to log records.
+    
+    setup_logging attaches one instance to each handler it creates. Attach
+    it to your own handlers when configuring logging by other means.
+    """
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Copy the current context onto the record; never drops records."""
+        for key, value in _log_context.get().items():
+            setattr(record, key, value)
+        return True
+
+
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
@@ -34,6 +67,8 @@ class StructuredFormatter(logging.Formatter):
             log_data['simulation_year'] = record.simulation_year
         if hasattr(record, 'tree_count'):
             log_data['tree_count'] = record.tree_count
+        if hasattr(record, 'transitions'):
+            log_data['transitions'] = record.transitions
         
         # Add exception info if present
         if record.exc_info:
@@ -45,16 +80,29 @@ class StructuredFormatter(logging.Formatter):
 def setup_logging(
     log_level: str = 'INFO',
     log_file: Optional[Path] = None,
-    structured: bool = False
+    structured: bool = False,
+    async_logging: bool = False,
+    log_queue: Optional[Any] = None
 ) -> None:
     """
     Set up logging configuration.
     
+    With async_logging, loggers only put records on a queue and a background
+    QueueListener thread does the formatting and console/file output, so a
+    log call never waits on I/O. To collect records from worker processes,
+    pass a multiprocessing queue as log_queue and call
+    configure_worker_logging(log_queue) in each worker.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
         structured: Whether to use structured (JSON) logging
+        async_logging: Whether to format and write records on a background thread
+        log_queue: Queue for async logging (default: an unbounded in-process queue)
     """
+    # Stop any previous listener before its handlers are replaced
+    stop_queue_listener()
+    
     # Base configuration
     config: Dict[str, Any] = {
         'version': 1,
@@ -72,11 +120,17 @@ def setup_logging(
                 '()': StructuredFormatter
             }
         },
+        'filters': {
+            'simulation_context': {
+                '()': SimulationContextFilter
+            }
+        },
         'handlers': {
             'console': {
                 'class': 'logging.StreamHandler',
                 'level': log_level,
                 'formatter': 'standard' if not structured else 'structured',
+                'filters': ['simulation_context'],
                 'stream': 'ext://sys.stdout'
             }
         },
@@ -99,6 +153,7 @@ def setup_logging(
             'class': 'logging.handlers.RotatingFileHandler',
             'level': log_level,
             'formatter': 'detailed' if not structured else 'structured',
+            'filters': ['simulation_context'],
             'filename': str(log_file),
             'maxBytes': 10485760,  # 10MB
             'backupCount': 5
@@ -107,7 +162,112 @@ def setup_logging(
         config['loggers']['fvs_python']['handlers'].append('file')
     
     # Apply configuration
+    global _logging_configured
     logging.config.dictConfig(config)
+    _logging_configured = True
+    
+    if async_logging or log_queue is not None:
+        _start_queue_listener(log_queue if log_queue is not None else queue.SimpleQueue())
+
+
+def _start_queue_listener(log_queue: Any) -> None:
+    """Move the configured handlers behind a queue and a background listener."""
+    global _queue_listener
+    root = logging.getLogger()
+    fvs_logger = logging.getLogger('fvs_python')
+    
+    # The root and fvs_python loggers share handler instances; keep one of each
+    handlers = list(dict.fromkeys(root.handlers + fvs_logger.handlers))
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Context must be captured on the logging thread, not the listener thread
+    queue_handler.addFilter(SimulationContextFilter())
+    for logger in (root, fvs_logger):
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+    
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+def stop_queue_listener() -> None:
+    """
+    Stop the background logging listener, if running.
+    
+    Records already queued are written before this returns. Called
+    automatically at interpreter exit.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        listener, _queue_listener = _queue_listener, None
+        listener.stop()
+
+
+atexit.register(stop_queue_listener)
+
+
+def configure_worker_logging(log_queue: Any, log_level: str = 'INFO') -> None:
+    """
+    Route a worker process's log records to the parent process.
+    
+    Call at the start of each multiprocessing worker with the queue passed
+    to setup_logging(log_queue=...) in the parent. Records from all workers
+    are then formatted and written by the parent's listener, so output from
+    different processes is merged into the same console and log file.
+    
+    Args:
+        log_queue: multiprocessing queue read by the parent's listener
+        log_level: Logging level for the worker
+    """
+    global _logging_configured, _queue_listener
+    # A forked worker inherits the parent's listener object but not its thread
+    _queue_listener = None
+    
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(SimulationContextFilter())
+    for logger in (logging.getLogger(), logging.getLogger('fvs_python')):
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        logger.setLevel(log_level)
+    _logging_configured = True
+
+
+def is_logging_configured() -> bool:
+    """Return whether setup_logging has been called in this process."""
+    return _logging_configured
+
+
+def ensure_logging(
+    log_dir: Path,
+    log_level: str = 'INFO',
+    structured: bool = True,
+    async_logging: bool = False
+) -> Optional[Path]:
+    """
+    Set up logging once per process.
+    
+    Creates a timestamped log file in log_dir the first time it is called.
+    Later calls, or calls after the application has run setup_logging itself,
+    leave the existing configuration and handlers in place.
+    
+    Args:
+        log_dir: Directory for the log file
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        structured: Whether to use structured (JSON) logging
+        async_logging: Whether to format and write records on a background thread
+    
+    Returns:
+        Path of the new log file, or None if logging was already configured
+    """
+    if _logging_configured:
+        return None
+    log_file = Path(log_dir) / f'simulation_{datetime.now():%Y%m%d_%H%M%S}.log'
+    setup_logging(log_level=log_level, log_file=log_file, structured=structured,
+                  async_logging=async_logging)
+    return log_file
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -124,7 +284,13 @@ def get_logger(name: str) -> logging.Logger:
 
 
 class SimulationLogContext:
-    """Context manager for simulation-specific logging context."""
+    """Context manager for simulation-specific logging context.
+    
+    The context is stored in a contextvars.ContextVar, so concurrent
+    simulations in different threads or asyncio tasks each see only their
+    own fields. Nested contexts add to the enclosing one. Fields are stamped
+    onto records by SimulationContextFilter.
+    """
     
     def __init__(self, logger: logging.Logger, **context):
         """
@@ -136,26 +302,28 @@ class SimulationLogContext:
         """
         self.logger = logger
         self.context = context
-        self.old_factory = None
+        self._token: Optional[contextvars.Token] = None
     
     def __enter__(self):
-        """Enter context and set up log record factory."""
-        old_factory = logging.getLogRecordFactory()
-        
-        def record_factory(*args, **kwargs):
-            record = old_factory(*args, **kwargs)
-            for key, value in self.context.items():
-                setattr(record, key, value)
-            return record
-        
-        self.old_factory = old_factory
-        logging.setLogRecordFactory(record_factory)
+        """Enter context, adding its fields to the current context."""
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit context and restore original factory."""
-        if self.old_factory:
-            logging.setLogRecordFactory(self.old_factory)
+        """Exit context and restore the enclosing context."""
+        if self._token is not None:
+            _log_context.reset(self._token)
+            self._token = None
+
+
+def get_log_context() -> Dict[str, Any]:
+    """
+    Get the logging context of the current thread or task.
+    
+    Returns:
+        Copy of the active SimulationLogContext fields
+    """
+    return dict(_log_context.get())
 
 
 # Convenience functions for common log messages
@@ -188,9 +356,42 @@ def log_growth_summary(logger: logging.Logger, period: int,
     )
 
 
+def set_transition_events(enabled: bool) -> None:
+    """
+    Enable or disable per-tree model transition events.
+    
+    Disabled by default: stands log one transition summary per cycle
+    (log_transition_summary). When enabled, each tree crossing a model
+    boundary is also logged at DEBUG level.
+    
+    Args:
+        enabled: Whether to log per-tree transition events
+    """
+    global _transition_events
+    _transition_events = enabled
+
+
+def transition_events_enabled(logger: logging.Logger) -> bool:
+    """Return whether per-tree transition events should be logged to logger."""
+    return _transition_events and logger.isEnabledFor(logging.DEBUG)
+
+
+def log_transition_summary(logger: logging.Logger, period: int,
+                           small_to_blended: int, blended_to_large: int) -> None:
+    """Log the number of trees that changed growth model in a period."""
+    if not (small_to_blended or blended_to_large):
+        return
+    logger.info(
+        f"Period {period} model transitions: {small_to_blended} small->blended, "
+        f"{blended_to_large} blended->large",
+        extra={'transitions': {'small_to_blended': small_to_blended,
+                               'blended_to_large': blended_to_large}}
+    )
+
+
 def log_model_transition(logger: logging.Logger, tree_id: str,
                         from_model: str, to_model: str, dbh: float) -> None:
-    """Log model transition for a tree."""
+    """Log model transition for a tree (opt-in, see set_transition_events)."""
     logger.debug(
         f"Tree {tree_id} transitioned from {from_model} to {to_model} "
         f"model at DBH={dbh:.1f}\""
@@ -0,0 +1,248 @@
+"""
+SDI-based mortality model for FVS-Python.
+Implements the SN variant mortality procedure (section 5.0, EFVS 7.3.2):
+the amount of stand mortality is determined from stand SDI relative to the
+maximum SDI, then dispersed to individual tree records.
+
+All calculations work on record arrays with trees-per-acre expansion
+factors, so many stands are processed in one vectorized pass.
+"""
+import math
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+from .config_loader import get_config_loader
+
+
+MORTALITY_MODELS = ('empirical', 'sdi')
+
+# Reineke exponent of the Zeide SDI summation
+_SDI_EXPONENT = 1.605
+
+# Newton iterations used to find the number of dispersal passes
+_MAX_ITERATIONS = 50
+_TOLERANCE = 1e-10
+
+
+class SDIMortalityModel:
+    """SDI-based mortality model implementing FVS Southern variant equations.
+
+    Below the density threshold (55% of maximum SDI) each record loses its
+    background mortality rate (equations 5.0.1 and 5.0.2). Above it, the stand
+    loses the SDI needed to follow a trajectory approaching the maximum
+    density (SDIU, 85% of maximum SDI), dispersed to records by basal area
+    percentile and shade tolerance (equations 5.0.3 and 5.0.4).
+    """
+
+    def __init__(self, density_threshold: float = 0.55, sdi_upper: float = 0.85):
+        """Initialize with species parameters from configuration.
+
+        Args:
+            density_threshold: Proportion of maximum SDI where density-related
+                               mortality starts
+            sdi_upper: Proportion of maximum SDI at which stands reach their
+                       actual maximum density (SDIU)
+        """
+        self.density_threshold = density_threshold
+        self.sdi_upper = sdi_upper
+        self._species_arrays: Dict[Tuple[str, ...], Tuple[np.ndarray, ...]] = {}
+        self._load_parameters()
+
+    def _load_parameters(self):
+        """Load mortality coefficients from configuration."""
+        try:
+            loader = get_config_loader()
+            mortality_file = loader.cfg_dir / "sn_mortality_model.json"
+            mortality_data = loader._load_config_file(mortality_file)
+
+            tables = mortality_data['tables']
+            self.coefficients = tables['table_5_0_1']['coefficients']
+            self.mwt_values = tables['table_5_0_2']['mwt_values']
+        except Exception:
+            # Fallback parameters if file not found or loading fails
+            self._load_fallback_parameters()
+
+    def _load_fallback_parameters(self):
+        """Load fallback parameters if mortality file not available."""
+        # Default LP parameters
+        self.coefficients = {"LP": {"p0": 5.5876999, "p1": -0.0053480}}
+        self.mwt_values = {"LP": 0.7}
+
+    def _species_parameters(self, species_codes: Sequence[str]) -> Tuple[np.ndarray, ...]:
+        """Gather p0, p1 and MWT into arrays indexed by species id."""
+        key = tuple(species_codes)
+        arrays = self._species_arrays.get(key)
+        if arrays is None:
+            coefficients = [self.coefficients.get(code, self.coefficients['LP']) for code in key]
+            arrays = (
+                np.array([c['p0'] for c in coefficients], dtype=float),
+                np.array([c['p1'] for c in coefficients], dtype=float),
+                np.array([self.mwt_values.get(code, self.mwt_values['LP']) for code in key], dtype=float)
+            )
+            self._species_arrays[key] = arrays
+        return arrays
+
+    def calculate_background_rate_array(self, dbh: np.ndarray, species_id: np.ndarray,
+                                        species_codes: Sequence[str] = ("LP",),
+                                        years: float = 5) -> np.ndarray:
+        """Calculate background mortality rates for a cycle.
+
+        Uses equation 5.0.1: RI = 1 / (1 + exp(p0 + p1 * DBH))
+        adjusted to the cycle with equation 5.0.2: RIP = 1 - (1 - RI)^Y
+
+        Args:
+            dbh: Diameter at breast height of each record (inches)
+            species_id: Index of each record's species in species_codes
+            species_codes: Species codes indexed by species_id
+            years: Length of the cycle (years)
+
+        Returns:
+            Proportion of each record dying during the cycle
+        """
+        p0, p1, _ = self._species_parameters(species_codes)
+        species_id = np.asarray(species_id, dtype=int)
+        ri = 1.0 / (1.0 + np.exp(p0[species_id] + p1[species_id] * np.asarray(dbh, dtype=float)))
+        return 1.0 - (1.0 - ri) ** years
+
+    def calculate_dispersal_rate_array(self, pct: np.ndarray, species_id: np.ndarray,
+                                       species_codes: Sequence[str] = ("LP",)) -> np.ndarray:
+        """Calculate the per-pass mortality rate used to disperse stand mortality.
+
+        Uses equation 5.0.3: MR = 0.84525 - 0.01074 * PCT + 0.0000002 * PCT^3
+        (bounded 0.01 < MR < 1) and equation 5.0.4: MORT = MR * MWT * 0.1
+
+        Args:
+            pct: Percentile of each record in the stand basal area distribution
+            species_id: Index of each record's species in species_codes
+            species_codes: Species codes indexed by species_id
+
+        Returns:
+            Final mortality rate (MORT) of each record
+        """
+        _, _, mwt = self._species_parameters(species_codes)
+        pct = np.asarray(pct, dtype=float)
+        mr = np.clip(0.84525 - 0.01074 * pct + 0.0000002 * pct ** 3, 0.01, 1.0)
+        return mr * mwt[np.asarray(species_id, dtype=int)] * 0.1
+
+    @staticmethod
+    def calculate_sdi_array(dbh: np.ndarray, tpa: np.ndarray) -> np.ndarray:
+        """Calculate each record's contribution to stand SDI (Zeide summation).
+
+        Args:
+            dbh: Diameter at breast height of each record (inches)
+            tpa: Trees per acre represented by each record
+
+        Returns:
+            SDI of each record; stand SDI is their sum
+        """
+        return np.asarray(tpa, dtype=float) * (np.asarray(dbh, dtype=float) / 10.0) ** _SDI_EXPONENT
+
+    def calculate_target_sdi(self, sdi: np.ndarray, max_sdi: np.ndarray) -> np.ndarray:
+        """Get the stand SDI remaining after density-related mortality.
+
+        Stands above the density threshold move along a trajectory that
+        approaches SDIU * maximum SDI, losing more the denser they are.
+
+        Args:
+            sdi: Stand SDI before mortality
+            max_sdi: Maximum SDI of each stand
+
+        Returns:
+            SDI after mortality (equal to sdi below the threshold)
+        """
+        sdi = np.asarray(sdi, dtype=float)
+        lower = self.density_threshold * np.asarray(max_sdi, dtype=float)
+        span = (self.sdi_upper - self.density_threshold) * np.asarray(max_sdi, dtype=float)
+        excess = np.maximum(sdi - lower, 0.0)
+        return np.where(sdi > lower, lower + span * -np.expm1(-excess / span), sdi)
+
+    def calculate_mortality_array(self, dbh: np.ndarray, tpa: np.ndarray,
+                                  species_id: np.ndarray, stand_index: np.ndarray,
+                                  max_sdi: np.ndarray,
+                                  species_codes: Sequence[str] = ("LP",),
+                                  years: float = 5) -> np.ndarray:
+        """Calculate the trees per acre dying in each record during a cycle.
+
+        The multiple passes of the FVS dispersal step, each removing
+        TPA * MORT from every record, are solved in closed form: after k
+        passes a record keeps TPA * (1 - MORT)^k, and k is found per stand
+        with Newton's method so that the removed SDI equals the stand
+        mortality. Stand mortality is never less than background mortality.
+
+        Args:
+            dbh: Diameter at breast height of each record (inches)
+            tpa: Trees per acre represented by each record
+            species_id: Index of each record's species in species_codes
+            stand_index: Stand position of each record (0..n_stands-1)
+            max_sdi: Maximum SDI of each stand
+            species_codes: Species codes indexed by species_id
+            years: Length of the cycle (years)
+
+        Returns:
+            Trees per acre dying in each record (never more than tpa)
+        """
+        dbh = np.asarray(dbh, dtype=float)
+        tpa = np.asarray(tpa, dtype=float)
+        species_id = np.asarray(species_id, dtype=int)
+        stand_index = np.asarray(stand_index, dtype=int)
+        max_sdi = np.asarray(max_sdi, dtype=float)
+        n_stands = len(max_sdi)
+        if not dbh.size:
+            return np.zeros(0)
+
+        # Stand mortality in SDI units
+        tree_sdi = self.calculate_sdi_array(dbh, tpa)
+        background = tpa * self.calculate_background_rate_array(dbh, species_id, species_codes, years)
+        stand_sdi = np.bincount(stand_index, tree_sdi, n_stands)
+        background_sdi = np.bincount(stand_index, background * (dbh / 10.0) ** _SDI_EXPONENT, n_stands)
+        removal = stand_sdi - self.calculate_target_sdi(stand_sdi, max_sdi)
+        density = removal > background_sdi
+        if not np.any(density):
+            return background
+
+        # Percentile of each record in its stand's basal area distribution
+        tree_ba = math.pi * (dbh / 24) ** 2 * tpa
+        order = np.lexsort((dbh, stand_index))
+        ba_cum = np.cumsum(tree_ba[order])
+        counts = np.bincount(stand_index, minlength=n_stands)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        seg = stand_index[order]
+        ba_before = np.where(starts[seg] > 0, ba_cum[starts[seg] - 1], 0.0)
+        stand_ba = np.bincount(stand_index, tree_ba, n_stands)
+        pct = np.empty(len(dbh))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct[order] = np.where(stand_ba[seg] > 0, 100.0 * (ba_cum - ba_before) / stand_ba[seg], 100.0)
+
+        mort = self.calculate_dispersal_rate_array(pct, species_id, species_codes)
+        log_keep = np.log1p(-mort)
+
+        # Newton's method on the concave removed-SDI curve converges from below
+        passes = np.zeros(n_stands)
+        active = density.copy()
+        for _ in range(_MAX_ITERATIONS):
+            keep = np.exp(passes[stand_index] * log_keep)
+            removed = np.bincount(stand_index, tree_sdi * (1.0 - keep), n_stands)
+            slope = np.bincount(stand_index, -tree_sdi * keep * log_keep, n_stands)
+            shortfall = removal - removed
+            active &= (shortfall > _TOLERANCE * np.maximum(removal, 1.0)) & (slope > 0)
+            if not np.any(active):
+                break
+            passes = np.where(active, passes + shortfall / np.where(slope > 0, slope, 1.0), passes)
+
+        killed = tpa * -np.expm1(passes[stand_index] * log_keep)
+        return np.where(density[stand_index], killed, background)
+
+
+# Shared model instance
+_mortality_model: Optional[SDIMortalityModel] = None
+
+
+def get_mortality_model() -> SDIMortalityModel:
+    """Get the shared SDI mortality model, loading it on first use.
+
+    Returns:
+        SDIMortalityModel instance shared by all callers
+    """
+    global _mortality_model
+    if _mortality_model is None:
+        _mortality_model = SDIMortalityModel()
+    return _mortality_model
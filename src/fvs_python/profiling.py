@@ -0,0 +1,242 @@
+"""
+Profilers for diagnosing slow simulations from the command line.
+Wraps a call in a deterministic (cProfile) or sampling profiler and writes
+a sorted text summary plus a collapsed-stack file for flame graphs.
+
+Collapsed stacks use the folded format read by flamegraph.pl, speedscope
+and inferno: one line per stack, frames joined by ';', followed by a count.
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+PROFILERS = ('deterministic', 'sampling')
+
+# Deepest call path followed when folding cProfile statistics
+_MAX_DEPTH = 200
+
+
+def _frame_label(filename: str, lineno: int, funcname: str) -> str:
+    """Format a function as a flame graph frame name."""
+    if filename == '~':
+        # Built-in functions have no source file
+        label = funcname
+    else:
+        label = f"{funcname} ({os.path.basename(filename)}:{lineno})"
+    # ';' separates frames in a collapsed stack
+    return label.replace(';', ',')
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling every thread's stack at an interval.
+
+    A daemon thread reads sys._current_frames() every `interval` seconds
+    and counts each distinct stack. The overhead does not depend on how
+    many calls the profiled code makes, so it suits long simulations that
+    cProfile would slow down too much.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """Create the profiler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='fvs-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(_frame_label(code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)).replace(';', ','))
+                self.stacks[';'.join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> Dict[str, int]:
+        """Get sample counts per collapsed stack."""
+        return dict(self.stacks)
+
+    def summary(self, limit: int = 40) -> str:
+        """Format the functions seen most often as a text table.
+
+        Args:
+            limit: Maximum number of functions listed
+
+        Returns:
+            Table sorted by inclusive samples, with own (leaf) samples
+        """
+        inclusive: Counter = Counter()
+        own: Counter = Counter()
+        for stack, count in self.stacks.items():
+            # Skip the thread name at the root of each stack
+            frames = stack.split(';')[1:]
+            for frame in set(frames):
+                inclusive[frame] += count
+            if frames:
+                own[frames[-1]] += count
+
+        total = max(sum(self.stacks.values()), 1)
+        lines = [
+            f"{self.samples} samples at {1000.0 * self.interval:g} ms intervals",
+            '',
+            f"{'total':>8}{'total %':>9}{'own':>8}{'own %':>8}  function"
+        ]
+        for frame, count in inclusive.most_common(limit):
+            lines.append(
+                f"{count:>8}{100.0 * count / total:>8.1f}%{own[frame]:>8}"
+                f"{100.0 * own[frame] / total:>7.1f}%  {frame}"
+            )
+        return '\n'.join(lines)
+
+
+def fold_stats(stats: pstats.Stats) -> Dict[str, int]:
+    """Fold cProfile statistics into collapsed stacks.
+
+    cProfile records caller/callee pairs rather than whole stacks, so each
+    function's own time is split across the paths reaching it in proportion
+    to the time each caller spent in it. The result is an approximation
+    that is exact for functions called from a single place.
+
+    Args:
+        stats: Profile statistics
+
+    Returns:
+        Dictionary mapping collapsed stack to own time in microseconds
+    """
+    raw = stats.stats
+    children: Dict[Tuple, Dict[Tuple, float]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, {})[func] = edge[3]
+
+    folded: Counter = Counter()
+
+    def descend(func, path, share, seen):
+        # share: fraction of func's cumulative time reached through this path
+        _, _, own_time, cumulative, _ = raw[func]
+        stack = path + (_frame_label(*func),)
+        own_us = int(round(own_time * share * 1e6))
+        if own_us:
+            folded[';'.join(stack)] += own_us
+        if len(stack) >= _MAX_DEPTH:
+            return
+        for child, edge_time in children.get(func, {}).items():
+            child_cumulative = raw[child][3]
+            if child in seen or child_cumulative <= 0:
+                continue
+            child_share = edge_time * share / child_cumulative
+            # Prune paths too small to show up in a flame graph
+            if child_share * child_cumulative < 1e-6:
+                continue
+            descend(child, stack, child_share, seen | {child})
+
+    # Functions without callers are where profiling began
+    for root, entry in raw.items():
+        if not entry[4]:
+            descend(root, (), 1.0, {root})
+    return dict(folded)
+
+
+def write_collapsed(stacks: Dict[str, int], path: Path):
+    """Write collapsed stacks, one 'frame;frame;... count' line each.
+
+    Args:
+        stacks: Count per collapsed stack
+        path: Output file
+    """
+    with open(path, 'w') as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+
+def profile_call(func: Callable[[], Any], output_prefix: Path,
+                 profiler: str = 'deterministic', interval: float = 0.005,
+                 sort: str = 'cumulative', limit: int = 40) -> Tuple[Any, Dict[str, Path]]:
+    """Run a function under a profiler and write its reports.
+
+    Writes <prefix>.txt (sorted text summary) and <prefix>.collapsed
+    (flame graph input); the deterministic profiler also writes the raw
+    statistics to <prefix>.prof for tools such as snakeviz.
+
+    Args:
+        func: Function to profile, called without arguments
+        output_prefix: Path of the report files without extension
+        profiler: 'deterministic' (cProfile) or 'sampling'
+        interval: Seconds between samples for the sampling profiler
+        sort: pstats sort key for the deterministic summary
+        limit: Number of functions in the text summary
+
+    Returns:
+        Tuple of (func's return value, dictionary of written file paths)
+
+    Raises:
+        ValueError: If the profiler is unknown
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler: {profiler}. Use one of {PROFILERS}")
+
+    output_prefix = Path(output_prefix)
+    output_prefix.parent.mkdir(parents=True, exist_ok=True)
+    files = {
+        'summary': Path(f"{output_prefix}.txt"),
+        'collapsed': Path(f"{output_prefix}.collapsed")
+    }
+
+    start = time.perf_counter()
+    if profiler == 'deterministic':
+        profile = cProfile.Profile()
+        try:
+            result = profile.runcall(func)
+        finally:
+            elapsed = time.perf_counter() - start
+            files['stats'] = Path(f"{output_prefix}.prof")
+            profile.dump_stats(files['stats'])
+            buffer = io.StringIO()
+            stats = pstats.Stats(profile, stream=buffer)
+            stats.sort_stats(sort).print_stats(limit)
+            files['summary'].write_text(f"Wall time: {elapsed:.3f} s\n{buffer.getvalue()}")
+            write_collapsed(fold_stats(stats), files['collapsed'])
+    else:
+        sampler = SamplingProfiler(interval)
+        sampler.start()
+        try:
+            result = func()
+        finally:
+            sampler.stop()
+            elapsed = time.perf_counter() - start
+            files['summary'].write_text(f"Wall time: {elapsed:.3f} s\n{sampler.summary(limit)}\n")
+            write_collapsed(sampler.collapsed(), files['collapsed'])
+    return result, files
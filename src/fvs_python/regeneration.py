@@ -0,0 +1,116 @@
+"""
+Regeneration model for FVS-Python.
+Implements the establishment part of the SN partial establishment model
+(section 6.0): seedling cohorts brought into a stand by planting or natural
+regeneration, with heights from the small-tree height growth equation and
+the species' minimum and maximum seedling heights (table 6.0.1).
+
+Heights are computed for whole arrays of cohorts so that Stand and
+StandBatch can insert the new records in bulk.
+"""
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+from .config_loader import get_config_loader
+
+
+# Default Chapman-Richards small-tree coefficients (growth_model_parameters.yaml)
+_DEFAULT_SMALL_TREE = {'c1': 1.1421, 'c2': 1.0042, 'c3': -0.0374, 'c4': 0.7632, 'c5': 0.0358}
+
+
+class RegenerationModel:
+    """Seedling establishment following the SN partial establishment model.
+
+    A cohort established `age` years before the end of a cycle gets the
+    small-tree height at that age, bounded by the species' minimum and
+    maximum seedling heights. FVS estimates heights at age 5 and grows them
+    to the end of the cycle, so the default age is 5.
+    """
+
+    def __init__(self):
+        """Initialize with species parameters from configuration."""
+        self._species_arrays: Dict[Tuple[str, ...], Tuple[np.ndarray, ...]] = {}
+        self._load_parameters()
+
+    def _load_parameters(self):
+        """Load regeneration and small-tree parameters from configuration."""
+        try:
+            loader = get_config_loader()
+            regeneration_file = loader.cfg_dir / "sn_regeneration_model.json"
+            regeneration_data = loader._load_config_file(regeneration_file)
+            self.parameters = regeneration_data['tables']['table_6_0_1']['parameters']
+        except Exception:
+            # Fallback parameters if file not found or loading fails
+            self._load_fallback_parameters()
+
+        try:
+            loader = get_config_loader()
+            growth_params = loader._load_config_file(loader.cfg_dir / 'growth_model_parameters.yaml')
+            self.small_tree_coefficients = growth_params.get('small_tree_growth', {})
+        except Exception:
+            self.small_tree_coefficients = {}
+
+    def _load_fallback_parameters(self):
+        """Load fallback parameters if regeneration file not available."""
+        # Default LP parameters
+        self.parameters = {
+            "LP": {"sprouting": False, "min_bud_width": 0.5, "min_height": 4.7, "max_height": 20}
+        }
+
+    def _species_parameters(self, species_codes: Sequence[str]) -> Tuple[np.ndarray, ...]:
+        """Gather height bounds and Chapman-Richards coefficients by species id."""
+        key = tuple(species_codes)
+        arrays = self._species_arrays.get(key)
+        if arrays is None:
+            default_small = self.small_tree_coefficients.get('default', _DEFAULT_SMALL_TREE)
+            parameters = [self.parameters.get(code, self.parameters['LP']) for code in key]
+            small = [self.small_tree_coefficients.get(code, default_small) for code in key]
+            arrays = (
+                np.array([p['min_height'] for p in parameters], dtype=float),
+                np.array([p['max_height'] for p in parameters], dtype=float),
+                *(np.array([c[name] for c in small], dtype=float)
+                  for name in ('c1', 'c2', 'c3', 'c4', 'c5'))
+            )
+            self._species_arrays[key] = arrays
+        return arrays
+
+    def calculate_seedling_height_array(self, species_id: np.ndarray, site_index: np.ndarray,
+                                        age: np.ndarray,
+                                        species_codes: Sequence[str] = ("LP",)) -> np.ndarray:
+        """Calculate the height of newly established seedlings.
+
+        Uses the small-tree Chapman-Richards equation
+        H = c1 * SI^c2 * (1 - exp(c3 * age))^(c4 * SI^c5),
+        bounded to the species' seedling height range (table 6.0.1).
+
+        Args:
+            species_id: Index of each cohort's species in species_codes
+            site_index: Site index of each cohort's stand (base age 25) in feet
+            age: Years since establishment of each cohort
+            species_codes: Species codes indexed by species_id
+
+        Returns:
+            Seedling height of each cohort (feet)
+        """
+        min_height, max_height, c1, c2, c3, c4, c5 = self._species_parameters(species_codes)
+        sid = np.asarray(species_id, dtype=int)
+        site_index = np.asarray(site_index, dtype=float)
+        age = np.maximum(np.asarray(age, dtype=float), 0.0)
+        height = (c1[sid] * site_index ** c2[sid] *
+                  (1.0 - np.exp(c3[sid] * age)) ** (c4[sid] * site_index ** c5[sid]))
+        return np.clip(height, min_height[sid], max_height[sid])
+
+
+# Shared model instance
+_regeneration_model: Optional[RegenerationModel] = None
+
+
+def get_regeneration_model() -> RegenerationModel:
+    """Get the shared regeneration model, loading it on first use.
+
+    Returns:
+        RegenerationModel instance shared by all callers
+    """
+    global _regeneration_model
+    if _regeneration_model is None:
+        _regeneration_model = RegenerationModel()
+    return _regeneration_model
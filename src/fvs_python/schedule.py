@@ -0,0 +1,300 @@
+"""
+Management schedules for FVS-Python simulations.
+Compiles a scenario's activities (thinnings, planting, ingrowth) and its
+output requests (reporting cycles, volume computation points) into a
+per-cycle event table before the simulation starts.
+
+The simulation loop then only dispatches the events due in each cycle and
+computes metrics and volume only where output is requested. Activities of
+many stands that fall in the same cycle are merged into one event, so a
+StandBatch applies them in a single array operation.
+
+A schedule is a dictionary::
+
+    {
+        'events': [
+            {'type': 'thin', 'age': 15, 'residual': 80, 'target': 'basal_area', 'method': 'below'},
+            {'type': 'plant', 'age': 30, 'trees_per_acre': 300, 'species': 'LP', 'seedling_age': 1},
+            {'type': 'ingrowth', 'every': 10, 'start': 10, 'trees_per_acre': 20},
+        ],
+        'report': 10,         # report every 10 years (or a list of ages; None: every cycle)
+        'volume': [0, 50],    # compute volume at these reported ages (None: every reported age)
+    }
+
+Events happen at an 'age' (or list of ages), or 'every' N years from 'start'
+to 'end'. Thinnings take 'residual', 'target', 'method', 'min_dbh' and
+'max_dbh' (see StandBatch.thin); planting and ingrowth take
+'trees_per_acre', 'species', 'seedling_age', 'height' and 'records' (see
+StandBatch.add_regeneration).
+"""
+import math
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .thinning import THINNING_METHODS, THINNING_TARGETS
+
+
+EVENT_TYPES = ('thin', 'plant', 'ingrowth')
+
+# Keys of the removals added to reported metrics when a schedule thins
+HARVEST_KEYS = ('removed_tpa', 'removed_basal_area', 'removed_volume')
+
+
+class ScheduledEvent:
+    """One dispatch of a compiled schedule.
+
+    Attributes:
+        action: 'thin' or 'regenerate'
+        stands: Stand positions the event applies to
+        params: Keyword arguments of the action. Thinning residuals hold one
+                value per stand of the run (np.inf for stands not thinned);
+                regeneration arguments hold one value per cohort.
+    """
+
+    __slots__ = ('action', 'stands', 'params')
+
+    def __init__(self, action: str, stands: np.ndarray, params: Dict[str, Any]):
+        self.action = action
+        self.stands = stands
+        self.params = params
+
+    def __repr__(self):
+        return f"ScheduledEvent({self.action!r}, stands={self.stands.tolist()})"
+
+
+class CompiledSchedule:
+    """Per-cycle event table of a simulation.
+
+    Cycle 0 is the initial state; cycle c ends at age c * time_step.
+    Events of a cycle are applied after its growth, before its output.
+
+    Attributes:
+        time_step: Years per cycle
+        n_cycles: Number of growth cycles
+        events: List of ScheduledEvent lists, one per cycle (0..n_cycles)
+        report: Boolean array, whether metrics are output for each cycle
+        volume: Boolean array, whether volume is computed for each cycle
+        thins: Whether any event thins, so reported metrics carry removals
+    """
+
+    def __init__(self, time_step: int, n_cycles: int, events: List[List[ScheduledEvent]],
+                 report: np.ndarray, volume: np.ndarray):
+        self.time_step = time_step
+        self.n_cycles = n_cycles
+        self.events = events
+        self.report = report
+        self.volume = volume
+        self.thins = any(event.action == 'thin' for cycle in events for event in cycle)
+
+    @property
+    def ages(self) -> np.ndarray:
+        """Stand age at the end of each cycle."""
+        return np.arange(self.n_cycles + 1) * self.time_step
+
+
+def _scheduled_ages(spec: Any, ages: np.ndarray, default: np.ndarray) -> np.ndarray:
+    """Resolve an age specification into a boolean mask over cycle ages.
+
+    Args:
+        spec: None (use default), True/False (all/no cycles), an interval in
+              years (ages divisible by it), a list of ages, or a dictionary
+              with 'age' (age or list of ages) or 'every' plus optional
+              'start' and 'end'
+        ages: Stand age at the end of each cycle
+        default: Mask used when spec is None
+
+    Returns:
+        Boolean mask with one entry per cycle. Ages between cycle ends fall
+        in the cycle that contains them.
+    """
+    if spec is None:
+        return default.copy()
+    if isinstance(spec, bool):
+        return np.full(len(ages), spec)
+    if isinstance(spec, dict):
+        if 'age' in spec:
+            spec = np.atleast_1d(spec['age'])
+        else:
+            every = spec['every']
+            start = spec.get('start', every)
+            end = spec.get('end', ages[-1])
+            spec = np.arange(start, end + 1, every)
+    elif np.isscalar(spec):
+        if spec <= 0:
+            raise ValueError(f"Interval must be positive, got {spec}")
+        return ages % spec == 0
+
+    time_step = ages[1] - ages[0] if len(ages) > 1 else 1
+    cycles = np.ceil(np.asarray(spec, dtype=float) / time_step).astype(int)
+    mask = np.zeros(len(ages), dtype=bool)
+    mask[cycles[(cycles >= 0) & (cycles < len(ages))]] = True
+    return mask
+
+
+def _event_cycles(event: Dict[str, Any], ages: np.ndarray) -> np.ndarray:
+    """Get the cycles in which an event is applied."""
+    if 'age' not in event and 'every' not in event:
+        raise ValueError(f"Scheduled event needs an 'age' or 'every': {event}")
+    spec = {key: event[key] for key in ('age', 'every', 'start', 'end') if key in event}
+    return np.flatnonzero(_scheduled_ages(spec, ages, np.zeros(len(ages), dtype=bool)))
+
+
+def _validate_event(event: Dict[str, Any]):
+    """Check an event's type and thinning options.
+
+    Raises:
+        ValueError: If the event type, thinning method or target is unknown
+    """
+    event_type = event.get('type')
+    if event_type not in EVENT_TYPES:
+        raise ValueError(f"Unknown event type: {event_type}. Use one of {EVENT_TYPES}")
+    if event_type == 'thin':
+        if 'residual' not in event:
+            raise ValueError(f"Thinning needs a 'residual': {event}")
+        if event.get('method', 'below') not in THINNING_METHODS:
+            raise ValueError(f"Unknown thinning method: {event['method']}. Use one of {THINNING_METHODS}")
+        if event.get('target', 'basal_area') not in THINNING_TARGETS:
+            raise ValueError(f"Unknown thinning target: {event['target']}. Use one of {THINNING_TARGETS}")
+
+
+def compile_schedule(schedule: Optional[Dict[str, Any]], years: int, time_step: int,
+                     n_stands: int = 1,
+                     stand_events: Optional[Sequence[Optional[Sequence[Dict[str, Any]]]]] = None
+                     ) -> CompiledSchedule:
+    """Compile a management schedule into a per-cycle event table.
+
+    Args:
+        schedule: Schedule dictionary with optional 'events', 'report' and
+                  'volume' (see module docstring), or None for no events
+                  and output every cycle
+        years: Simulation length
+        time_step: Years per cycle
+        n_stands: Number of stands simulated together
+        stand_events: Optional extra events for each stand, e.g. from the
+                      'events' of batch scenarios
+
+    Returns:
+        CompiledSchedule for the run
+
+    Raises:
+        ValueError: If an event is invalid
+    """
+    schedule = schedule or {}
+    ages = np.arange(len(range(0, years + 1, time_step))) * time_step
+    n_cycles = len(ages) - 1
+
+    report = _scheduled_ages(schedule.get('report'), ages, np.ones(len(ages), dtype=bool))
+    volume = report & _scheduled_ages(schedule.get('volume'), ages, report)
+
+    # Schedule-wide events apply to all stands, scenario events to one
+    all_stands = np.arange(n_stands)
+    entries: List[Tuple[np.ndarray, Dict[str, Any]]] = [
+        (all_stands, event) for event in schedule.get('events', [])
+    ]
+    for stand, events in enumerate(stand_events or []):
+        entries.extend((all_stands[stand:stand + 1], event) for event in events or [])
+
+    # Merge events of the same cycle and kind into one dispatch
+    thinnings: Dict[Tuple, np.ndarray] = {}
+    cohorts: Dict[Tuple, Dict[str, list]] = {}
+    for stands, event in entries:
+        _validate_event(event)
+        for cycle in _event_cycles(event, ages):
+            if event['type'] == 'thin':
+                key = (cycle, event.get('target', 'basal_area'), event.get('method', 'below'),
+                       event.get('min_dbh', 0.0), event.get('max_dbh', math.inf))
+                residual = thinnings.setdefault(key, np.full(n_stands, np.inf))
+                residual[stands] = np.minimum(residual[stands], event['residual'])
+            else:
+                key = (cycle, event.get('height') is None)
+                cohort = cohorts.setdefault(key, {name: [] for name in
+                                                  ('stand', 'trees_per_acre', 'species',
+                                                   'age', 'height', 'records')})
+                n = len(stands)
+                cohort['stand'].append(stands)
+                cohort['trees_per_acre'].append(np.full(n, float(event['trees_per_acre'])))
+                cohort['species'].extend([event.get('species')] * n)
+                cohort['age'].append(np.full(n, event.get('seedling_age', 5), dtype=int))
+                cohort['height'].append(np.full(n, event.get('height') or 0.0, dtype=float))
+                cohort['records'].extend([event.get('records')] * n)
+
+    events: List[List[ScheduledEvent]] = [[] for _ in ages]
+    for (cycle, target, method, min_dbh, max_dbh), residual in thinnings.items():
+        events[cycle].append(ScheduledEvent('thin', np.flatnonzero(np.isfinite(residual)), {
+            'residual': residual, 'target': target, 'method': method,
+            'min_dbh': min_dbh, 'max_dbh': max_dbh
+        }))
+    for (cycle, estimate_height), cohort in cohorts.items():
+        params = {
+            'trees_per_acre': np.concatenate(cohort['trees_per_acre']),
+            'species': cohort['species'],
+            'age': np.concatenate(cohort['age']),
+            'height': None if estimate_height else np.concatenate(cohort['height']),
+            'records': cohort['records']
+        }
+        events[cycle].append(ScheduledEvent('regenerate', np.concatenate(cohort['stand']), params))
+
+    return CompiledSchedule(time_step, n_cycles, events, report, volume)
+
+
+def empty_removals(n_stands: int = 1) -> Dict[str, np.ndarray]:
+    """Get removals of stands that were not thinned.
+
+    Args:
+        n_stands: Number of stands
+
+    Returns:
+        Dictionary of HARVEST_KEYS with zero arrays
+    """
+    return {key: np.zeros(n_stands) for key in HARVEST_KEYS}
+
+
+def apply_events(stand_or_batch, events: Sequence[ScheduledEvent],
+                 removed: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+    """Apply the events of one cycle to a Stand or StandBatch.
+
+    Args:
+        stand_or_batch: Stand or StandBatch being simulated
+        events: Events due in the cycle
+        removed: Removals to add this cycle's removals to (see empty_removals)
+
+    Returns:
+        Dictionary of HARVEST_KEYS with per-stand removals (arrays for a
+        StandBatch, one-element arrays for a Stand)
+    """
+    from .stand_batch import StandBatch
+
+    is_batch = isinstance(stand_or_batch, StandBatch)
+    if removed is None:
+        removed = empty_removals(stand_or_batch.n_stands if is_batch else 1)
+
+    for event in events:
+        params = event.params
+        if event.action == 'thin':
+            if is_batch:
+                harvest = stand_or_batch.thin(params['residual'], params['target'], params['method'],
+                                              params['min_dbh'], params['max_dbh'])
+            else:
+                harvest = stand_or_batch.thin(params['residual'][0], params['target'], params['method'],
+                                              params['min_dbh'], params['max_dbh'])
+            removed['removed_tpa'] += harvest['tpa']
+            removed['removed_basal_area'] += harvest['basal_area']
+            removed['removed_volume'] += harvest['volume']
+        elif is_batch:
+            species = [code or stand_or_batch.stand_species[stand]
+                       for code, stand in zip(params['species'], event.stands)]
+            records = params['records']
+            if any(r is None for r in records):
+                records = None if all(r is None for r in records) else [
+                    r if r is not None else max(1, int(round(tpa)))
+                    for r, tpa in zip(records, params['trees_per_acre'])
+                ]
+            stand_or_batch.add_regeneration(event.stands, params['trees_per_acre'], species,
+                                            params['age'], params['height'], records)
+        else:
+            for i in range(len(event.stands)):
+                stand_or_batch.add_regeneration(
+                    params['trees_per_acre'][i], params['species'][i], int(params['age'][i]),
+                    None if params['height'] is None else float(params['height'][i])
+                )
+    return removed
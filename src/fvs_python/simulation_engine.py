@@ -6,48 +6,155 @@ import logging
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Iterator, Optional, Sequence, Union, Tuple
 import csv
 
 from .stand import Stand
+from .stand_batch import StandBatch
+from .checkpoint import CheckpointStore, run_fingerprint
+from .schedule import apply_events, compile_schedule, empty_removals
+from .tree_list import TreeListRecorder, TreeListReader
 from .tree import Tree
 from .validation import ParameterValidator
 from .logging_config import (
-    get_logger, setup_logging, log_simulation_start, 
+    get_logger, ensure_logging, log_simulation_start, 
     log_simulation_progress, SimulationLogContext
 )
 from .growth_plots import (
     plot_stand_trajectories,
     plot_size_distributions,
+    plot_tree_list_distributions,
     plot_mortality_patterns,
     plot_competition_effects,
     save_all_plots
 )
 from .data_export import DataExporter
+from .background import BackgroundWriter
+from .timing import PhaseTimer, phase, timed
 
 
 class SimulationEngine:
-    """Unified engine for running forest growth simulations."""
+    """Unified engine for running forest growth simulations.
     
-    def __init__(self, output_dir: Optional[Union[str, Path]] = None):
-        """Initialize the simulation engine.
+    An engine is a reusable session: it is opened on construction and can
+    serve any number of simulations until close() is called. It can also be
+    used as a context manager::
+    
+        with SimulationEngine(output_dir) as engine:
+            engine.simulate_stand(...)
+            engine.simulate_yield_table(...)
+    """
+    
+    def __init__(self, output_dir: Optional[Union[str, Path]] = None,
+                 background_io: bool = False,
+                 max_pending_io: int = 8):
+        """Initialize and open the simulation engine.
         
         Args:
             output_dir: Directory for saving outputs. If None, uses default.
+            background_io: Whether to run exports and plot rendering on a
+                          background worker. Call flush() or close() to wait
+                          for pending output.
+            max_pending_io: Maximum number of queued output tasks before the
+                           simulation waits for the worker
         """
         if output_dir is None:
             output_dir = Path(__file__).parent.parent.parent / 'test_output'
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True, parents=True)
-        
-        # Setup logging with structured format
-        log_file = self.output_dir / f'simulation_{datetime.now():%Y%m%d_%H%M%S}.log'
-        setup_logging(log_level='INFO', log_file=log_file, structured=True)
         self.logger = get_logger(__name__)
+        self.background_io = background_io
+        self.max_pending_io = max_pending_io
         
         # Initialize data exporter
         self.exporter = DataExporter(self.output_dir)
+        
+        # Phase timings of all simulations run by this engine (see timing.enable_timing)
+        self.timer = PhaseTimer()
+        
+        self.io_writer: Optional[BackgroundWriter] = None
+        self._is_open = False
+        self.open()
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether the engine session is open."""
+        return self._is_open
+    
+    def open(self) -> 'SimulationEngine':
+        """Open the engine session.
+        
+        Configures logging the first time any engine is opened in the process
+        (an application that calls setup_logging itself keeps its own
+        configuration) and starts the background worker if enabled. Opening
+        an open engine does nothing.
+        
+        Returns:
+            The engine itself
+        """
+        if self._is_open:
+            return self
+        
+        # Logging is process-wide, so it is configured once rather than per engine
+        ensure_logging(self.output_dir, log_level='INFO', structured=True)
+        
+        # Optional background worker for exports and plots
+        if self.background_io:
+            self.io_writer = BackgroundWriter(max_pending=self.max_pending_io)
+        
+        self._is_open = True
+        return self
+    
+    def __enter__(self) -> 'SimulationEngine':
+        return self.open()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+    
+    def _submit_io(self, func, *args, **kwargs):
+        """Run an output task, on the background worker if enabled."""
+        if self.io_writer is not None:
+            self.io_writer.submit(self._run_io, func, *args, **kwargs)
+        else:
+            self._run_io(func, *args, **kwargs)
+    
+    def _run_io(self, func, *args, **kwargs):
+        """Run an output task with export phases recorded on the engine timer."""
+        with self.timer.activate():
+            func(*args, **kwargs)
+    
+    def timing_report(self) -> Dict[str, Dict[str, float]]:
+        """Get the phase timing report of all simulations run by this engine.
+        
+        Timing must be enabled with timing.enable_timing() (or the FVS_TIMING
+        environment variable) before the simulations run.
+        
+        Returns:
+            Dictionary mapping phase name to 'calls', 'total_s' and 'mean_ms'
+        """
+        if self.io_writer is not None:
+            self.io_writer.flush()
+        return self.timer.report()
+    
+    def flush(self):
+        """Wait for all pending background exports and plots to finish."""
+        if self.io_writer is not None:
+            errors = self.io_writer.flush()
+            if errors:
+                self.logger.error(f"{len(errors)} background output task(s) failed")
+    
+    def close(self):
+        """Wait for pending output, stop the background worker and close the session.
+        
+        A closed engine can be reopened with open().
+        """
+        if self.io_writer is not None:
+            errors = self.io_writer.close()
+            if errors:
+                self.logger.error(f"{len(errors)} background output task(s) failed")
+            self.io_writer = None
+        self._is_open = False
     
     
     def simulate_stand(self, 
@@ -57,7 +164,9 @@ class SimulationEngine:
                       years: int = 50,
                       time_step: int = 5,
                       save_outputs: bool = True,
-                      plot_results: bool = True) -> pd.DataFrame:
+                      plot_results: bool = True,
+                      tree_list: bool = False,
+                      schedule: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """Run a single stand simulation.
         
         Args:
@@ -68,56 +177,40 @@ class SimulationEngine:
             time_step: Years between growth periods
             save_outputs: Whether to save results to files
             plot_results: Whether to generate plots
+            tree_list: Whether to record each cycle's trees to a tree-list
+                       file in the output directory (also enables size
+                       distribution plots)
+            schedule: Optional management schedule with thinnings, planting,
+                      ingrowth and reporting ages (see schedule.py)
             
         Returns:
             DataFrame with simulation results
         """
-        # Log simulation start with context
-        log_simulation_start(self.logger, species, years, trees_per_acre, site_index)
-        
-        # Initialize stand
-        stand = Stand.initialize_planted(
-            trees_per_acre=trees_per_acre,
-            site_index=site_index,
-            species=species
-        )
-        
         # Run simulation and collect metrics
-        metrics = self._run_growth_simulation(stand, years, time_step)
+        tree_list_path = None
+        if tree_list:
+            tree_list_path = self.output_dir / f"tree_list_{species}_TPA{trees_per_acre}_SI{int(site_index)}.bin"
+            with TreeListRecorder(tree_list_path) as recorder:
+                metrics = list(self.iter_stand_results(species, trees_per_acre, site_index,
+                                                       years, time_step, recorder=recorder,
+                                                       schedule=schedule))
+        else:
+            metrics = list(self.iter_stand_results(species, trees_per_acre, site_index,
+                                                   years, time_step, schedule=schedule))
         
         # Convert to DataFrame
         df = pd.DataFrame(metrics)
         
-        # Save outputs if requested
+        # Save outputs and plots from a copy, so caller changes to the
+        # returned frame cannot reach queued background tasks
         if save_outputs:
-            export_formats = ['csv', 'json']  # Default formats
-            exported_files = self._save_results(df, species, trees_per_acre, site_index, export_formats)
-            
-            # Create summary report
-            summary_data = {
-                'parameters': {
-                    'species': species,
-                    'trees_per_acre': trees_per_acre,
-                    'site_index': site_index,
-                    'years': years,
-                    'time_step': time_step
-                },
-                'final_metrics': df.iloc[-1].to_dict(),
-                'growth_summary': {
-                    'total_dbh_growth': df.iloc[-1]['mean_dbh'] - df.iloc[0]['mean_dbh'],
-                    'total_height_growth': df.iloc[-1]['mean_height'] - df.iloc[0]['mean_height'],
-                    'total_volume_growth': df.iloc[-1]['volume'] - df.iloc[0]['volume'],
-                    'survival_rate': df.iloc[-1]['tpa'] / df.iloc[0]['tpa']
-                },
-                'output_files': exported_files
-            }
-            
-            self.exporter.create_summary_report(summary_data, 
-                                               f"summary_{species}_TPA{trees_per_acre}_SI{int(site_index)}")
+            self._submit_io(self._write_stand_outputs, df.copy(), species,
+                            trees_per_acre, site_index, years, time_step)
         
         # Generate plots if requested
         if plot_results:
-            self._generate_plots(metrics, species, trees_per_acre, site_index)
+            self._submit_io(self._generate_plots, metrics, species, trees_per_acre,
+                            site_index, tree_list_path)
         
         self.logger.info("Simulation completed successfully")
         return df
@@ -128,7 +221,13 @@ class SimulationEngine:
                            planting_densities: List[int] = [300, 500, 700],
                            years: int = 50,
                            time_step: int = 5,
-                           save_outputs: bool = True) -> pd.DataFrame:
+                           save_outputs: bool = True,
+                           batch: bool = False,
+                           chunk_size: Optional[int] = None,
+                           checkpoint_dir: Optional[Union[str, Path]] = None,
+                           checkpoint_interval: int = 1,
+                           resume: bool = False,
+                           schedule: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """Generate yield tables for multiple scenarios.
         
         Args:
@@ -138,6 +237,12 @@ class SimulationEngine:
             years: Simulation length
             time_step: Growth period length
             save_outputs: Whether to save results
+            batch: Whether to grow all scenarios together in one StandBatch
+            chunk_size: Number of scenarios grown together in batch mode
+            checkpoint_dir: Directory for checkpoints (implies batch mode)
+            checkpoint_interval: Number of cycles between checkpoints
+            resume: Whether to resume from existing checkpoints (implies batch mode)
+            schedule: Optional management schedule applied to every scenario
             
         Returns:
             DataFrame with yield table results
@@ -145,80 +250,566 @@ class SimulationEngine:
         if isinstance(species, str):
             species = [species]
         
-        all_results = []
-        total_sims = len(species) * len(site_indices) * len(planting_densities)
-        sim_count = 0
-        
-        for sp in species:
-            for si in site_indices:
-                for tpa in planting_densities:
-                    sim_count += 1
-                    
-                    with SimulationLogContext(self.logger, species=sp, 
-                                            site_index=si, trees_per_acre=tpa):
-                        self.logger.info(f"Running yield table simulation {sim_count}/{total_sims}")
-                    
-                    # Run simulation without individual plots
-                    df = self.simulate_stand(
-                        species=sp,
-                        trees_per_acre=tpa,
-                        site_index=si,
-                        years=years,
-                        time_step=time_step,
-                        save_outputs=False,
-                        plot_results=False
-                    )
-                    
-                    # Add scenario identifiers
-                    df['species'] = sp
-                    df['site_index'] = si
-                    df['initial_tpa'] = tpa
-                    
-                    all_results.append(df)
-        
-        # Combine all results
-        yield_table = pd.concat(all_results, ignore_index=True)
+        if batch or resume or checkpoint_dir is not None:
+            yield_table = self.simulate_batch(
+                self._yield_table_scenarios(species, site_indices, planting_densities),
+                years, time_step,
+                chunk_size=chunk_size,
+                checkpoint_dir=checkpoint_dir,
+                checkpoint_interval=checkpoint_interval,
+                resume=resume,
+                schedule=schedule
+            )
+            yield_table = yield_table.drop(columns=['stand_id'])
+        else:
+            yield_table = pd.DataFrame(list(self.iter_yield_table(
+                species, site_indices, planting_densities, years, time_step, schedule=schedule
+            )))
         
         # Save if requested
         if save_outputs:
-            self.exporter.export_yield_table(yield_table, format='excel', filename='yield_table')
-            self.exporter.export_yield_table(yield_table, format='csv', filename='yield_table')
+            # Copy keeps caller changes away from queued background tasks
+            exported = yield_table.copy()
+            self._submit_io(self.exporter.export_yield_table, exported,
+                            format='excel', filename='yield_table')
+            self._submit_io(self.exporter.export_yield_table, exported,
+                            format='csv', filename='yield_table')
         
         return yield_table
     
-    def _run_growth_simulation(self, stand: Stand, years: int, time_step: int) -> List[Dict[str, Any]]:
+    def iter_yield_table(self,
+                         species: Union[str, List[str]] = 'LP',
+                         site_indices: List[float] = [60, 70, 80],
+                         planting_densities: List[int] = [300, 500, 700],
+                         years: int = 50,
+                         time_step: int = 5,
+                         batch: bool = False,
+                         chunk_size: int = 1000,
+                         seed: Optional[int] = None,
+                         schedule: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield yield table rows as they are produced.
+        
+        Each row holds the stand metrics of one scenario at one age, plus the
+        'species', 'site_index' and 'initial_tpa' of the scenario. Rows are
+        not accumulated, so the rows can be passed to a sink (see sinks.py)
+        with memory use independent of the number of scenarios.
+        
+        Args:
+            species: Species code(s) to simulate
+            site_indices: List of site indices to test
+            planting_densities: List of initial TPAs to test
+            years: Simulation length
+            time_step: Growth period length
+            batch: Whether to grow scenarios together in StandBatch chunks
+            chunk_size: Number of scenarios grown together in batch mode
+            seed: Random seed for batch mode
+            schedule: Optional management schedule applied to every scenario
+            
+        Yields:
+            Dictionary of metrics for one scenario and age
+        """
+        if isinstance(species, str):
+            species = [species]
+        scenarios = self._yield_table_scenarios(species, site_indices, planting_densities)
+        
+        if batch:
+            for row in self.iter_batch_results(scenarios, years, time_step, seed=seed,
+                                               chunk_size=chunk_size, schedule=schedule):
+                del row['stand_id']
+                yield row
+            return
+        
+        for sim_count, scenario in enumerate(scenarios, start=1):
+            sp = scenario['species']
+            si = scenario['site_index']
+            tpa = scenario['trees_per_acre']
+            
+            with SimulationLogContext(self.logger, species=sp,
+                                    site_index=si, trees_per_acre=tpa):
+                self.logger.info(f"Running yield table simulation {sim_count}/{len(scenarios)}")
+            
+            for metrics in self.iter_stand_results(sp, tpa, si, years, time_step,
+                                                   schedule=schedule):
+                metrics.update({'species': sp, 'site_index': si, 'initial_tpa': tpa})
+                yield metrics
+    
+    def iter_stand_results(self,
+                           species: str = 'LP',
+                           trees_per_acre: int = 500,
+                           site_index: float = 70,
+                           years: int = 50,
+                           time_step: int = 5,
+                           recorder: Optional[TreeListRecorder] = None,
+                           stand_id: int = 0,
+                           schedule: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the metrics of a single stand simulation cycle by cycle.
+        
+        Args:
+            species: Species code
+            trees_per_acre: Initial planting density
+            site_index: Site index (base age 25) in feet
+            years: Total simulation length in years
+            time_step: Years between growth periods
+            recorder: Optional tree-list recorder receiving each reported cycle's trees
+            stand_id: Stand identifier used in the tree list
+            schedule: Optional management schedule (see schedule.py)
+            
+        Yields:
+            Stand metrics dictionary for each reported age
+        """
+        log_simulation_start(self.logger, species, years, trees_per_acre, site_index)
+        
+        stand = Stand.initialize_planted(
+            trees_per_acre=trees_per_acre,
+            site_index=site_index,
+            species=species
+        )
+        yield from self._iter_growth_simulation(stand, years, time_step, recorder, stand_id,
+                                                schedule)
+    
+    def iter_batch_results(self,
+                           scenarios: List[Dict[str, Any]],
+                           years: int = 50,
+                           time_step: int = 5,
+                           seed: Optional[int] = None,
+                           chunk_size: int = 1000,
+                           checkpoint_dir: Optional[Union[str, Path]] = None,
+                           checkpoint_interval: int = 1,
+                           resume: bool = False,
+                           recorder: Optional[TreeListRecorder] = None,
+                           schedule: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Yield per-cycle, per-stand metric rows of a batch simulation.
+        
+        Scenarios are grown in StandBatch chunks of chunk_size stands, and
+        the rows of each cycle are yielded as soon as the cycle finishes, so
+        memory use depends on chunk_size rather than on the number of stands.
+        Arguments match simulate_batch.
+        
+        Yields:
+            Dictionary of metrics for one stand and age, including the
+            'stand_id', 'species', 'site_index' and 'initial_tpa' of the stand
+        """
+        self.logger.info(f"Streaming batch simulation of {len(scenarios)} stands for {years} years")
+        chunks, store = self._prepare_batch_run(scenarios, years, time_step, seed, chunk_size,
+                                                checkpoint_dir, resume, schedule)
+        
+        for chunk_number, (chunk, chunk_seed) in enumerate(chunks):
+            identifiers = [
+                {
+                    'stand_id': scenario['stand_id'],
+                    'species': scenario.get('species', 'LP'),
+                    'site_index': scenario.get('site_index', 70),
+                    'initial_tpa': scenario.get('trees_per_acre', 500)
+                }
+                for scenario in chunk
+            ]
+            for metrics in self._iter_batch_chunk(chunk, chunk_number, chunk_seed, years,
+                                                  time_step, store, checkpoint_interval,
+                                                  recorder, schedule):
+                columns = {key: values.tolist() for key, values in metrics.items()}
+                for i, stand in enumerate(identifiers):
+                    row = {key: values[i] for key, values in columns.items()}
+                    row.update(stand)
+                    yield row
+    
+    def simulate_batch(self,
+                       scenarios: List[Dict[str, Any]],
+                       years: int = 50,
+                       time_step: int = 5,
+                       seed: Optional[int] = None,
+                       chunk_size: Optional[int] = None,
+                       checkpoint_dir: Optional[Union[str, Path]] = None,
+                       checkpoint_interval: int = 1,
+                       resume: bool = False,
+                       recorder: Optional[TreeListRecorder] = None,
+                       schedule: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Simulate many stands together in one vectorized batch.
+        
+        All stands are packed into a single StandBatch so that growth and
+        mortality run once per cycle for the whole batch. This is much faster
+        than simulate_stand when there are many small stands.
+        
+        With a checkpoint directory, the state of each chunk (tree arrays,
+        stand ages, RNG state) and its completed results are saved every
+        checkpoint_interval cycles. A run with resume=True skips chunks that
+        already finished and continues unfinished chunks from their last
+        checkpoint, giving the same results as an uninterrupted run.
+        
+        Args:
+            scenarios: List of scenario dictionaries with keys 'species',
+                      'trees_per_acre', 'site_index' and optionally 'stand_id'
+                      and 'events' (management events of that stand only)
+            years: Simulation length
+            time_step: Growth period length
+            seed: Random seed for planting variation and mortality
+            chunk_size: Number of stands grown together. If None, all stands
+                       form one chunk. Each chunk uses its own child seed.
+            checkpoint_dir: Directory for checkpoints. Defaults to
+                           output_dir/checkpoints when resume is True.
+            checkpoint_interval: Number of cycles between checkpoints
+            resume: Whether to continue from existing checkpoints
+            recorder: Optional tree-list recorder receiving each reported
+                     cycle's trees (stand ids must be integers)
+            schedule: Optional management schedule applied to every stand,
+                      compiled once per chunk (see schedule.py)
+            
+        Returns:
+            DataFrame with one row per stand and period, including the
+            'stand_id', 'species', 'site_index' and 'initial_tpa' of each stand
+        """
+        self.logger.info(f"Running batch simulation of {len(scenarios)} stands for {years} years")
+        
+        chunks, store = self._prepare_batch_run(scenarios, years, time_step, seed, chunk_size,
+                                                checkpoint_dir, resume, schedule)
+        
+        frames = []
+        for chunk_number, (chunk, chunk_seed) in enumerate(chunks):
+            metrics = list(self._iter_batch_chunk(chunk, chunk_number, chunk_seed, years,
+                                                  time_step, store, checkpoint_interval,
+                                                  recorder, schedule))
+            
+            # Order rows by stand, then age, as simulate_yield_table does
+            columns = {key: np.stack([m[key] for m in metrics], axis=1).ravel()
+                       for key in metrics[0]}
+            identifiers = {
+                'stand_id': [scenario['stand_id'] for scenario in chunk],
+                'species': [scenario.get('species', 'LP') for scenario in chunk],
+                'site_index': [scenario.get('site_index', 70) for scenario in chunk],
+                'initial_tpa': [scenario.get('trees_per_acre', 500) for scenario in chunk]
+            }
+            for key, values in identifiers.items():
+                columns[key] = pd.Series(values).repeat(len(metrics)).to_numpy()
+            frames.append(pd.DataFrame(columns))
+        
+        return pd.concat(frames, ignore_index=True)
+    
+    def simulate_ensemble(self,
+                          species: str = 'LP',
+                          trees_per_acre: int = 500,
+                          site_index: float = 70,
+                          years: int = 50,
+                          time_step: int = 5,
+                          n_replicates: int = 100,
+                          seed: Optional[int] = None,
+                          quantiles: Sequence[float] = (0.05, 0.5, 0.95),
+                          chunk_size: Optional[int] = None,
+                          schedule: Optional[Dict[str, Any]] = None,
+                          save_outputs: bool = True) -> pd.DataFrame:
+        """Run a Monte Carlo ensemble of one stand and summarize it by age.
+        
+        Replicates differ in planting variation and mortality draws. They
+        are grown together as the stands of a StandBatch, so every cycle
+        runs once for all replicates instead of once per replicate. With
+        the SDI mortality model, set its 'stochastic' option for replicates
+        to differ in mortality as well.
+        
+        Args:
+            species: Species code
+            trees_per_acre: Initial planting density
+            site_index: Site index (base age 25) in feet
+            years: Total simulation length in years
+            time_step: Years between growth periods
+            n_replicates: Number of replicates
+            seed: Random seed of the ensemble
+            quantiles: Quantiles (0-1) to report for each metric
+            chunk_size: Number of replicates grown together. If None, all
+                       replicates form one batch.
+            schedule: Optional management schedule applied to every replicate
+            save_outputs: Whether to export the summary to CSV
+            
+        Returns:
+            DataFrame with one row per reported age: 'age', 'n_replicates'
+            and, for each stand metric, '<metric>_mean', '<metric>_std' and
+            '<metric>_q<percent>' columns (e.g. 'volume_q5', 'volume_q95')
+        """
+        if n_replicates < 1:
+            raise ValueError(f"n_replicates must be at least 1, got {n_replicates}")
+        
+        with SimulationLogContext(self.logger, species=species,
+                                  site_index=site_index, trees_per_acre=trees_per_acre):
+            self.logger.info(f"Running ensemble of {n_replicates} replicates for {years} years")
+        
+        scenario = {'species': species, 'trees_per_acre': trees_per_acre, 'site_index': site_index}
+        chunks, _ = self._prepare_batch_run([scenario] * n_replicates, years, time_step, seed,
+                                            chunk_size, None, False, schedule)
+        
+        # Metric arrays of shape (reported cycles, replicates)
+        samples: Dict[str, List[np.ndarray]] = {}
+        for chunk_number, (chunk, chunk_seed) in enumerate(chunks):
+            metrics = list(self._iter_batch_chunk(chunk, chunk_number, chunk_seed, years,
+                                                  time_step, None, 1, schedule=schedule))
+            for key in metrics[0]:
+                samples.setdefault(key, []).append(np.stack([m[key] for m in metrics]))
+        
+        summary = self._summarize_replicates(
+            {key: np.concatenate(values, axis=1) for key, values in samples.items()}, quantiles)
+        
+        if save_outputs:
+            self._submit_io(self.exporter.export_to_csv, summary.copy(),
+                            f"ensemble_{species}_TPA{trees_per_acre}_SI{int(site_index)}")
+        return summary
+    
+    @staticmethod
+    def _summarize_replicates(samples: Dict[str, np.ndarray],
+                              quantiles: Sequence[float]) -> pd.DataFrame:
+        """Reduce replicate metrics to per-age statistics.
+        
+        Args:
+            samples: Metric arrays of shape (reported cycles, replicates),
+                     including 'age'
+            quantiles: Quantiles (0-1) to report
+            
+        Returns:
+            DataFrame with one row per reported cycle
+        """
+        n_replicates = samples['age'].shape[1]
+        columns: Dict[str, np.ndarray] = {
+            'age': samples['age'][:, 0],
+            'n_replicates': np.full(len(samples['age']), n_replicates)
+        }
+        ddof = 1 if n_replicates > 1 else 0
+        for key, values in samples.items():
+            if key == 'age':
+                continue
+            values = values.astype(float)
+            columns[f"{key}_mean"] = values.mean(axis=1)
+            columns[f"{key}_std"] = values.std(axis=1, ddof=ddof)
+            if len(quantiles):
+                for q, row in zip(quantiles, np.quantile(values, quantiles, axis=1)):
+                    columns[f"{key}_q{100 * q:g}"] = row
+        return pd.DataFrame(columns)
+    
+    @staticmethod
+    def _yield_table_scenarios(species: List[str], site_indices: List[float],
+                               planting_densities: List[int]) -> List[Dict[str, Any]]:
+        """Expand yield table parameters into scenario dictionaries."""
+        return [
+            {'species': sp, 'site_index': si, 'trees_per_acre': tpa}
+            for sp in species for si in site_indices for tpa in planting_densities
+        ]
+    
+    def _prepare_batch_run(self, scenarios: List[Dict[str, Any]], years: int, time_step: int,
+                           seed: Optional[int], chunk_size: Optional[int],
+                           checkpoint_dir: Optional[Union[str, Path]],
+                           resume: bool,
+                           schedule: Optional[Dict[str, Any]] = None) -> Tuple[List[Tuple[List[Dict[str, Any]], Any]],
+                                                  Optional[CheckpointStore]]:
+        """Split scenarios into seeded chunks and open the checkpoint store.
+        
+        Returns:
+            Tuple of (list of (chunk scenarios, chunk seed), checkpoint store or None)
+        """
+        # Give every stand an identifier that is unique across chunks
+        scenarios = [
+            {**scenario, 'stand_id': scenario.get('stand_id', i)}
+            for i, scenario in enumerate(scenarios)
+        ]
+        
+        chunk_size = chunk_size or max(1, len(scenarios))
+        chunks = [scenarios[i:i + chunk_size] for i in range(0, len(scenarios), chunk_size)]
+        if len(chunks) > 1:
+            chunk_seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        else:
+            chunk_seeds = [seed]
+        
+        store = None
+        if resume and checkpoint_dir is None:
+            checkpoint_dir = self.output_dir / 'checkpoints'
+        if checkpoint_dir is not None:
+            fingerprint = run_fingerprint(scenarios, years, time_step, seed, chunk_size, schedule)
+            store = CheckpointStore(checkpoint_dir, fingerprint)
+            if not resume:
+                store.clear()
+        
+        return list(zip(chunks, chunk_seeds)), store
+    
+    def _iter_batch_chunk(self, scenarios: List[Dict[str, Any]], chunk_number: int,
+                          seed, years: int, time_step: int,
+                          store: Optional[CheckpointStore],
+                          checkpoint_interval: int,
+                          recorder: Optional[TreeListRecorder] = None,
+                          schedule: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """Grow one chunk of stands, resuming from its checkpoint if present.
+        
+        Args:
+            scenarios: Scenario dictionaries of the chunk
+            chunk_number: Position of the chunk in the run
+            seed: Seed (or SeedSequence) for the chunk
+            years: Total years to simulate
+            time_step: Years per growth period
+            store: Checkpoint store, or None to run without checkpoints
+            checkpoint_interval: Number of cycles between checkpoints.
+                                Checkpoints are only written in reported cycles.
+            recorder: Optional tree-list recorder. Cycles restored from a
+                     checkpoint are not recorded again.
+            schedule: Optional management schedule for all stands; the
+                     'events' of each scenario are added for its stand
+            
+        Yields:
+            Stand metrics dictionary (arrays over stands) for each reported cycle
+        """
+        compiled = compile_schedule(schedule, years, time_step, len(scenarios),
+                                    [scenario.get('events') for scenario in scenarios])
+        
+        checkpoint = store.load(chunk_number) if store is not None else None
+        if checkpoint is not None and checkpoint['complete']:
+            self.logger.info(f"Skipping completed chunk {chunk_number}")
+            yield from checkpoint['metrics']
+            return
+        
+        # Checkpoints hold the metrics of every finished, reported cycle of the chunk
+        if checkpoint is not None:
+            batch = checkpoint['batch']
+            metrics = checkpoint['metrics']
+            first_cycle = checkpoint['cycles'] + 1
+            self.logger.info(f"Resuming chunk {chunk_number} at age {checkpoint['cycles'] * time_step}")
+            yield from metrics
+        else:
+            with self.timer.activate(), phase('initialize'):
+                batch = StandBatch.initialize_planted(scenarios, seed=seed)
+            metrics = []
+            first_cycle = 0
+        
+        removed = empty_removals(batch.n_stands)
+        for cycle in range(first_cycle, compiled.n_cycles + 1):
+            year = cycle * time_step
+            with self.timer.activate():
+                if cycle > 0:
+                    batch.grow(years=time_step)
+                if compiled.events[cycle]:
+                    with phase('events'):
+                        removed = apply_events(batch, compiled.events[cycle], removed)
+                if not compiled.report[cycle]:
+                    continue
+                
+                current_metrics = batch.get_metrics(volume=compiled.volume[cycle])
+                if compiled.thins:
+                    current_metrics.update(removed)
+                    removed = empty_removals(batch.n_stands)
+                if recorder is not None:
+                    with phase('tree_list'):
+                        recorder.record_batch(batch, cycle=cycle)
+                
+                if cycle > 0 and year % 10 == 0:
+                    self.logger.info(f"  Age {year}: {batch.n_records} records in {batch.n_stands} stands")
+                
+                if store is not None:
+                    metrics.append(current_metrics)
+                    if 0 < cycle < compiled.n_cycles and cycle % checkpoint_interval == 0:
+                        with phase('checkpoint'):
+                            store.save(chunk_number, batch, metrics, cycles=cycle)
+            
+            yield current_metrics
+        
+        if store is not None:
+            with self.timer.activate(), phase('checkpoint'):
+                store.save(chunk_number, batch, metrics, complete=True, cycles=compiled.n_cycles)
+    
+    def _run_growth_simulation(self, stand: Stand, years: int, time_step: int,
+                               schedule: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Run the growth simulation for a stand.
         
         Args:
             stand: Stand to simulate
             years: Total years to simulate
             time_step: Years per growth period
+            schedule: Optional management schedule (see schedule.py)
             
         Returns:
             List of metrics dictionaries
         """
-        metrics = []
+        return list(self._iter_growth_simulation(stand, years, time_step, schedule=schedule))
+    
+    def _iter_growth_simulation(self, stand: Stand, years: int, time_step: int,
+                                recorder: Optional[TreeListRecorder] = None,
+                                stand_id: int = 0,
+                                schedule: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Grow a stand, yielding its metrics after each reported period.
         
-        # Collect initial metrics
-        current_metrics = stand.get_metrics()
-        metrics.append(current_metrics)
+        The schedule is compiled into a per-cycle event table up front, so
+        each cycle only dispatches its due events and skips metrics (or
+        volume) when no output is requested.
         
-        # Simulate growth
-        for year in range(time_step, years + 1, time_step):
-            # Grow stand
-            stand.grow(years=time_step)
+        Args:
+            stand: Stand to simulate
+            years: Total years to simulate
+            time_step: Years per growth period
+            recorder: Optional tree-list recorder receiving each reported cycle's trees
+            stand_id: Stand identifier used in the tree list
+            schedule: Optional management schedule (see schedule.py)
             
-            # Collect metrics
-            current_metrics = stand.get_metrics()
-            metrics.append(current_metrics)
+        Yields:
+            Metrics dictionary for each reported cycle, by default the
+            initial state and every period
+        """
+        compiled = compile_schedule(schedule, years, time_step)
+        removed = empty_removals()
+        
+        for cycle in range(compiled.n_cycles + 1):
+            year = cycle * time_step
+            # Activations must not span a yield
+            with self.timer.activate():
+                if cycle > 0:
+                    stand.grow(years=time_step)
+                if compiled.events[cycle]:
+                    with phase('events'):
+                        removed = apply_events(stand, compiled.events[cycle], removed)
+                if not compiled.report[cycle]:
+                    continue
+                
+                # Collect metrics
+                current_metrics = stand.get_metrics(volume=compiled.volume[cycle])
+                if compiled.thins:
+                    current_metrics.update({key: float(values[0]) for key, values in removed.items()})
+                    removed = empty_removals()
+                if recorder is not None:
+                    with phase('tree_list'):
+                        recorder.record_stand(stand, cycle=cycle, stand_id=stand_id)
             
             # Log progress
-            if year % 10 == 0:
+            if cycle > 0 and year % 10 == 0:
                 self.logger.info(f"  Age {year}: TPA={current_metrics['tpa']:.0f}, "
                                f"BA={current_metrics['basal_area']:.1f}, "
                                f"Volume={current_metrics['volume']:.0f}")
+            
+            yield current_metrics
+    
+    def _write_stand_outputs(self, df: pd.DataFrame, species: str, trees_per_acre: int,
+                             site_index: float, years: int, time_step: int):
+        """Export results of a single stand simulation and write its summary report.
         
-        return metrics
+        Args:
+            df: Results DataFrame
+            species: Species code
+            trees_per_acre: Initial planting density
+            site_index: Site index
+            years: Simulation length
+            time_step: Growth period length
+        """
+        export_formats = ['csv', 'json']  # Default formats
+        exported_files = self._save_results(df, species, trees_per_acre, site_index, export_formats)
+        
+        # Create summary report
+        summary_data = {
+            'parameters': {
+                'species': species,
+                'trees_per_acre': trees_per_acre,
+                'site_index': site_index,
+                'years': years,
+                'time_step': time_step
+            },
+            'final_metrics': df.iloc[-1].to_dict(),
+            'growth_summary': {
+                'total_dbh_growth': df.iloc[-1]['mean_dbh'] - df.iloc[0]['mean_dbh'],
+                'total_height_growth': df.iloc[-1]['mean_height'] - df.iloc[0]['mean_height'],
+                'total_volume_growth': df.iloc[-1]['volume'] - df.iloc[0]['volume'],
+                'survival_rate': df.iloc[-1]['tpa'] / df.iloc[0]['tpa']
+            },
+            'output_files': exported_files
+        }
+        
+        self.exporter.create_summary_report(summary_data, 
+                                           f"summary_{species}_TPA{trees_per_acre}_SI{int(site_index)}")
     
     def _save_results(self, df: pd.DataFrame, species: str, tpa: int, site_index: float, 
                      export_formats: List[str] = ['csv']):
@@ -255,8 +846,10 @@ class SimulationEngine:
         
         return exported_files
     
+    @timed('plots')
     def _generate_plots(self, metrics: List[Dict[str, Any]], 
-                       species: str, tpa: int, site_index: float):
+                       species: str, tpa: int, site_index: float,
+                       tree_list_path: Optional[Path] = None):
         """Generate visualization plots.
         
         Args:
@@ -264,6 +857,8 @@ class SimulationEngine:
             species: Species code
             tpa: Initial trees per acre
             site_index: Site index
+            tree_list_path: Tree-list file of the run, used for size
+                           distribution plots
         """
         plot_prefix = f"{species}_TPA{tpa}_SI{int(site_index)}"
         
@@ -273,13 +868,17 @@ class SimulationEngine:
             save_path=self.output_dir / f"{plot_prefix}_trajectories.png"
         )
         
-        # Size distributions at key ages
-        for age_metrics in metrics:
-            age = age_metrics['age']
-            if age in [0, 10, 25, 50]:
-                # Note: This would need access to the stand object
-                # For now, we'll skip size distribution plots
-                pass
+        # Size distributions at key ages, read back from the tree list
+        if tree_list_path is not None:
+            reader = TreeListReader(tree_list_path)
+            for cycle in reader.cycles:
+                records = reader.read(cycle=cycle)
+                age = int(records['age'][0]) if len(records) else None
+                if age in [0, 10, 25, 50]:
+                    plot_tree_list_distributions(
+                        records,
+                        save_path=self.output_dir / f"{plot_prefix}_size_distribution_age{age}.png"
+                    )
         
         # Mortality patterns
         if len(metrics) > 1:
@@ -288,41 +887,50 @@ class SimulationEngine:
                 save_path=self.output_dir / f"{plot_prefix}_mortality.png"
             )
     
-    def compare_scenarios(self, scenarios: List[Dict[str, Any]], 
-                         years: int = 50,
-                         time_step: int = 5) -> pd.DataFrame:
-        """Compare multiple simulation scenarios.
+    def iter_scenarios(self, scenarios: List[Dict[str, Any]],
+                       years: int = 50,
+                       time_step: int = 5) -> Iterator[Dict[str, Any]]:
+        """Yield comparison rows for multiple scenarios as they are produced.
         
         Args:
             scenarios: List of scenario dictionaries with keys:
                       'name', 'species', 'trees_per_acre', 'site_index'
+                      and optionally 'schedule' (see schedule.py)
             years: Simulation length
             time_step: Growth period length
             
-        Returns:
-            DataFrame with comparison results
+        Yields:
+            Stand metrics dictionary with the 'scenario' name added
         """
-        comparison_results = []
-        
         for scenario in scenarios:
             self.logger.info(f"Running scenario: {scenario['name']}")
             
-            df = self.simulate_stand(
+            for metrics in self.iter_stand_results(
                 species=scenario.get('species', 'LP'),
                 trees_per_acre=scenario.get('trees_per_acre', 500),
                 site_index=scenario.get('site_index', 70),
                 years=years,
                 time_step=time_step,
-                save_outputs=False,
-                plot_results=False
-            )
-            
-            # Add scenario name
-            df['scenario'] = scenario['name']
-            comparison_results.append(df)
+                schedule=scenario.get('schedule')
+            ):
+                metrics['scenario'] = scenario['name']
+                yield metrics
+    
+    def compare_scenarios(self, scenarios: List[Dict[str, Any]], 
+                         years: int = 50,
+                         time_step: int = 5) -> pd.DataFrame:
+        """Compare multiple simulation scenarios.
         
-        # Combine results
-        comparison_df = pd.concat(comparison_results, ignore_index=True)
+        Args:
+            scenarios: List of scenario dictionaries with keys:
+                      'name', 'species', 'trees_per_acre', 'site_index'
+            years: Simulation length
+            time_step: Growth period length
+            
+        Returns:
+            DataFrame with comparison results
+        """
+        comparison_df = pd.DataFrame(list(self.iter_scenarios(scenarios, years, time_step)))
         
         # Save comparison results
         self.exporter.export_scenario_comparison(comparison_df, format='excel')
@@ -332,6 +940,30 @@ class SimulationEngine:
 
 
 # Convenience functions for backward compatibility
+# Engines reused by the module-level convenience functions, keyed by output directory
+_default_engines: Dict[Optional[str], SimulationEngine] = {}
+
+
+def get_engine(output_dir: Optional[Union[str, Path]] = None) -> SimulationEngine:
+    """Get a shared, open engine for an output directory.
+    
+    Repeated calls with the same directory return the same engine, so
+    long-running callers do not pay engine setup costs on every simulation.
+    
+    Args:
+        output_dir: Output directory (None for the default directory)
+        
+    Returns:
+        Open SimulationEngine
+    """
+    key = None if output_dir is None else str(Path(output_dir).resolve())
+    engine = _default_engines.get(key)
+    if engine is None:
+        engine = SimulationEngine(output_dir)
+        _default_engines[key] = engine
+    return engine.open()
+
+
 def run_simulation(species: str = 'LP', 
                   trees_per_acre: int = 500,
                   site_index: float = 70,
@@ -351,7 +983,7 @@ def run_simulation(species: str = 'LP',
     Returns:
         DataFrame with results
     """
-    engine = SimulationEngine(output_dir)
+    engine = get_engine(output_dir)
     return engine.simulate_stand(
         species=species,
         trees_per_acre=trees_per_acre,
@@ -378,7 +1010,7 @@ def generate_yield_table(species: Union[str, List[str]] = 'LP',
     Returns:
         DataFrame with yield table
     """
-    engine = SimulationEngine(output_dir)
+    engine = get_engine(output_dir)
     return engine.simulate_yield_table(
         species=species,
         site_indices=site_indices,
@@ -0,0 +1,272 @@
+"""
+Result sinks for streaming simulation output.
+Sinks consume metric rows as they are produced, holding at most one
+bounded buffer of rows in memory.
+"""
+import csv
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Union
+import pandas as pd
+
+from .logging_config import get_logger
+
+
+class ResultSink(ABC):
+    """Base class for sinks consuming per-cycle, per-stand metric rows.
+
+    Rows are buffered and handed to ``_write_rows`` whenever ``buffer_size``
+    rows have accumulated, so memory use does not grow with the number of
+    stands simulated. Subclasses implement ``_write_rows``. Sinks can be
+    used as context managers.
+    """
+
+    def __init__(self, buffer_size: int = 10000):
+        """Initialize the sink.
+
+        Args:
+            buffer_size: Maximum number of rows held before writing
+        """
+        self.buffer_size = max(1, buffer_size)
+        self.rows_written = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._closed = False
+        self.logger = get_logger(__name__)
+
+    def write(self, row: Dict[str, Any]):
+        """Add one row to the sink.
+
+        Args:
+            row: Dictionary mapping column names to values
+        """
+        self._buffer.append(row)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def write_many(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Add all rows from an iterable to the sink.
+
+        Args:
+            rows: Iterable of row dictionaries (e.g. from a generator)
+
+        Returns:
+            Number of rows added
+        """
+        count = 0
+        for row in rows:
+            self.write(row)
+            count += 1
+        return count
+
+    def flush(self):
+        """Write buffered rows to the destination."""
+        if self._buffer:
+            self._write_rows(self._buffer)
+            self.rows_written += len(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        """Flush remaining rows and release resources."""
+        if not self._closed:
+            self.flush()
+            self._close()
+            self._closed = True
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        """Write one buffer of rows to the destination."""
+
+    def _close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class MemorySink(ResultSink):
+    """Sink that keeps all rows in memory.
+
+    Useful for small runs and tests; memory grows with the number of rows.
+    """
+
+    def __init__(self, buffer_size: int = 10000):
+        super().__init__(buffer_size)
+        self.rows: List[Dict[str, Any]] = []
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        self.rows.extend(rows)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Get all rows written so far as a DataFrame."""
+        self.flush()
+        return pd.DataFrame(self.rows)
+
+
+class CSVSink(ResultSink):
+    """Sink appending rows to a CSV file.
+
+    The header is written once, from the columns of the first row.
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = 10000):
+        """Initialize the CSV sink.
+
+        Args:
+            path: Output CSV file (overwritten)
+            buffer_size: Maximum number of rows held before writing
+        """
+        super().__init__(buffer_size)
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._file = open(self.path, 'w', newline='')
+        self._writer: Optional[csv.DictWriter] = None
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(rows[0].keys()))
+            self._writer.writeheader()
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def _close(self):
+        self._file.close()
+
+
+class ParquetSink(ResultSink):
+    """Sink writing rows to a Parquet file, one row group per buffer.
+
+    With partition_cols, rows are written to a partitioned dataset directory
+    instead. Requires the optional pyarrow dependency
+    (``pip install fvs-python[parquet]``).
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = 10000,
+                 compression: str = 'zstd', partition_cols: Optional[List[str]] = None):
+        """Initialize the Parquet sink.
+
+        Args:
+            path: Output Parquet file, or dataset directory when partitioned
+                  (either is replaced)
+            buffer_size: Number of rows per row group
+            compression: Parquet compression codec
+            partition_cols: Columns to partition by (e.g. ['species', 'site_index'])
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        from .data_export import ParquetDatasetWriter
+
+        super().__init__(buffer_size)
+        self.path = Path(path)
+        self._writer = ParquetDatasetWriter(self.path, compression, partition_cols)
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        self._writer.write(rows)
+
+    def _close(self):
+        self._writer.close()
+
+
+class NDJSONSink(ResultSink):
+    """Sink writing rows as newline-delimited JSON.
+
+    Uses orjson when it is installed (``pip install fvs-python[fast-json]``).
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = 10000):
+        """Initialize the NDJSON sink.
+
+        Args:
+            path: Output .ndjson file (overwritten)
+            buffer_size: Maximum number of rows held before writing
+        """
+        from .data_export import NDJSONWriter
+
+        super().__init__(buffer_size)
+        self.path = Path(path)
+        self._writer = NDJSONWriter(self.path)
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        self._writer.write_rows(rows)
+
+    def _close(self):
+        self._writer.close()
+
+
+class SQLiteSink(ResultSink):
+    """Sink inserting rows into a SQLite table.
+
+    The table is created from the columns and value types of the first row.
+    """
+
+    def __init__(self, path: Union[str, Path], table: str = 'results',
+                 buffer_size: int = 10000):
+        """Initialize the SQLite sink.
+
+        Args:
+            path: SQLite database file
+            table: Table name (replaced if it exists)
+            buffer_size: Maximum number of rows held before inserting
+        """
+        super().__init__(buffer_size)
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.table = table
+        self._connection = sqlite3.connect(str(self.path))
+        self._insert: Optional[str] = None
+        self._columns: List[str] = []
+
+    @staticmethod
+    def _column_type(value: Any) -> str:
+        if isinstance(value, (bool, int)):
+            return 'INTEGER'
+        if isinstance(value, float):
+            return 'REAL'
+        return 'TEXT'
+
+    def _write_rows(self, rows: List[Dict[str, Any]]):
+        if self._insert is None:
+            self._columns = list(rows[0].keys())
+            columns = ', '.join(f'"{c}" {self._column_type(rows[0][c])}' for c in self._columns)
+            self._connection.execute(f'DROP TABLE IF EXISTS "{self.table}"')
+            self._connection.execute(f'CREATE TABLE "{self.table}" ({columns})')
+            placeholders = ', '.join('?' for _ in self._columns)
+            self._insert = f'INSERT INTO "{self.table}" VALUES ({placeholders})'
+        self._connection.executemany(
+            self._insert, ([row.get(c) for c in self._columns] for row in rows))
+        self._connection.commit()
+
+    def _close(self):
+        self._connection.close()
+
+
+def create_sink(path: Union[str, Path], buffer_size: int = 10000) -> ResultSink:
+    """Create a sink for a file based on its extension.
+
+    Args:
+        path: Output file ending in .csv, .ndjson, .jsonl, .parquet, .db,
+              .sqlite or .sqlite3
+        buffer_size: Maximum number of rows held before writing
+
+    Returns:
+        ResultSink instance
+
+    Raises:
+        ValueError: If the extension is not supported
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix == '.csv':
+        return CSVSink(path, buffer_size)
+    elif suffix in ('.ndjson', '.jsonl'):
+        return NDJSONSink(path, buffer_size)
+    elif suffix in ('.parquet', '.pq'):
+        return ParquetSink(path, buffer_size)
+    elif suffix in ('.db', '.sqlite', '.sqlite3'):
+        return SQLiteSink(path, buffer_size=buffer_size)
+    else:
+        raise ValueError(f"Unsupported sink file type: {suffix}")
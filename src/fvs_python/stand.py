@@ -11,7 +11,12 @@ from typing import List, Optional
 from .tree import Tree
 from .config_loader import load_stand_config
 from .validation import ParameterValidator
-from .logging_config import get_logger, log_growth_summary
+from .crown_competition_factor import get_ccf_model
+from .mortality import MORTALITY_MODELS, get_mortality_model
+from .regeneration import get_regeneration_model
+from .thinning import calculate_thinning_array, tree_density_array
+from .logging_config import get_logger, log_growth_summary, log_transition_summary
+from .timing import PhaseTimer, phase
 
 class Stand:
     def __init__(self, trees: Optional[List[Tree]] = None, site_index: float = 70, species: str = 'LP'):
@@ -39,6 +44,12 @@ class Stand:
         self.age = 0
         self.species = species
         
+        # Growth model transition counts, one entry per grown cycle
+        self.transition_history: List[dict] = []
+        
+        # Phase timings of this stand (see timing.enable_timing)
+        self.timer = PhaseTimer()
+        
         # Set up logging
         self.logger = get_logger(__name__)
         
@@ -60,6 +71,9 @@ class Stand:
                 },
                 'initial_tree': {'dbh': {'mean': 0.5, 'std_dev': 0.1, 'minimum': 0.1}}
             }
+        
+        # Mortality model ('empirical' or 'sdi')
+        self.mortality_model = self.growth_params.get('mortality', {}).get('model', 'empirical')
     
     @classmethod
     def initialize_planted(cls, trees_per_acre: int, site_index: float = 70, species: str = 'LP'):
@@ -95,18 +109,54 @@ class Stand:
         initial_height = initial_params.get('height', {}).get('planted', 1.0)
         
         # Create trees with random variation
-        trees = [
-            Tree(
-                dbh=max(dbh_min, dbh_mean + random.gauss(0, dbh_sd)),
-                height=initial_height,
-                species=species,
-                age=0
-            )
-            for _ in range(trees_per_acre)
-        ]
+        trees = Tree.from_arrays(
+            dbh=[max(dbh_min, dbh_mean + random.gauss(0, dbh_sd)) for _ in range(trees_per_acre)],
+            height=initial_height,
+            species=species,
+            age=0
+        )
         
         return cls(trees, site_index, species)
     
+    def add_regeneration(self, trees_per_acre: float, species: Optional[str] = None,
+                         age: int = 5, height: Optional[float] = None) -> int:
+        """Establish a seedling cohort (planting, natural regeneration or ingrowth).
+        
+        Seedling height comes from the small-tree height equation bounded by
+        the species' seedling heights (see RegenerationModel), DBH from the
+        height-diameter equation and crown ratio from equation 4.3.3.1 with
+        the stand's CCF. The trees are created together with Tree.from_arrays.
+        
+        Args:
+            trees_per_acre: Trees per acre to establish
+            species: Species code (default: the stand's species)
+            age: Years since establishment (FVS estimates heights at age 5)
+            height: Seedling height in feet; None estimates it from age and site index
+            
+        Returns:
+            int: Number of trees added
+        """
+        from .crown_ratio import create_crown_ratio_model
+        from .height_diameter import create_height_diameter_model
+        
+        species = species or self.species
+        n = int(round(trees_per_acre))
+        if n <= 0:
+            return 0
+        
+        if height is None:
+            height = float(get_regeneration_model().calculate_seedling_height_array(
+                [0], [self.site_index], [age], [species])[0])
+        dbh = create_height_diameter_model(species).solve_dbh_from_height(height)
+        
+        # Seed from the random module so random.seed() reproduces the crown ratios
+        rng = np.random.default_rng(random.getrandbits(64))
+        crown_ratio = create_crown_ratio_model(species).predict_regeneration_crown_ratio_array(
+            np.full(n, self._calculate_ccf()), rng)
+        
+        self.trees.extend(Tree.from_arrays(np.full(n, dbh), height, species, age, crown_ratio))
+        return n
+    
     def grow(self, years=5):
         """Grow stand for specified number of years.
         
@@ -118,61 +168,138 @@ class Stand:
             years = 5 * math.ceil(years / 5)
             
         for period in range(0, years, 5):  # Step in 5-year increments
-            # Store initial metrics
-            initial_count = len(self.trees)
-            initial_metrics = self.get_metrics() if self.trees else None
-            
-            # Calculate competition metrics
+            with self.timer.activate():
+                self._grow_period(period)
+    
+    def _grow_period(self, period: int):
+        """Grow the stand through one 5-year period.
+        
+        Args:
+            period: Years since the start of the current grow() call
+        """
+        # Store initial metrics
+        initial_count = len(self.trees)
+        initial_metrics = self.get_metrics() if self.trees else None
+        
+        # Calculate competition metrics
+        with phase('competition'):
             competition_metrics = self._calculate_competition_metrics()
-            
-            # Grow each tree
+        
+        # Grow each tree, counting growth model transitions
+        small_to_blended = 0
+        blended_to_large = 0
+        with phase('growth'):
             for tree, metrics in zip(self.trees, competition_metrics):
                 tree.grow(
                     site_index=self.site_index,
                     competition_factor=metrics['competition_factor']
                 )
-            
-            # Apply mortality
+                small_to_blended += tree.last_transitions[0]
+                blended_to_large += tree.last_transitions[1]
+        
+        # Apply mortality
+        with phase('mortality'):
             mortality_count = self._apply_mortality()
-            
-            self.age += 5
-            
-            # Log growth summary
-            if initial_metrics and self.trees:
-                final_metrics = self.get_metrics()
-                dbh_growth = final_metrics['mean_dbh'] - initial_metrics['mean_dbh']
-                height_growth = final_metrics['mean_height'] - initial_metrics['mean_height']
-                log_growth_summary(self.logger, period // 5 + 1, 
-                                 dbh_growth, height_growth, mortality_count)
-    
-    def _calculate_crown_width(self, tree):
-        """Calculate maximum crown width for a tree.
         
-        Uses equation from FVS Southern Variant for loblolly pine:
-        MCW = a1 + (a2 * DBH) + (a3 * DBH^2)
-        """
-        p = self.params['crown']
-        if tree.dbh >= 5.0:
-            return p['a1'] + (p['a2'] * tree.dbh) + (p['a3'] * tree.dbh**2)
-        else:
-            # Linear interpolation for small trees
-            mcw_at_5 = p['a1'] + (p['a2'] * 5.0) + (p['a3'] * 5.0**2)
-            return mcw_at_5 * (tree.dbh / 5.0)
+        self.age += 5
+        
+        self.transition_history.append({
+            'age': self.age,
+            'small_to_blended': small_to_blended,
+            'blended_to_large': blended_to_large
+        })
+        log_transition_summary(self.logger, period // 5 + 1,
+                               small_to_blended, blended_to_large)
+        
+        # Log growth summary
+        if initial_metrics and self.trees:
+            final_metrics = self.get_metrics()
+            dbh_growth = final_metrics['mean_dbh'] - initial_metrics['mean_dbh']
+            height_growth = final_metrics['mean_height'] - initial_metrics['mean_height']
+            log_growth_summary(self.logger, period // 5 + 1, 
+                             dbh_growth, height_growth, mortality_count)
     
     def _calculate_ccf(self):
         """Calculate Crown Competition Factor.
         
-        CCF is the sum of maximum crown areas divided by stand area,
-        expressed as a percentage.
+        CCF is the sum of individual tree CCFt values (equation 4.5.1),
+        using each species' open-grown crown width equation.
         """
-        total_crown_area = 0
-        for tree in self.trees:
-            crown_width = self._calculate_crown_width(tree)
-            crown_area = math.pi * (crown_width / 2)**2
-            total_crown_area += crown_area
+        if not self.trees:
+            return 0.0
+        dbh = np.fromiter((tree.dbh for tree in self.trees), dtype=float, count=len(self.trees))
+        species_codes, species_id = self._species_ids()
+        ccf, _ = get_ccf_model().calculate_stand_ccf_array(dbh, species_id, species_codes=species_codes)
+        return ccf
+    
+    def _species_ids(self):
+        """Get the distinct species codes and each tree's index into them."""
+        return np.unique([tree.species for tree in self.trees], return_inverse=True)
+    
+    def calculate_volume(self) -> np.ndarray:
+        """Calculate total cubic volume of each tree in one pass over the stand.
+        
+        Returns:
+            Array of per-tree volumes (cubic feet), in tree order
+        """
+        from .volume_library import get_volume_library
+        
+        n = len(self.trees)
+        if n == 0:
+            return np.zeros(0)
+        species_codes, species_id = self._species_ids()
+        return get_volume_library().calculate_total_cubic_volume_array(
+            np.fromiter((tree.dbh for tree in self.trees), dtype=float, count=n),
+            np.fromiter((tree.height for tree in self.trees), dtype=float, count=n),
+            species_id,
+            species_codes
+        )
+    
+    def thin(self, residual: float, target: str = 'basal_area', method: str = 'below',
+             min_dbh: float = 0.0, max_dbh: float = math.inf):
+        """Thin the stand to a residual density.
+        
+        Each tree represents one tree per acre, so a tree is removed when the
+        thinning takes at least half of it (see thinning.calculate_thinning_array).
         
-        # Convert to percentage (1 acre = 43560 sq ft)
-        return (total_crown_area / 43560) * 100
+        Args:
+            residual: Residual density
+            target: Density measure of the residual: 'basal_area' (sq ft/acre),
+                    'sdi', 'tpa' or 'ccf'
+            method: 'below', 'above' or 'proportional'
+            min_dbh: Smallest DBH that may be removed (inches)
+            max_dbh: Largest DBH that may be removed (inches)
+            
+        Returns:
+            dict: Removed 'tpa', 'basal_area', 'volume' (cubic feet per acre)
+                  and the removed 'trees'
+        """
+        n = len(self.trees)
+        if n == 0:
+            return {'tpa': 0, 'basal_area': 0.0, 'volume': 0.0, 'trees': []}
+        
+        with self.timer.activate(), phase('thinning'):
+            dbh = np.fromiter((tree.dbh for tree in self.trees), dtype=float, count=n)
+            species_codes, species_id = self._species_ids()
+            removed = calculate_thinning_array(
+                tree_density_array(target, dbh, species_id, species_codes),
+                np.ones(n),
+                dbh,
+                np.zeros(n, dtype=int),
+                np.array([residual], dtype=float),
+                method,
+                (dbh >= min_dbh) & (dbh <= max_dbh)
+            ) >= 0.5
+            
+            volume = self.calculate_volume()
+            cut = [tree for tree, remove in zip(self.trees, removed) if remove]
+            self.trees = [tree for tree, remove in zip(self.trees, removed) if not remove]
+            return {
+                'tpa': len(cut),
+                'basal_area': float(np.sum(math.pi * (dbh[removed] / 24) ** 2)),
+                'volume': float(volume[removed].sum()),
+                'trees': cut
+            }
     
     def _calculate_competition_metrics(self):
         """Calculate competition metrics for each tree.
@@ -220,6 +347,46 @@ class Stand:
         return metrics
     
     def _apply_mortality(self):
+        """Apply mortality with the stand's mortality model.
+        
+        Returns:
+            int: Number of trees that died
+            
+        Raises:
+            ValueError: If the mortality model is unknown
+        """
+        if self.mortality_model not in MORTALITY_MODELS:
+            raise ValueError(f"Unknown mortality model: {self.mortality_model}. Use one of {MORTALITY_MODELS}")
+        if self.mortality_model == 'sdi':
+            return self._apply_sdi_mortality()
+        return self._apply_empirical_mortality()
+    
+    def _apply_sdi_mortality(self):
+        """Apply the SN SDI-based mortality model (see mortality.SDIMortalityModel).
+        
+        Each tree represents one tree per acre, so its mortality rate is
+        applied as a survival draw.
+        
+        Returns:
+            int: Number of trees that died
+        """
+        n = len(self.trees)
+        if n == 0:
+            return 0
+        
+        species_codes, species_id = self._species_ids()
+        killed = get_mortality_model().calculate_mortality_array(
+            np.fromiter((tree.dbh for tree in self.trees), dtype=float, count=n),
+            np.ones(n),
+            species_id,
+            np.zeros(n, dtype=int),
+            np.array([self.params['mortality']['max_sdi']]),
+            species_codes
+        )
+        self.trees = [tree for tree, rate in zip(self.trees, killed) if random.random() >= rate]
+        return n - len(self.trees)
+    
+    def _apply_empirical_mortality(self):
         """Apply mortality based on stand density and tree characteristics.
         
         Returns:
@@ -271,8 +438,16 @@ class Stand:
         mortality_count = initial_count - len(survivors)
         return mortality_count
     
-    def get_metrics(self):
-        """Calculate stand-level metrics."""
+    def get_metrics(self, volume: bool = True):
+        """Calculate stand-level metrics.
+        
+        Args:
+            volume: Whether to compute volume; if False, 'volume' is NaN
+        """
+        with self.timer.activate(), phase('metrics'):
+            return self._calculate_metrics(volume)
+    
+    def _calculate_metrics(self, volume: bool = True):
         if not self.trees:
             return {
                 'age': self.age,
@@ -285,13 +460,18 @@ class Stand:
             }
         
         n_trees = len(self.trees)
+        if volume:
+            with phase('volume'):
+                volume = float(self.calculate_volume().sum())
+        else:
+            volume = math.nan
         metrics = {
             'age': self.age,
             'tpa': n_trees,
             'mean_dbh': sum(tree.dbh for tree in self.trees) / n_trees,
             'mean_height': sum(tree.height for tree in self.trees) / n_trees,
             'basal_area': sum(math.pi * (tree.dbh / 24)**2 for tree in self.trees),
-            'volume': sum(tree.get_volume() for tree in self.trees),
+            'volume': volume,
             'ccf': self._calculate_ccf()
         }
         
@@ -0,0 +1,883 @@
+"""
+StandBatch class packing many stands into one set of concatenated tree arrays.
+Grows, thins out and summarizes all stands together so that per-stand Python
+overhead is paid once per cycle instead of once per stand.
+"""
+import math
+import numpy as np
+from typing import Dict, List, Optional, Any, Sequence
+
+from .config_loader import get_config_loader, load_stand_config
+from .validation import ParameterValidator
+from .crown_competition_factor import get_ccf_model
+from .mortality import MORTALITY_MODELS, get_mortality_model
+from .regeneration import get_regeneration_model
+from .thinning import calculate_thinning_array, tree_density_array
+from . import kernels
+from .logging_config import (
+    get_logger, log_model_transition, log_transition_summary, transition_events_enabled
+)
+from .timing import PhaseTimer, phase
+
+
+# Per-record arrays, kept in the same order
+_RECORD_ARRAYS = ('stand_index', 'species_id', 'dbh', 'height', 'crown_ratio', 'tree_age', 'tpa')
+
+# Records left with fewer trees per acre are dropped by SDI mortality
+_MIN_RECORD_TPA = 1e-4
+
+# Equation codes for the average crown ratio equations (4.3.1.3 - 4.3.1.7)
+_ACR_EQUATIONS = {'4.3.1.3': 3, '4.3.1.4': 4, '4.3.1.5': 5, '4.3.1.6': 6, '4.3.1.7': 7}
+
+
+class _SpeciesParameters:
+    """Species coefficients gathered into arrays indexed by species id.
+
+    Each attribute is a NumPy array with one entry per species code, so that
+    record-level coefficients can be gathered with ``array[species_id]``.
+    """
+
+    def __init__(self, species_codes: Sequence[str], growth_params: Dict[str, Any]):
+        """Load parameters for each species once.
+
+        Args:
+            species_codes: Species codes present in the batch
+            growth_params: Contents of growth_model_parameters.yaml
+        """
+        from .crown_ratio import create_crown_ratio_model
+
+        loader = get_config_loader()
+        small_tree_params = growth_params.get('small_tree_growth', {})
+        default_small = small_tree_params.get('default', {
+            'c1': 1.1421, 'c2': 1.0042, 'c3': -0.0374, 'c4': 0.7632, 'c5': 0.0358
+        })
+        planting_effects = growth_params.get('large_tree_modifiers', {}).get('planting_effect', {})
+
+        columns: Dict[str, List[float]] = {}
+
+        def add(name, value):
+            columns.setdefault(name, []).append(value)
+
+        for code in species_codes:
+            species_params = loader.load_species_config(code)
+
+            # Small tree Chapman-Richards height growth
+            p = small_tree_params.get(code, default_small)
+            for key in ('c1', 'c2', 'c3', 'c4', 'c5'):
+                add(key, p[key])
+
+            # Large tree ln(DDS) coefficients (same lookup order as Tree._grow_large_tree)
+            dg = species_params.get('diameter_growth', {}).get('coefficients', {})
+            for name, legacy in (('INTERC', 'b1'), ('LDBH', 'b2'), ('DBH2', 'b3'),
+                                 ('LCRWN', 'b4'), ('HREL', 'b5'), ('ISIO', 'b6'),
+                                 ('PLTB', 'b7'), ('PNTBL', 'b8'), ('TANS', 'b9'),
+                                 ('FCOS', 'b10'), ('FSIN', 'b11')):
+                add(name, dg.get(name, dg.get(legacy, 0.0)))
+
+            fortype = species_params.get('fortype', {})
+            fortype_effect = fortype.get('coefficients', {}).get(
+                fortype.get('base_fortype', 'FTYLPN'), 0.0)
+            ecounit = species_params.get('ecounit', {}).get('table_4_7_1_5', {})
+            ecounit_effect = ecounit.get('coefficients', {}).get(
+                ecounit.get('base_ecounit', '232'), 0.0)
+            plant_effect = species_params.get('plant', {}).get('value', 0.0)
+            if code in planting_effects:
+                plant_effect = planting_effects[code]
+            add('site_effect', fortype_effect + ecounit_effect + plant_effect)
+
+            # Height-diameter relationship
+            hd = species_params['height_diameter']
+            curtis_arney = hd['curtis_arney']
+            wykoff = hd.get('wykoff', {'b1': 0.0, 'b2': 0.0})
+            add('use_wykoff', hd.get('model', 'curtis_arney') == 'wykoff')
+            for key in ('p2', 'p3', 'p4', 'dbw'):
+                add(key, curtis_arney[key])
+            add('wykoff_b1', wykoff['b1'])
+            add('wykoff_b2', wykoff['b2'])
+
+            # Weibull crown ratio model
+            cr = create_crown_ratio_model(code).coefficients
+            add('acr_equation', _ACR_EQUATIONS.get(cr['acr_equation'], 0))
+            add('d0', cr['d0'])
+            add('has_d1', cr.get('d1') is not None)
+            add('has_d2', cr.get('d2') is not None)
+            add('d1', cr.get('d1') or 0.0)
+            add('d2', cr.get('d2') or 0.0)
+            for key in ('a', 'b0', 'b1', 'c'):
+                add('cr_' + key, cr[key])
+
+            # Site index bounds and maximum SDI
+
+            si_min, si_max = ParameterValidator.SPECIES_SI_BOUNDS.get(
+                code, ParameterValidator.BOUNDS['site_index'])
+            add('si_min', si_min)
+            add('si_max', si_max)
+
+            stand_params = load_stand_config(code)
+            add('max_sdi', stand_params['mortality']['max_sdi'])
+
+        for name, values in columns.items():
+            setattr(self, name, np.asarray(values))
+
+        # Coefficient tuples passed to the record kernels (see kernels.py)
+        def floats(*names):
+            return tuple(np.asarray(getattr(self, name), dtype=float) for name in names)
+
+        self.small_tree_coefficients = floats('c1', 'c2', 'c3', 'c4', 'c5')
+        self.dds_coefficients = floats('ISIO', 'TANS', 'FCOS', 'FSIN', 'INTERC', 'LDBH', 'DBH2',
+                                       'LCRWN', 'HREL', 'PLTB', 'PNTBL', 'site_effect')
+        self.crown_ratio_coefficients = (
+            self.acr_equation, *floats('d0', 'd1', 'd2'), self.has_d1, self.has_d2,
+            *floats('cr_a', 'cr_b0', 'cr_b1', 'cr_c')
+        )
+
+
+class StandBatch:
+    """Many stands stored as one concatenated tree array with offset indices.
+
+    Tree records are kept sorted by stand, so records of stand ``i`` occupy
+    ``offsets[i]:offsets[i + 1]`` of every record array. Stand-level aggregates
+    are computed with segment reductions and growth and mortality are applied
+    to all records of all stands in a single vectorized pass per cycle.
+    """
+
+    def __init__(self,
+                 stand_index: np.ndarray,
+                 dbh: np.ndarray,
+                 height: np.ndarray,
+                 crown_ratio: np.ndarray,
+                 site_indices: Sequence[float],
+                 species: Sequence[str],
+                 tree_age: Optional[np.ndarray] = None,
+                 tpa: Optional[np.ndarray] = None,
+                 stand_ids: Optional[Sequence[Any]] = None,
+                 seed: Optional[int] = None):
+        """Initialize a batch from record arrays.
+
+        Args:
+            stand_index: Stand position of each tree record (non-decreasing)
+            dbh: Diameter at breast height of each record (inches)
+            height: Total height of each record (feet)
+            crown_ratio: Crown ratio of each record (proportion)
+            site_indices: Site index of each stand (base age 25) in feet
+            species: Species code of each stand
+            tree_age: Age of each record in years (default 0)
+            tpa: Trees per acre represented by each record (default 1.0)
+            stand_ids: Identifiers of the stands (default 0..n-1)
+            seed: Seed for the mortality random number generator
+        """
+        self.logger = get_logger(__name__)
+        self.n_stands = len(species)
+        self.stand_species = list(species)
+        self.stand_ids = list(stand_ids) if stand_ids is not None else list(range(self.n_stands))
+        self.age = np.zeros(self.n_stands, dtype=int)
+        self.rng = np.random.default_rng(seed)
+
+        # Load growth model parameters
+        try:
+            loader = get_config_loader()
+            growth_params_file = loader.cfg_dir / 'growth_model_parameters.yaml'
+            self.growth_params = loader._load_config_file(growth_params_file)
+        except Exception:
+            # Fallback defaults
+            self.growth_params = {
+                'mortality': {
+                    'early_mortality': {'age_threshold': 5, 'base_rate': 0.25},
+                    'background_mortality': {'base_rate': 0.05, 'competition_threshold': 0.55, 'competition_multiplier': 0.1}
+                },
+                'initial_tree': {'dbh': {'mean': 0.5, 'std_dev': 0.1, 'minimum': 0.1}},
+                'growth_transitions': {'small_to_large_tree': {'xmin': 1.0, 'xmax': 3.0}},
+                'small_tree_growth': {}
+            }
+
+        # Mortality model ('empirical' or 'sdi') and whether SDI mortality is drawn
+        mortality_params = self.growth_params.get('mortality', {})
+        self.mortality_model = mortality_params.get('model', 'empirical')
+        self.stochastic_mortality = bool(mortality_params.get('stochastic', False))
+
+        # Species lookup tables
+        self.species_codes = sorted(set(self.stand_species))
+        code_to_id = {code: i for i, code in enumerate(self.species_codes)}
+        self.stand_species_id = np.array([code_to_id[code] for code in self.stand_species], dtype=int)
+        self.params = _SpeciesParameters(self.species_codes, self.growth_params)
+
+        # Validate site index against species bounds
+        site_indices = np.asarray(site_indices, dtype=float)
+        self.site_index = np.clip(site_indices,
+                                  self.params.si_min[self.stand_species_id],
+                                  self.params.si_max[self.stand_species_id])
+
+        # Record arrays
+        stand_index = np.asarray(stand_index, dtype=int)
+        n_records = len(stand_index)
+        if n_records and np.any(np.diff(stand_index) < 0):
+            raise ValueError("stand_index must be sorted so each stand's records are contiguous")
+        self.stand_index = stand_index
+        self.species_id = self.stand_species_id[stand_index]
+        self.dbh = np.asarray(dbh, dtype=float)
+        self.height = np.asarray(height, dtype=float)
+        self.crown_ratio = np.asarray(crown_ratio, dtype=float)
+        self.tree_age = (np.asarray(tree_age, dtype=int) if tree_age is not None
+                         else np.zeros(n_records, dtype=int))
+        self.tpa = (np.asarray(tpa, dtype=float) if tpa is not None
+                    else np.ones(n_records))
+        self._update_offsets()
+
+        # Growth model transitions per stand (trees per acre), one entry per grown cycle
+        self.transition_history: List[Dict[str, np.ndarray]] = []
+
+        # Phase timings of this batch (see timing.enable_timing)
+        self.timer = PhaseTimer()
+
+    @classmethod
+    def initialize_planted(cls, scenarios: List[Dict[str, Any]], seed: Optional[int] = None):
+        """Create a batch of newly planted stands.
+
+        Args:
+            scenarios: List of dictionaries with 'trees_per_acre', 'site_index'
+                       and 'species' keys, plus an optional 'stand_id'
+            seed: Seed for planting variation and mortality
+
+        Returns:
+            StandBatch: New batch instance
+        """
+        rng = np.random.default_rng(seed)
+
+        counts = []
+        site_indices = []
+        species = []
+        for scenario in scenarios:
+            species_code = scenario.get('species', 'LP')
+            validated = ParameterValidator.validate_stand_parameters(
+                trees_per_acre=scenario.get('trees_per_acre', 500),
+                site_index=scenario.get('site_index', 70),
+                species_code=species_code
+            )
+            counts.append(validated['trees_per_acre'])
+            site_indices.append(validated['site_index'])
+            species.append(species_code)
+
+        stand_ids = [scenario.get('stand_id', i) for i, scenario in enumerate(scenarios)]
+        stand_index = np.repeat(np.arange(len(scenarios)), counts)
+
+        batch = cls(stand_index, np.zeros(len(stand_index)), np.zeros(len(stand_index)),
+                    np.zeros(len(stand_index)), site_indices, species,
+                    stand_ids=stand_ids, seed=seed)
+        batch.rng = rng
+
+        # Planting variation follows Stand.initialize_planted
+        initial_params = batch.growth_params.get('initial_tree', {})
+        dbh_params = initial_params.get('dbh', {})
+        dbh_mean = dbh_params.get('mean', 0.5)
+        dbh_sd = dbh_params.get('std_dev', 0.1)
+        dbh_min = dbh_params.get('minimum', 0.1)
+        initial_height = initial_params.get('height', {}).get('planted', 1.0)
+
+        dbh = np.maximum(dbh_min, dbh_mean + rng.normal(0.0, dbh_sd, len(stand_index)))
+        batch.dbh = np.clip(dbh, *ParameterValidator.BOUNDS['dbh'])
+        batch.height = np.full(len(stand_index), float(np.clip(initial_height, *ParameterValidator.BOUNDS['height'])))
+        batch.crown_ratio = np.full(len(stand_index), 0.85)
+        return batch
+
+    @classmethod
+    def from_stands(cls, stands: Sequence, stand_ids: Optional[Sequence[Any]] = None,
+                    seed: Optional[int] = None):
+        """Pack existing Stand objects into a batch.
+
+        Args:
+            stands: Stand objects to pack
+            stand_ids: Optional identifiers for the stands
+            seed: Seed for the mortality random number generator
+
+        Returns:
+            StandBatch: New batch instance holding copies of the tree data
+        """
+        counts = [len(stand.trees) for stand in stands]
+        trees = [tree for stand in stands for tree in stand.trees]
+
+        batch = cls(
+            stand_index=np.repeat(np.arange(len(stands)), counts),
+            dbh=np.fromiter((t.dbh for t in trees), float, len(trees)),
+            height=np.fromiter((t.height for t in trees), float, len(trees)),
+            crown_ratio=np.fromiter((t.crown_ratio for t in trees), float, len(trees)),
+            tree_age=np.fromiter((t.age for t in trees), int, len(trees)),
+            site_indices=[stand.site_index for stand in stands],
+            species=[stand.species for stand in stands],
+            stand_ids=stand_ids,
+            seed=seed
+        )
+        batch.age = np.array([stand.age for stand in stands], dtype=int)
+        return batch
+
+    @property
+    def n_records(self) -> int:
+        """Total number of tree records across all stands."""
+        return len(self.stand_index)
+
+    def _update_offsets(self):
+        """Recompute segment offsets from the stand index."""
+        counts = np.bincount(self.stand_index, minlength=self.n_stands)
+        self.record_counts = counts
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def _segment_sum(self, values: np.ndarray) -> np.ndarray:
+        """Sum record values within each stand.
+
+        Args:
+            values: Array with one value per record
+
+        Returns:
+            Array with one sum per stand (0 for empty stands)
+        """
+        sums = np.zeros(self.n_stands)
+        nonempty = self.record_counts > 0
+        if values.size:
+            # reduceat over non-empty segment starts only; empty segments would
+            # otherwise pick up the value at their (shared) start index
+            sums[nonempty] = np.add.reduceat(values, self.offsets[:-1][nonempty])
+        return sums
+
+    def _segment_sort(self, values: np.ndarray) -> np.ndarray:
+        """Get record order sorted by stand and then by value within each stand.
+
+        The sort is stable, matching Python's sorted() used by Stand.
+        """
+        return np.lexsort((values, self.stand_index))
+
+    def _basal_area(self) -> np.ndarray:
+        """Basal area (sq ft/acre) represented by each record."""
+        return math.pi * (self.dbh / 24) ** 2 * self.tpa
+
+    def _calculate_ccf(self) -> np.ndarray:
+        """Crown Competition Factor of each stand (see Stand._calculate_ccf)."""
+        tree_ccf = get_ccf_model().calculate_tree_ccf_array(self.dbh, self.species_id, self.species_codes)
+        return self._segment_sum(tree_ccf * self.tpa)
+
+    def calculate_competition_metrics(self) -> Dict[str, np.ndarray]:
+        """Calculate competition metrics for every record.
+
+        Vectorized equivalent of Stand._calculate_competition_metrics: PBAL and
+        rank come from a stable sort by DBH within each stand followed by a
+        segmented cumulative sum.
+
+        Returns:
+            Dictionary of record arrays: 'competition_factor', 'pbal', 'rank', 'relsdi'
+        """
+        n = self.n_records
+        tree_ba = self._basal_area()
+        stand_ba = self._segment_sum(tree_ba)
+        stand_tpa = self._segment_sum(self.tpa)
+        ccf = self._calculate_ccf()
+        max_sdi = self.params.max_sdi[self.stand_species_id]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_dbh = np.where(stand_tpa > 0, self._segment_sum(self.dbh * self.tpa) / stand_tpa, 0.0)
+
+        # Segmented cumulative sums over records sorted by DBH within each stand
+        order = self._segment_sort(self.dbh)
+        seg = self.stand_index[order]
+        start = self.offsets[:-1][seg]
+        pbal, rank = kernels.pbal_rank(order, seg, tree_ba, self.tpa, start, stand_ba, stand_tpa)
+
+        # Combine density, CCF and size effects as in Stand
+        density_factor = np.minimum(0.8, stand_ba / 150)[self.stand_index]
+        ccf_factor = np.minimum(0.8, ccf / 200)[self.stand_index]
+        size_factor = np.minimum(1.0, self.dbh / mean_dbh[self.stand_index]) if n else np.empty(0)
+        competition_factor = np.minimum(0.95, 0.4 * density_factor + 0.4 * ccf_factor + 0.2 * size_factor)
+
+        # Stands with a single record have no competition
+        single = (self.record_counts <= 1)[self.stand_index]
+        competition_factor[single] = 0.0
+        pbal[single] = 0.0
+
+        return {
+            'competition_factor': competition_factor,
+            'pbal': np.maximum(0.0, pbal),
+            'rank': rank,
+            'relsdi': ((stand_ba / max_sdi) * 10)[self.stand_index]
+        }
+
+    def grow(self, years: int = 5):
+        """Grow all stands for the specified number of years.
+
+        Args:
+            years: Number of years to grow (default 5 years to match FVS)
+        """
+        # Ensure years is a multiple of 5
+        if years % 5 != 0:
+            years = 5 * math.ceil(years / 5)
+
+        for period in range(0, years, 5):  # Step in 5-year increments
+            initial_dbh = self._segment_sum(self.dbh * self.tpa)
+            initial_tpa = self._segment_sum(self.tpa)
+
+            with self.timer.activate():
+                with phase('competition'):
+                    competition = self.calculate_competition_metrics()
+                with phase('growth'):
+                    transitions = self._grow_trees(competition['competition_factor'])
+                with phase('mortality'):
+                    mortality_count = self._apply_mortality()
+
+            self.age += 5
+
+            self.transition_history.append({'age': self.age.copy(), **transitions})
+            log_transition_summary(self.logger, period // 5 + 1,
+                                   int(round(transitions['small_to_blended'].sum())),
+                                   int(round(transitions['blended_to_large'].sum())))
+
+            # Log one summary for the whole batch rather than one per stand
+            if self.n_records:
+                final_tpa = self._segment_sum(self.tpa)
+                alive = (initial_tpa > 0) & (final_tpa > 0)
+                dbh_growth = (self._segment_sum(self.dbh * self.tpa)[alive] / final_tpa[alive]
+                              - initial_dbh[alive] / initial_tpa[alive])
+                self.logger.info(
+                    f"Batch period {period // 5 + 1}: {self.n_stands} stands, "
+                    f"{self.n_records} records, mean DBH growth "
+                    f"+{float(np.mean(dbh_growth)) if dbh_growth.size else 0.0:.2f}\", "
+                    f"Mortality: {int(mortality_count.sum())} trees"
+                )
+
+    def _grow_trees(self, competition_factor: np.ndarray, rank: float = 0.5,
+                    relsdi: float = 5.0, ba: float = 100, pbal: float = 50,
+                    slope: float = 0.05, aspect: float = 0, time_step: int = 5):
+        """Grow every record for one period.
+
+        Vectorized equivalent of Tree.grow, blending the small-tree and
+        large-tree models by initial DBH. Defaults match Tree.grow, which is
+        how Stand.grow calls it.
+
+        Args:
+            competition_factor: Competition factor of each record (0-1)
+            rank: Tree rank in diameter distribution (scalar or record array)
+            relsdi: Relative stand density index (scalar or record array)
+            ba: Stand basal area (scalar or record array)
+            pbal: Plot basal area in larger trees (scalar or record array)
+            slope: Ground slope (proportion)
+            aspect: Aspect in radians
+            time_step: Number of years to grow
+
+        Returns:
+            Dictionary with 'small_to_blended' and 'blended_to_large' arrays
+            giving the trees per acre of each stand that crossed a growth
+            model boundary
+        """
+        if not self.n_records:
+            return {'small_to_blended': np.zeros(self.n_stands),
+                    'blended_to_large': np.zeros(self.n_stands)}
+
+        bounds = ParameterValidator.BOUNDS
+        p = self.params
+        sid = self.species_id
+        site_index = np.clip(self.site_index[self.stand_index], p.si_min[sid], p.si_max[sid])
+        competition_factor = np.clip(competition_factor, *bounds['competition_factor'])
+        rank = np.clip(rank, *bounds['rank'])
+        relsdi = np.clip(relsdi, *bounds['relsdi'])
+        ba = np.clip(ba, *bounds['basal_area'])
+        pbal = np.clip(pbal, *bounds['pbal'])
+        slope = float(np.clip(slope, *bounds['slope']))
+        aspect = float(np.clip(aspect, *bounds['aspect']))
+        time_step = int(np.clip(time_step, *bounds['time_step']))
+
+        initial_dbh = self.dbh
+        initial_height = self.height
+        initial_age = self.tree_age
+
+        transition = self.growth_params['growth_transitions']['small_to_large_tree']
+        xmin = transition['xmin']
+        xmax = transition['xmax']
+        weight = np.clip((initial_dbh - xmin) / (xmax - xmin), 0.0, 1.0)
+
+        # Small tree model: Chapman-Richards height growth, DBH from height
+        max_reduction = self.growth_params.get('competition_effects', {}).get(
+            'small_tree_competition', {}).get('max_reduction', 0.2)
+        height_growth = kernels.small_tree_height_growth(
+            sid, site_index, initial_age, competition_factor, time_step, max_reduction,
+            p.small_tree_coefficients)
+        small_height = np.maximum(4.5, initial_height + height_growth)
+        small_dbh = np.where(
+            small_height <= 4.5,
+            np.maximum(initial_dbh, p.dbw[sid]),
+            np.maximum(initial_dbh, self._solve_dbh_from_height(small_height, initial_dbh))
+        )
+
+        # Large tree model: ln(DDS) diameter growth, height from DBH
+        n = self.n_records
+        large_dbh = kernels.large_tree_diameter(
+            sid, initial_dbh, initial_height, self.crown_ratio, site_index,
+            np.broadcast_to(ba, (n,)), np.broadcast_to(pbal, (n,)), slope, aspect, time_step,
+            p.dds_coefficients)
+        large_height = self._predict_height(large_dbh)
+
+        # Blend results based on initial DBH
+        self.dbh = (1 - weight) * small_dbh + weight * large_dbh
+        self.height = (1 - weight) * small_height + weight * large_height
+        self.tree_age = initial_age + time_step
+
+        with phase('crown_ratio'):
+            self._update_crown_ratio_weibull(rank, relsdi, competition_factor)
+
+        # Count growth model transitions per stand
+        small_to_blended = (initial_dbh < xmin) & (self.dbh >= xmin)
+        blended_to_large = (initial_dbh <= xmax) & (self.dbh > xmax)
+        if transition_events_enabled(self.logger):
+            for i in np.flatnonzero(small_to_blended):
+                log_model_transition(self.logger, f"{self.stand_species[self.stand_index[i]]}_{i}",
+                                     "small_tree", "blended", self.dbh[i])
+            for i in np.flatnonzero(blended_to_large):
+                log_model_transition(self.logger, f"{self.stand_species[self.stand_index[i]]}_{i}",
+                                     "blended", "large_tree", self.dbh[i])
+        return {
+            'small_to_blended': np.bincount(self.stand_index, weights=small_to_blended * self.tpa,
+                                            minlength=self.n_stands),
+            'blended_to_large': np.bincount(self.stand_index, weights=blended_to_large * self.tpa,
+                                            minlength=self.n_stands),
+        }
+
+    def _predict_height(self, dbh: np.ndarray, species_id: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predict height of each record from DBH (see HeightDiameterModel.predict_height).
+
+        Args:
+            dbh: Diameter of each record (inches)
+            species_id: Species id of each value (default: the batch records)
+        """
+        p = self.params
+        sid = self.species_id if species_id is None else species_id
+        dbw = p.dbw[sid]
+        p2, p3, p4 = p.p2[sid], p.p3[sid], p.p4[sid]
+
+        # Curtis-Arney with linear interpolation below 3 inches
+        h3 = 4.5 + p2 * np.exp(-p3 * 3.0 ** p4)
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            curtis_arney = np.where(
+                dbh <= dbw, 4.5,
+                np.where(dbh < 3.0,
+                         4.5 + (h3 - 4.5) * (dbh - dbw) / (3.0 - dbw),
+                         4.5 + p2 * np.exp(-p3 * np.abs(dbh) ** p4)))
+            wykoff = np.where(dbh <= 0, 4.5,
+                              4.5 + np.exp(p.wykoff_b1[sid] + p.wykoff_b2[sid] / (dbh + 1)))
+        return np.where(p.use_wykoff[sid], wykoff, curtis_arney)
+
+    def _solve_dbh_from_height(self, target_height: np.ndarray, initial_dbh: np.ndarray,
+                               tolerance: float = 0.01, max_iterations: int = 20,
+                               species_id: Optional[np.ndarray] = None) -> np.ndarray:
+        """Solve for DBH given target heights using Newton-Raphson.
+
+        Vectorized equivalent of HeightDiameterModel.solve_dbh_from_height:
+        every record iterates until its own error is within tolerance.
+        species_id selects the species of each value (default: the batch records).
+        """
+        dbh = initial_dbh.copy()
+        active = np.ones(len(dbh), dtype=bool)
+        h = 0.01  # Small step for numerical derivative
+
+        for _ in range(max_iterations):
+            predicted = self._predict_height(dbh, species_id)
+            error = predicted - target_height
+            active &= np.abs(error) >= tolerance
+            if not active.any():
+                break
+
+            derivative = (self._predict_height(dbh + h, species_id) - predicted) / h
+            flat = np.abs(derivative) < 1e-10
+            with np.errstate(divide='ignore', invalid='ignore'):
+                updated = np.where(flat,
+                                   dbh * (target_height / predicted) ** 0.5,
+                                   dbh - error / derivative)
+            dbh = np.where(active, np.maximum(0.1, updated), dbh)
+
+        return dbh
+
+    def _update_crown_ratio_weibull(self, rank, relsdi, competition_factor: np.ndarray):
+        """Update crown ratio of each record using the Weibull-based model.
+
+        Vectorized equivalent of Tree._update_crown_ratio_weibull and
+        CrownRatioModel.predict_individual_crown_ratio.
+        """
+        n = self.n_records
+        cr_params = self.growth_params.get('crown_ratio', {})
+        age_reduction = cr_params.get('age_reduction', {})
+        self.crown_ratio = kernels.weibull_crown_ratio(
+            self.species_id, np.broadcast_to(rank, (n,)), np.broadcast_to(relsdi, (n,)),
+            competition_factor, self.tree_age,
+            age_reduction.get('rate', 0.003), age_reduction.get('max_reduction', 0.5),
+            self.params.crown_ratio_coefficients)
+
+    def _apply_mortality(self) -> np.ndarray:
+        """Apply mortality with the batch's mortality model.
+
+        Returns:
+            Array with the number of trees that died in each stand
+
+        Raises:
+            ValueError: If the mortality model is unknown
+        """
+        if self.mortality_model not in MORTALITY_MODELS:
+            raise ValueError(f"Unknown mortality model: {self.mortality_model}. Use one of {MORTALITY_MODELS}")
+        if not self.n_records:
+            return np.zeros(self.n_stands)
+        if self.mortality_model == 'sdi':
+            return self._apply_sdi_mortality()
+        return self._apply_empirical_mortality()
+
+    def _apply_sdi_mortality(self) -> np.ndarray:
+        """Apply the SN SDI-based mortality model (see mortality.SDIMortalityModel).
+
+        By default each record's trees per acre are reduced by the expected
+        mortality and records left with (almost) no trees are dropped. With
+        stochastic_mortality, each record instead dies as a whole with
+        probability equal to its mortality rate.
+        """
+        killed = get_mortality_model().calculate_mortality_array(
+            self.dbh, self.tpa, self.species_id, self.stand_index,
+            self.params.max_sdi[self.stand_species_id], self.species_codes
+        )
+        if self.stochastic_mortality:
+            survives = self.rng.random(self.n_records) >= killed / self.tpa
+            mortality_count = self._segment_sum(np.where(survives, 0.0, self.tpa))
+            self._compact(survives)
+            return mortality_count
+
+        self.tpa = self.tpa - killed
+        survives = self.tpa >= _MIN_RECORD_TPA
+        mortality_count = self._segment_sum(killed + np.where(survives, 0.0, self.tpa))
+        self._compact(survives)
+        return mortality_count
+
+    def _apply_empirical_mortality(self) -> np.ndarray:
+        """Apply mortality based on stand density and tree size.
+
+        Vectorized equivalent of Stand._apply_mortality: every record draws
+        one uniform number and dead records are removed from the batch.
+        """
+
+        basal_area = self._segment_sum(self._basal_area())
+        stand_tpa = self._segment_sum(self.tpa)
+        max_sdi = self.params.max_sdi[self.stand_species_id]
+        relative_density = basal_area / max_sdi
+
+        # Get mortality parameters from config
+        mortality_params = self.growth_params.get('mortality', {})
+        early_params = mortality_params.get('early_mortality', {})
+        background_params = mortality_params.get('background_mortality', {})
+
+        age_threshold = early_params.get('age_threshold', 5)
+        base_rate = background_params.get('base_rate', 0.05)
+        comp_threshold = background_params.get('competition_threshold', 0.55)
+        comp_multiplier = background_params.get('competition_multiplier', 0.1)
+        mortality_rate = np.where(
+            self.age <= age_threshold,
+            early_params.get('base_rate', 0.25),
+            base_rate + np.maximum(0.0, comp_multiplier * (relative_density - comp_threshold))
+        )
+
+        # Smaller trees have higher mortality
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_dbh = self._segment_sum(self.dbh * self.tpa) / stand_tpa
+        size_multiplier = mortality_params.get('size_effect', {}).get('multiplier', 0.2)
+        size_effect = 1.0 + np.maximum(0.0, size_multiplier * (1.0 - self.dbh / mean_dbh[self.stand_index]))
+
+        survives = self.rng.random(self.n_records) > mortality_rate[self.stand_index] * size_effect
+        survives |= (self.record_counts <= 1)[self.stand_index]
+
+        mortality_count = self._segment_sum(np.where(survives, 0.0, self.tpa))
+        self._compact(survives)
+        return mortality_count
+
+    def _compact(self, keep: np.ndarray):
+        """Drop records where keep is False and recompute offsets."""
+        for name in _RECORD_ARRAYS:
+            setattr(self, name, getattr(self, name)[keep])
+        self._update_offsets()
+
+    def _insert_records(self, **records: np.ndarray):
+        """Insert new records after the existing records of their stands.
+
+        All new records are merged into every record array in a single
+        np.insert pass, keeping the records sorted by stand.
+
+        Args:
+            **records: One array per name in _RECORD_ARRAYS
+        """
+        order = np.argsort(records['stand_index'], kind='stable')
+        positions = self.offsets[1:][records['stand_index'][order]]
+        for name in _RECORD_ARRAYS:
+            setattr(self, name, np.insert(getattr(self, name), positions, records[name][order]))
+        self._update_offsets()
+
+    def _add_species(self, species_codes: Sequence[str]):
+        """Extend the species lookup tables with codes not yet in the batch."""
+        new_codes = [code for code in dict.fromkeys(species_codes) if code not in self.species_codes]
+        if new_codes:
+            self.species_codes = self.species_codes + new_codes
+            self.params = _SpeciesParameters(self.species_codes, self.growth_params)
+
+    def add_regeneration(self, stand: Sequence[int], trees_per_acre: Sequence[float],
+                         species: Optional[Any] = None, age: Any = 5,
+                         height: Optional[Any] = None,
+                         records: Optional[Any] = None) -> np.ndarray:
+        """Establish seedling cohorts (planting, natural regeneration or ingrowth).
+
+        Follows the SN partial establishment model (see RegenerationModel):
+        heights come from the small-tree height equation bounded by species
+        seedling heights, DBH from the height-diameter equation and crown
+        ratio from equation 4.3.3.1 with the stand's CCF. The records of all
+        cohorts are inserted in one pass.
+
+        Args:
+            stand: Stand position of each cohort
+            trees_per_acre: Trees per acre established by each cohort
+            species: Species code (or one code per cohort) of the cohorts;
+                     defaults to each stand's species
+            age: Years since establishment (scalar or one value per cohort).
+                 FVS estimates seedling heights at age 5.
+            height: Seedling height in feet (scalar or one value per cohort);
+                    None estimates it from age and site index
+            records: Number of records each cohort is split into (scalar or
+                     one value per cohort); defaults to one record per tree,
+                     as at planting
+
+        Returns:
+            Array with the trees per acre added to each stand
+        """
+        from .crown_ratio import create_crown_ratio_model
+
+        stand = np.atleast_1d(np.asarray(stand, dtype=int))
+        n_cohorts = len(stand)
+        trees_per_acre = np.broadcast_to(np.asarray(trees_per_acre, dtype=float), (n_cohorts,))
+        if species is None:
+            codes = [self.stand_species[i] for i in stand]
+        elif isinstance(species, str):
+            codes = [species] * n_cohorts
+        else:
+            codes = list(species)
+        self._add_species(codes)
+        code_to_id = {code: i for i, code in enumerate(self.species_codes)}
+        cohort_species = np.array([code_to_id[code] for code in codes], dtype=int)
+        age = np.broadcast_to(np.asarray(age, dtype=int), (n_cohorts,))
+
+        # Seedling size of each cohort
+        bounds = ParameterValidator.BOUNDS
+        if height is None:
+            height = get_regeneration_model().calculate_seedling_height_array(
+                cohort_species, self.site_index[stand], age, self.species_codes)
+        height = np.clip(np.broadcast_to(np.asarray(height, dtype=float), (n_cohorts,)), *bounds['height'])
+        dbw = self.params.dbw[cohort_species]
+        dbh = np.where(
+            height <= 4.5, dbw,
+            self._solve_dbh_from_height(height, np.ones(n_cohorts), species_id=cohort_species)
+        )
+
+        # Split cohorts into records
+        if records is None:
+            records = np.maximum(1, np.rint(trees_per_acre)).astype(int)
+        records = np.broadcast_to(np.maximum(1, np.asarray(records, dtype=int)), (n_cohorts,))
+        cohort = np.repeat(np.arange(n_cohorts), records)
+        keep = trees_per_acre[cohort] > 0
+        cohort = cohort[keep]
+
+        # Crown ratio from the CCF of the stand each record joins
+        pccf = self._calculate_ccf()[stand[cohort]]
+        crown_ratio = create_crown_ratio_model().predict_regeneration_crown_ratio_array(pccf, self.rng)
+
+        self._insert_records(
+            stand_index=stand[cohort],
+            species_id=cohort_species[cohort],
+            dbh=np.clip(dbh, *bounds['dbh'])[cohort],
+            height=height[cohort],
+            crown_ratio=crown_ratio,
+            tree_age=age[cohort],
+            tpa=(trees_per_acre / records)[cohort]
+        )
+        return np.bincount(stand, weights=np.maximum(trees_per_acre, 0.0), minlength=self.n_stands)
+
+    def thin(self, residual: Any, target: str = 'basal_area', method: str = 'below',
+             min_dbh: float = 0.0, max_dbh: float = np.inf) -> Dict[str, Any]:
+        """Thin every stand to a residual density.
+
+        Args:
+            residual: Residual density, scalar or one value per stand
+                      (np.inf leaves a stand unthinned)
+            target: Density measure of the residual: 'basal_area' (sq ft/acre),
+                    'sdi', 'tpa' or 'ccf'
+            method: 'below', 'above' or 'proportional'
+            min_dbh: Smallest DBH that may be removed (inches)
+            max_dbh: Largest DBH that may be removed (inches)
+
+        Returns:
+            Dictionary with per-stand arrays of removed 'tpa', 'basal_area' and
+            'volume' (cubic feet per acre), plus 'records': the removed part
+            of every thinned record (record arrays with 'tpa' set to the trees
+            per acre removed, and per-tree 'volume')
+        """
+        with self.timer.activate(), phase('thinning'):
+            residual = np.broadcast_to(np.asarray(residual, dtype=float), (self.n_stands,))
+            density = tree_density_array(target, self.dbh, self.species_id, self.species_codes)
+            eligible = (self.dbh >= min_dbh) & (self.dbh <= max_dbh)
+            removed = calculate_thinning_array(density, self.tpa, self.dbh, self.stand_index,
+                                               residual, method, eligible)
+
+            self.tpa = self.tpa - removed
+            survives = self.tpa >= _MIN_RECORD_TPA
+            removed = removed + np.where(survives, 0.0, self.tpa)
+            cut = removed > 0
+
+            # Report the removed trees as records for harvest volume
+            records = {name: getattr(self, name)[cut] for name in _RECORD_ARRAYS}
+            records['tpa'] = removed[cut]
+            from .volume_library import get_volume_library
+            records['volume'] = get_volume_library().calculate_total_cubic_volume_array(
+                records['dbh'], records['height'], records['species_id'], self.species_codes)
+
+            def per_stand(values):
+                return np.bincount(records['stand_index'], weights=values, minlength=self.n_stands)
+
+            self._compact(survives)
+            return {
+                'tpa': per_stand(records['tpa']),
+                'basal_area': per_stand(math.pi * (records['dbh'] / 24) ** 2 * records['tpa']),
+                'volume': per_stand(records['volume'] * records['tpa']),
+                'records': records
+            }
+
+    def calculate_volume(self) -> np.ndarray:
+        """Total cubic volume of each record (per tree, not per acre)."""
+        from .volume_library import get_volume_library
+
+        return get_volume_library().calculate_total_cubic_volume_array(
+            self.dbh, self.height, self.species_id, self.species_codes)
+
+    def get_metrics(self, volume: bool = True) -> Dict[str, np.ndarray]:
+        """Calculate stand-level metrics for every stand.
+
+        Args:
+            volume: Whether to compute volume; if False, 'volume' is NaN
+
+        Returns:
+            Dictionary of arrays with one entry per stand, using the same keys
+            as Stand.get_metrics
+        """
+        with self.timer.activate(), phase('metrics'):
+            return self._calculate_metrics(volume)
+
+    def _calculate_metrics(self, volume: bool = True) -> Dict[str, np.ndarray]:
+        tpa = self._segment_sum(self.tpa)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_dbh = np.where(tpa > 0, self._segment_sum(self.dbh * self.tpa) / tpa, 0.0)
+            mean_height = np.where(tpa > 0, self._segment_sum(self.height * self.tpa) / tpa, 0.0)
+
+        if volume:
+            with phase('volume'):
+                volume = self._segment_sum(self.calculate_volume() * self.tpa)
+        else:
+            volume = np.full(self.n_stands, np.nan)
+
+        return {
+            'age': self.age.copy(),
+            'tpa': tpa,
+            'mean_dbh': mean_dbh,
+            'mean_height': mean_height,
+            'basal_area': self._segment_sum(self._basal_area()),
+            'volume': volume,
+            'ccf': self._calculate_ccf()
+        }
@@ -0,0 +1,111 @@
+"""
+Thinning operations for FVS-Python.
+Selects the trees per acre removed from each tree record to bring stands to
+a residual basal area, SDI, trees per acre or CCF, thinning from below, from
+above or proportionally across all diameters.
+
+Selection works on record arrays with trees-per-acre expansion factors and
+a stand index, so any number of stands is thinned in one vectorized pass.
+"""
+import math
+import numpy as np
+from typing import Optional, Sequence
+
+from .crown_competition_factor import get_ccf_model
+from .mortality import SDIMortalityModel
+
+
+THINNING_METHODS = ('below', 'above', 'proportional')
+THINNING_TARGETS = ('basal_area', 'sdi', 'tpa', 'ccf')
+
+
+def tree_density_array(target: str, dbh: np.ndarray, species_id: np.ndarray,
+                       species_codes: Sequence[str] = ("LP",)) -> np.ndarray:
+    """Get the density contributed by one tree of each record.
+
+    Args:
+        target: Density measure, one of THINNING_TARGETS
+        dbh: Diameter at breast height of each record (inches)
+        species_id: Index of each record's species in species_codes
+        species_codes: Species codes indexed by species_id
+
+    Returns:
+        Basal area (sq ft), SDI, tree count or CCF of one tree of each record
+
+    Raises:
+        ValueError: If the target is unknown
+    """
+    dbh = np.asarray(dbh, dtype=float)
+    if target == 'basal_area':
+        return math.pi * (dbh / 24) ** 2
+    if target == 'sdi':
+        return SDIMortalityModel.calculate_sdi_array(dbh, 1.0)
+    if target == 'tpa':
+        return np.ones(len(dbh))
+    if target == 'ccf':
+        return get_ccf_model().calculate_tree_ccf_array(dbh, species_id, species_codes)
+    raise ValueError(f"Unknown thinning target: {target}. Use one of {THINNING_TARGETS}")
+
+
+def calculate_thinning_array(density: np.ndarray, tpa: np.ndarray, dbh: np.ndarray,
+                             stand_index: np.ndarray, residual: np.ndarray,
+                             method: str = 'below',
+                             eligible: Optional[np.ndarray] = None) -> np.ndarray:
+    """Calculate the trees per acre removed from each record by a thinning.
+
+    Thinning from below (above) removes the smallest (largest) eligible
+    records first. Records are ordered once by stand and DBH; a segmented
+    cumulative sum of record density then gives, for every record, the
+    density removed before it, and the record where the residual is reached
+    is thinned partially. Proportional thinning removes the same share of
+    every eligible record.
+
+    Args:
+        density: Density of one tree of each record (see tree_density_array)
+        tpa: Trees per acre represented by each record
+        dbh: Diameter at breast height of each record (inches)
+        stand_index: Stand position of each record (0..n_stands-1)
+        residual: Residual density of each stand (np.inf leaves a stand unthinned)
+        method: One of THINNING_METHODS
+        eligible: Optional mask of records that may be removed, e.g. a DBH range
+
+    Returns:
+        Trees per acre removed from each record (never more than tpa)
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if method not in THINNING_METHODS:
+        raise ValueError(f"Unknown thinning method: {method}. Use one of {THINNING_METHODS}")
+
+    tpa = np.asarray(tpa, dtype=float)
+    stand_index = np.asarray(stand_index, dtype=int)
+    residual = np.asarray(residual, dtype=float)
+    n_stands = len(residual)
+    total_density = np.asarray(density, dtype=float) * tpa
+    record_density = total_density if eligible is None else np.where(eligible, total_density, 0.0)
+
+    # Density each stand must lose, limited to what is eligible for removal
+    stand_density = np.bincount(stand_index, total_density, n_stands)
+    removable = np.bincount(stand_index, record_density, n_stands)
+    removal = np.clip(stand_density - residual, 0.0, removable)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'proportional':
+            share = np.where(removable > 0, removal / removable, 0.0)
+            return np.where(record_density > 0, tpa * share[stand_index], 0.0)
+
+        # Smallest trees first from below, largest first from above
+        key = np.asarray(dbh, dtype=float)
+        order = np.lexsort((key if method == 'below' else -key, stand_index))
+        ordered = record_density[order]
+        cumulative = np.cumsum(ordered)
+        seg = stand_index[order]
+        counts = np.bincount(stand_index, minlength=n_stands)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[seg]
+        removed_before = cumulative - ordered - np.where(starts > 0, cumulative[starts - 1], 0.0)
+
+        taken = np.clip(removal[seg] - removed_before, 0.0, ordered)
+        removed = np.empty(len(tpa))
+        removed[order] = np.where(ordered > 0, tpa[order] * np.minimum(taken / ordered, 1.0), 0.0)
+    return removed
@@ -0,0 +1,212 @@
+"""
+Phase timers for diagnosing slow simulations.
+Accumulates monotonic-clock time and call counts per named phase
+(competition, growth, crown_ratio, mortality, metrics, volume, export).
+
+Timing is off by default and switched at runtime with enable_timing(), or
+by setting the FVS_TIMING environment variable. While disabled, phase()
+returns a shared no-op context manager, so instrumented code pays only a
+function call and a flag check.
+"""
+import contextvars
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterator, Tuple
+
+
+# Runtime switch for all phase timers
+_enabled = os.environ.get('FVS_TIMING', '').lower() in ('1', 'true', 'yes')
+
+# Timers receiving phases in the current thread or task (innermost last)
+_active_timers: contextvars.ContextVar[Tuple['PhaseTimer', ...]] = contextvars.ContextVar(
+    'fvs_active_timers', default=()
+)
+
+# Shared no-op context returned while timing is disabled
+_NULL_PHASE = nullcontext()
+
+
+def enable_timing(enabled: bool = True) -> None:
+    """Turn phase timing on or off for the whole process.
+
+    Args:
+        enabled: Whether phases are timed
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def timing_enabled() -> bool:
+    """Return whether phase timing is on."""
+    return _enabled
+
+
+class _Phase:
+    """Context manager adding its elapsed time to a set of timers."""
+
+    __slots__ = ('name', 'timers', 'start')
+
+    def __init__(self, name: str, timers: Tuple['PhaseTimer', ...]):
+        self.name = name
+        self.timers = timers
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed = time.perf_counter() - self.start
+        for timer in self.timers:
+            timer.add(self.name, elapsed)
+        return False
+
+
+class PhaseTimer:
+    """Accumulated time and call count per named phase.
+
+    A timer records phases while it is active (see activate()). Timers can
+    be nested, e.g. an engine timer around a stand timer, and every active
+    timer receives each phase, so the stand and the whole run both get a
+    report. Phases may also nest (crown_ratio runs inside growth), so the
+    phase totals can add up to more than the wall time.
+    """
+
+    def __init__(self):
+        """Create an empty timer."""
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Locks cannot be copied or pickled; copies get a fresh one
+        return {'seconds': dict(self.seconds), 'calls': dict(self.calls)}
+
+    def __setstate__(self, state):
+        self.seconds = state['seconds']
+        self.calls = state['calls']
+        self._lock = threading.Lock()
+
+    def add(self, name: str, elapsed: float, calls: int = 1):
+        """Add time to a phase.
+
+        Args:
+            name: Phase name
+            elapsed: Seconds spent in the phase
+            calls: Number of calls the time covers
+        """
+        with self._lock:
+            self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+            self.calls[name] = self.calls.get(name, 0) + calls
+
+    def phase(self, name: str):
+        """Time a block as a phase of this timer only.
+
+        Args:
+            name: Phase name
+
+        Returns:
+            Context manager (a no-op while timing is disabled)
+        """
+        if not _enabled:
+            return _NULL_PHASE
+        return _Phase(name, (self,))
+
+    def activate(self):
+        """Make this timer receive the phases recorded with phase(name).
+
+        Do not hold an activation across a generator's yield; activate
+        around each step instead.
+
+        Returns:
+            Context manager (a no-op while timing is disabled)
+        """
+        if not _enabled:
+            return _NULL_PHASE
+        return self._activation()
+
+    @contextmanager
+    def _activation(self) -> Iterator['PhaseTimer']:
+        token = _active_timers.set(_active_timers.get() + (self,))
+        try:
+            yield self
+        finally:
+            _active_timers.reset(token)
+
+    def merge(self, other: 'PhaseTimer'):
+        """Add another timer's totals to this one.
+
+        Args:
+            other: Timer to merge
+        """
+        for name, seconds in list(other.seconds.items()):
+            self.add(name, seconds, other.calls[name])
+
+    def reset(self):
+        """Clear all phases."""
+        with self._lock:
+            self.seconds.clear()
+            self.calls.clear()
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        """Get the timing report, slowest phase first.
+
+        Returns:
+            Dictionary mapping phase name to 'calls', 'total_s' and 'mean_ms'
+        """
+        with self._lock:
+            seconds_by_phase = dict(self.seconds)
+            calls = dict(self.calls)
+        return {
+            name: {
+                'calls': calls[name],
+                'total_s': seconds,
+                'mean_ms': 1000.0 * seconds / calls[name]
+            }
+            for name, seconds in sorted(seconds_by_phase.items(), key=lambda item: -item[1])
+        }
+
+    def format_report(self) -> str:
+        """Format the timing report as a text table.
+
+        Returns:
+            Report with one line per phase
+        """
+        lines = [f"{'phase':<16}{'calls':>10}{'total (s)':>12}{'mean (ms)':>12}"]
+        for name, row in self.report().items():
+            lines.append(f"{name:<16}{row['calls']:>10}{row['total_s']:>12.4f}{row['mean_ms']:>12.4f}")
+        return '\n'.join(lines)
+
+
+def phase(name: str):
+    """Time a block as a phase of every active timer.
+
+    Args:
+        name: Phase name
+
+    Returns:
+        Context manager (a no-op while timing is disabled or no timer is active)
+    """
+    if not _enabled:
+        return _NULL_PHASE
+    timers = _active_timers.get()
+    if not timers:
+        return _NULL_PHASE
+    return _Phase(name, timers)
+
+
+def timed(name: str) -> Callable:
+    """Decorator timing each call of a function as a phase of the active timers.
+
+    Args:
+        name: Phase name
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -5,10 +5,12 @@ Implements both small-tree and large-tree growth models.
 import math
 import yaml
 import numpy as np
+from typing import List
 from scipy.stats import weibull_min
 from pathlib import Path
 from .validation import ParameterValidator
-from .logging_config import get_logger, log_model_transition
+from .logging_config import get_logger, log_model_transition, transition_events_enabled
+from .timing import phase
 
 class Tree:
     def __init__(self, dbh, height, species="LP", age=0, crown_ratio=0.85):
@@ -32,6 +34,10 @@ class Tree:
         self.age = validated['age']
         self.crown_ratio = validated['crown_ratio']
         
+        # Growth model boundaries crossed in the last grow() call:
+        # (small -> blended, blended -> large)
+        self.last_transitions = (False, False)
+        
         # Set up logging
         self.logger = get_logger(__name__)
         
@@ -44,6 +50,55 @@ class Tree:
         # Load configuration
         self._load_config()
     
+    @classmethod
+    def from_arrays(cls, dbh, height, species="LP", age=0, crown_ratio=0.85) -> List['Tree']:
+        """Create many trees of one species, loading configuration once.
+        
+        Validates the measurements as arrays and shares one set of loaded
+        configuration between the new trees, instead of reading the growth
+        parameters file once per tree as the constructor does.
+        
+        Args:
+            dbh: Diameter at breast height of each tree (inches)
+            height: Total height (feet), scalar or one value per tree
+            species: Species code of all trees
+            age: Tree age in years, scalar or one value per tree
+            crown_ratio: Crown ratio, scalar or one value per tree
+        
+        Returns:
+            List of new Tree objects
+        """
+        bounds = ParameterValidator.BOUNDS
+        dbh = np.clip(np.asarray(dbh, dtype=float), *bounds['dbh'])
+        n = dbh.size
+        height = np.clip(np.broadcast_to(np.asarray(height, dtype=float), (n,)), *bounds['height'])
+        age = np.clip(np.broadcast_to(np.asarray(age), (n,)), *bounds['age']).astype(int)
+        crown_ratio = np.clip(np.broadcast_to(np.asarray(crown_ratio, dtype=float), (n,)),
+                              *bounds['crown_ratio'])
+        
+        template = cls.__new__(cls)
+        template.species = species
+        template.logger = get_logger(__name__)
+        template._load_config()
+        shared = dict(template.__dict__)
+        
+        trees = []
+        for tree_dbh, tree_height, tree_age, tree_cr in zip(
+                dbh.tolist(), height.tolist(), age.tolist(), crown_ratio.tolist()):
+            tree = cls.__new__(cls)
+            tree.__dict__.update(shared)
+            tree.dbh = tree_dbh
+            tree.height = tree_height
+            tree.age = tree_age
+            tree.crown_ratio = tree_cr
+            tree.last_transitions = (False, False)
+            if tree_height > 4.5 and not ParameterValidator.check_height_dbh_relationship(tree_dbh, tree_height):
+                template.logger.warning(
+                    f"Unusual height-DBH relationship: DBH={tree_dbh}, Height={tree_height}"
+                )
+            trees.append(tree)
+        return trees
+    
     def _load_config(self):
         """Load configuration using the new config loader."""
         from .config_loader import get_config_loader
@@ -121,14 +176,6 @@ class Tree:
         else:
             weight = (initial_dbh - xmin) / (xmax - xmin)
             model_used = "blended"
-            
-        # Log model transition if crossing threshold
-        if initial_dbh < xmin and self.dbh >= xmin:
-            log_model_transition(self.logger, f"{self.species}_{id(self)}", 
-                                "small_tree", "blended", self.dbh)
-        elif initial_dbh < xmax and self.dbh >= xmax:
-            log_model_transition(self.logger, f"{self.species}_{id(self)}", 
-                                "blended", "large_tree", self.dbh)
         
         # Temporarily increment age for growth calculations
         self.age = initial_age + time_step
@@ -155,7 +202,18 @@ class Tree:
         self.age = initial_age + time_step
         
         # Update crown ratio using Weibull model
-        self._update_crown_ratio_weibull(rank, relsdi, competition_factor)
+        with phase('crown_ratio'):
+            self._update_crown_ratio_weibull(rank, relsdi, competition_factor)
+        
+        # Record model transitions; stands aggregate these into one summary per cycle
+        self.last_transitions = (initial_dbh < xmin <= self.dbh, initial_dbh <= xmax < self.dbh)
+        if any(self.last_transitions) and transition_events_enabled(self.logger):
+            if self.last_transitions[0]:
+                log_model_transition(self.logger, f"{self.species}_{id(self)}",
+                                     "small_tree", "blended", self.dbh)
+            if self.last_transitions[1]:
+                log_model_transition(self.logger, f"{self.species}_{id(self)}",
+                                     "blended", "large_tree", self.dbh)
     
     def _grow_small_tree(self, site_index, competition_factor, time_step=5):
         """Implement small tree height growth model using Chapman-Richards function.
@@ -0,0 +1,263 @@
+"""
+Per-cycle tree-list output.
+Appends each cycle's tree records to a flat binary file of fixed-size
+records that can be memory-mapped and read back lazily.
+"""
+import json
+import os
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .logging_config import get_logger
+
+
+# Layout of one tree record on disk
+TREE_RECORD_DTYPE = np.dtype([
+    ('stand_id', '<i8'),
+    ('cycle', '<i4'),
+    ('age', '<i4'),
+    ('dbh', '<f8'),
+    ('height', '<f8'),
+    ('crown_ratio', '<f8'),
+    ('tpa', '<f8'),
+    ('volume', '<f8'),
+])
+
+
+def _sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + '.json')
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + '.idx')
+
+
+def _read_index(path: Path) -> Tuple[List[Dict[str, int]], int]:
+    """Read the block index of a tree list.
+
+    Args:
+        path: Tree list file
+
+    Returns:
+        Tuple of (blocks, bytes of complete index lines). A trailing line
+        cut short by an interrupted write is ignored.
+    """
+    blocks: List[Dict[str, int]] = []
+    size = 0
+    index = _index_path(path)
+    if not index.exists():
+        return blocks, size
+    with open(index, 'rb') as f:
+        for line in f:
+            fields = line.split()
+            if not line.endswith(b'\n') or len(fields) != 3:
+                break
+            cycle, start, count = map(int, fields)
+            blocks.append({'cycle': cycle, 'start': start, 'count': count})
+            size += len(line)
+    return blocks, size
+
+
+class TreeListRecorder:
+    """Appends tree records for each cycle to an append-only binary file.
+
+    Records are written straight from NumPy arrays with ``ndarray.tofile``.
+    A JSON sidecar (``<path>.json``) holds the record layout. The cycle,
+    offset and length of every block are appended as one line to an index
+    (``<path>.idx``) after the block's records, so writing stays linear in
+    the number of blocks and the file stays readable if a run stops early.
+    """
+
+    def __init__(self, path: Union[str, Path], append: bool = False):
+        """Open the tree list file.
+
+        Args:
+            path: Output file (conventionally with a .bin suffix)
+            append: Whether to add to an existing file instead of replacing it
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self.logger = get_logger(__name__)
+
+        self.blocks: List[Dict[str, int]] = []
+        self.n_records = 0
+        if append and self.path.exists() and _sidecar_path(self.path).exists():
+            self.blocks, index_size = _read_index(self.path)
+            self.n_records = sum(block['count'] for block in self.blocks)
+            # Drop any partial block written after the last index update
+            with open(self.path, 'r+b') as f:
+                f.truncate(self.n_records * TREE_RECORD_DTYPE.itemsize)
+            self._file = open(self.path, 'ab')
+            self._index = open(_index_path(self.path), 'ab')
+            self._index.truncate(index_size)
+        else:
+            self._file = open(self.path, 'wb')
+            self._index = open(_index_path(self.path), 'wb')
+            self._write_sidecar()
+
+    def record(self,
+               cycle: int,
+               stand_id: Union[int, np.ndarray],
+               age: Union[int, np.ndarray],
+               dbh: np.ndarray,
+               height: np.ndarray,
+               crown_ratio: np.ndarray,
+               tpa: np.ndarray,
+               volume: np.ndarray):
+        """Append one block of tree records.
+
+        Scalar arguments are broadcast to all trees in the block.
+
+        Args:
+            cycle: Growth cycle number (0 for the initial state)
+            stand_id: Stand identifier of each tree
+            age: Stand age of each tree record
+            dbh: Diameter at breast height (inches)
+            height: Total height (feet)
+            crown_ratio: Crown ratio (proportion)
+            tpa: Trees per acre represented by each record
+            volume: Total cubic volume per tree
+        """
+        dbh = np.asarray(dbh)
+        records = np.empty(len(dbh), dtype=TREE_RECORD_DTYPE)
+        records['stand_id'] = stand_id
+        records['cycle'] = cycle
+        records['age'] = age
+        records['dbh'] = dbh
+        records['height'] = height
+        records['crown_ratio'] = crown_ratio
+        records['tpa'] = tpa
+        records['volume'] = volume
+
+        records.tofile(self._file)
+        self._file.flush()
+        self.blocks.append({'cycle': int(cycle), 'start': self.n_records, 'count': len(records)})
+        self._index.write(f"{int(cycle)} {self.n_records} {len(records)}\n".encode())
+        self._index.flush()
+        self.n_records += len(records)
+
+    def record_stand(self, stand, cycle: int, stand_id: int = 0):
+        """Append the trees of a Stand.
+
+        Args:
+            stand: Stand object
+            cycle: Growth cycle number
+            stand_id: Identifier of the stand
+        """
+        trees = stand.trees
+        n = len(trees)
+        self.record(
+            cycle=cycle,
+            stand_id=stand_id,
+            age=stand.age,
+            dbh=np.fromiter((t.dbh for t in trees), float, n),
+            height=np.fromiter((t.height for t in trees), float, n),
+            crown_ratio=np.fromiter((t.crown_ratio for t in trees), float, n),
+            tpa=np.ones(n),
+            volume=stand.calculate_volume()
+        )
+
+    def record_batch(self, batch, cycle: int):
+        """Append the trees of every stand in a StandBatch.
+
+        Stand identifiers must be integers.
+
+        Args:
+            batch: StandBatch object
+            cycle: Growth cycle number
+        """
+        stand_ids = np.asarray(batch.stand_ids, dtype=np.int64)
+        self.record(
+            cycle=cycle,
+            stand_id=stand_ids[batch.stand_index],
+            age=batch.age[batch.stand_index],
+            dbh=batch.dbh,
+            height=batch.height,
+            crown_ratio=batch.crown_ratio,
+            tpa=batch.tpa,
+            volume=batch.calculate_volume()
+        )
+
+    def _write_sidecar(self):
+        meta = {'dtype': TREE_RECORD_DTYPE.descr}
+        sidecar = _sidecar_path(self.path)
+        tmp = sidecar.with_name(sidecar.name + '.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp, sidecar)
+
+    def close(self):
+        """Close the tree list file."""
+        if not self._file.closed:
+            self._file.close()
+            self._index.close()
+            self.logger.info(f"Wrote {self.n_records} tree records to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class TreeListReader:
+    """Lazily reads a tree list written by TreeListRecorder.
+
+    The file is memory-mapped, so selecting a cycle or stand only touches the
+    pages holding those records.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open a tree list file.
+
+        Args:
+            path: Tree list file written by TreeListRecorder
+        """
+        self.path = Path(path)
+        with open(_sidecar_path(self.path)) as f:
+            meta = json.load(f)
+        self.dtype = np.dtype([tuple(field) for field in meta['dtype']])
+        self.blocks = _read_index(self.path)[0]
+        self.n_records = sum(block['count'] for block in self.blocks)
+
+        if self.n_records:
+            self.records = np.memmap(self.path, dtype=self.dtype, mode='r', shape=(self.n_records,))
+        else:
+            self.records = np.empty(0, dtype=self.dtype)
+
+    def __len__(self) -> int:
+        return self.n_records
+
+    @property
+    def cycles(self) -> List[int]:
+        """Cycles present in the file, in order."""
+        return sorted({block['cycle'] for block in self.blocks})
+
+    def read(self, cycle: Optional[int] = None, stand_id: Optional[int] = None) -> np.ndarray:
+        """Read tree records.
+
+        Args:
+            cycle: Only return records of this cycle
+            stand_id: Only return records of this stand
+
+        Returns:
+            Structured array with TREE_RECORD_DTYPE fields. Selecting only a
+            cycle returns memory-mapped views without copying.
+        """
+        if cycle is None:
+            records = self.records
+        else:
+            parts = [self.records[b['start']:b['start'] + b['count']]
+                     for b in self.blocks if b['cycle'] == cycle]
+            if not parts:
+                records = self.records[:0]
+            elif len(parts) == 1:
+                records = parts[0]
+            else:
+                records = np.concatenate(parts)
+
+        if stand_id is not None:
+            records = records[records['stand_id'] == stand_id]
+        return records
@@ -8,8 +8,9 @@ import platform
 import json
 from ctypes import *
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Sequence
 import warnings
+import numpy as np
 
 
 class FortranChar(Structure):
@@ -404,11 +405,11 @@ class VolumeLibrary:
         
         Uses the same method as the current Tree.get_volume() method.
         """
-        from .bark_ratio import create_bark_ratio_model
+        from .bark_ratio import get_bark_ratio_model
         
         try:
             # Convert DBH outside bark to inside bark for volume calculations
-            bark_model = create_bark_ratio_model(species_code)
+            bark_model = get_bark_ratio_model(species_code)
             dbh_inside_bark = bark_model.apply_bark_ratio_to_dbh(dbh)
             
             # Calculate volume using inside bark diameter (FVS standard)
@@ -429,6 +430,40 @@ class VolumeLibrary:
             
             return VolumeResult(vol_array, 0)
     
+    def calculate_total_cubic_volume_array(self, dbh: np.ndarray, height: np.ndarray,
+                                           species_id: np.ndarray,
+                                           species_codes: Sequence[str]) -> np.ndarray:
+        """Calculate total cubic volume for arrays of trees.
+        
+        Without NVEL the fallback equation runs over all trees at once, with
+        bark ratio coefficients gathered by species id.
+        
+        Args:
+            dbh: Diameters at breast height (inches, outside bark)
+            height: Total tree heights (feet)
+            species_id: Index into species_codes for each tree
+            species_codes: FVS species code of each species id
+            
+        Returns:
+            Total cubic volume of each tree (cubic feet)
+        """
+        from .bark_ratio import SpeciesBarkRatios
+        
+        dbh = np.asarray(dbh, dtype=float)
+        height = np.asarray(height, dtype=float)
+        species_id = np.asarray(species_id)
+        
+        if self.dll:
+            return np.array([
+                self.calculate_volume(d, h, species_codes[s]).total_cubic_volume
+                for d, h, s in zip(dbh, height, species_id)
+            ], dtype=float)
+        
+        # Fallback equation (see _fallback_volume_calculation)
+        dbh_inside_bark = SpeciesBarkRatios(species_codes).dib_from_dob(dbh, species_id)
+        basal_area_ib = 3.14159 * (dbh_inside_bark / 24)**2
+        return basal_area_ib * height * 0.48
+    
     def is_available(self) -> bool:
         """Check if volume library is available."""
         return self.dll is not None
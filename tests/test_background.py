@@ -0,0 +1,80 @@
+"""
+Tests for background output I/O.
+"""
+import threading
+import time
+import pytest
+from fvs_python.background import BackgroundWriter
+from fvs_python.simulation_engine import SimulationEngine
+
+
+def test_flush_waits_for_tasks():
+    """Test that flush returns only after queued tasks have run."""
+    results = []
+    with BackgroundWriter() as writer:
+        for i in range(5):
+            writer.submit(lambda i=i: (time.sleep(0.01), results.append(i)))
+        writer.flush()
+        assert results == [0, 1, 2, 3, 4]
+
+
+def test_bounded_queue_applies_backpressure():
+    """Test that submit blocks while the queue is full."""
+    release = threading.Event()
+    writer = BackgroundWriter(max_pending=1)
+    writer.submit(release.wait)       # Occupies the worker
+    writer.submit(lambda: None)       # Fills the queue
+
+    blocked = threading.Thread(target=writer.submit, args=(lambda: None,))
+    blocked.start()
+    blocked.join(timeout=0.2)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(timeout=5)
+    assert not blocked.is_alive()
+    writer.close()
+
+
+def test_task_errors_are_collected():
+    """Test that failing tasks are reported by flush."""
+    writer = BackgroundWriter()
+    writer.submit(lambda: 1 / 0)
+    errors = writer.flush()
+    assert len(errors) == 1
+    assert isinstance(errors[0], ZeroDivisionError)
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit(lambda: None)
+
+
+def test_engine_background_plots(tmp_path):
+    """Test that plots rendered in the background exist after close."""
+    engine = SimulationEngine(tmp_path, background_io=True)
+    engine.simulate_stand(trees_per_acre=20, years=10, save_outputs=False, plot_results=True)
+    engine.close()
+    assert (tmp_path / 'LP_TPA20_SI70_trajectories.png').exists()
+    assert engine.io_writer is None
+
+
+def test_background_plots_bypass_pyplot(tmp_path, monkeypatch):
+    """Test that plots saved on a worker thread never go through pyplot."""
+    import matplotlib.pyplot as plt
+    from fvs_python.growth_plots import plot_mortality_patterns, plot_stand_trajectories
+
+    def no_pyplot(*args, **kwargs):
+        raise AssertionError("pyplot used on a worker thread")
+
+    metrics = [{'age': 5 * i, 'tpa': 500 - 40 * i, 'volume': 100.0 * i, 'mean_height': 5.0 * i,
+                'mean_dbh': 1.0 * i, 'basal_area': 10.0 * i} for i in range(4)]
+    plt.close('all')
+    for name in ('figure', 'subplots', 'savefig', 'show'):
+        monkeypatch.setattr(plt, name, no_pyplot)
+    with BackgroundWriter() as writer:
+        writer.submit(plot_stand_trajectories, metrics, tmp_path / 'trajectories.png')
+        writer.submit(plot_mortality_patterns, metrics, tmp_path / 'mortality.png')
+        assert writer.flush() == []
+
+    assert plt.get_fignums() == []
+    assert (tmp_path / 'trajectories.png').exists()
+    assert (tmp_path / 'mortality.png').exists()
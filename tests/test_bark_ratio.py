@@ -0,0 +1,74 @@
+"""
+Test suite for bark ratio relationship functions.
+"""
+import warnings
+import numpy as np
+import pytest
+
+from fvs_python.bark_ratio import (
+    BarkRatioModel, SpeciesBarkRatios, get_bark_ratio_model
+)
+from fvs_python.volume_library import get_volume_library
+
+
+DIAMETERS = np.array([-1.0, 0.0, 0.3, 0.5, 1.0, 5.0, 12.0, 30.0])
+
+
+@pytest.mark.parametrize('species', ['LP', 'SP', 'SA', 'LL'])
+def test_array_conversions_match_scalar(species):
+    """Test the array DOB/DIB conversions against the scalar methods."""
+    model = BarkRatioModel(species)
+    np.testing.assert_allclose(
+        model.calculate_dib_from_dob_array(DIAMETERS),
+        [model.calculate_dib_from_dob(d) for d in DIAMETERS]
+    )
+    np.testing.assert_allclose(
+        model.calculate_dob_from_dib_array(DIAMETERS),
+        [model.calculate_dob_from_dib(d) for d in DIAMETERS]
+    )
+
+
+def test_species_bark_ratios():
+    """Test gathering coefficients by species id for mixed-species arrays."""
+    species_codes = ['LP', 'SA']
+    ratios = SpeciesBarkRatios(species_codes)
+    species_id = np.arange(len(DIAMETERS)) % 2
+    expected_dib = [
+        get_bark_ratio_model(species_codes[s]).calculate_dib_from_dob(d)
+        for d, s in zip(DIAMETERS, species_id)
+    ]
+    expected_ratio = [
+        get_bark_ratio_model(species_codes[s]).calculate_bark_ratio(d)
+        for d, s in zip(DIAMETERS, species_id)
+    ]
+    np.testing.assert_allclose(ratios.dib_from_dob(DIAMETERS, species_id), expected_dib)
+    np.testing.assert_allclose(ratios.bark_ratio(DIAMETERS, species_id), expected_ratio)
+
+    dib = ratios.dib_from_dob(DIAMETERS, species_id)
+    dob = ratios.dob_from_dib(dib, species_id)
+    large = DIAMETERS >= 5.0
+    np.testing.assert_allclose(dob[large], DIAMETERS[large])
+
+
+def test_shared_model():
+    """Test that shared models are created once per species."""
+    assert get_bark_ratio_model('SP') is get_bark_ratio_model('SP')
+    assert get_bark_ratio_model('SP') is not get_bark_ratio_model('LP')
+
+
+def test_volume_array_matches_scalar():
+    """Test the stand-wide volume calculation against per-tree volumes."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        vol_lib = get_volume_library()
+    species_codes = ['LP', 'SP']
+    dbh = np.array([0.0, 2.0, 8.0, 14.0])
+    height = np.array([4.0, 15.0, 50.0, 80.0])
+    species_id = np.array([0, 1, 0, 1])
+    expected = [
+        vol_lib.calculate_volume(d, h, species_codes[s]).total_cubic_volume
+        for d, h, s in zip(dbh, height, species_id)
+    ]
+    np.testing.assert_allclose(
+        vol_lib.calculate_total_cubic_volume_array(dbh, height, species_id, species_codes), expected
+    )
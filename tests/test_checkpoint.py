@@ -0,0 +1,99 @@
+"""
+Tests for checkpointing and resuming batch simulations.
+"""
+import numpy as np
+import pytest
+from fvs_python.checkpoint import CheckpointStore, run_fingerprint
+from fvs_python.exceptions import InvalidDataError
+from fvs_python.simulation_engine import SimulationEngine
+from fvs_python.stand_batch import StandBatch
+
+
+SCENARIOS = [
+    {'species': 'LP', 'site_index': si, 'trees_per_acre': tpa}
+    for si in (60, 70) for tpa in (20, 40, 60)
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create an engine writing to a temporary directory."""
+    return SimulationEngine(tmp_path)
+
+
+def test_store_round_trip(tmp_path):
+    """Test that a restored batch continues exactly like the original."""
+    batch = StandBatch.initialize_planted(SCENARIOS, seed=5)
+    batch.grow(years=10)
+    metrics = [batch.get_metrics()]
+
+    store = CheckpointStore(tmp_path, 'run')
+    store.save(0, batch, metrics)
+    restored = store.load(0)
+
+    assert not restored['complete']
+    assert restored['cycles'] == 0
+    batch.grow(years=10)
+    restored['batch'].grow(years=10)
+    for key, values in batch.get_metrics().items():
+        assert np.array_equal(values, restored['batch'].get_metrics()[key])
+
+
+def test_store_keeps_numpy_types(tmp_path):
+    """Test that numpy stand identifiers are restored as numbers."""
+    scenarios = [dict(scenario, stand_id=np.int64(10 + i)) for i, scenario in enumerate(SCENARIOS)]
+    batch = StandBatch.initialize_planted(scenarios, seed=5)
+
+    store = CheckpointStore(tmp_path, run_fingerprint(scenarios, 20, 5, 5, None))
+    store.save(0, batch, [batch.get_metrics()])
+    assert store.load(0)['batch'].stand_ids == list(range(10, 16))
+
+    assert run_fingerprint(scenarios, 20, 5, 5, None) != run_fingerprint(
+        [dict(scenario, stand_id=str(10 + i)) for i, scenario in enumerate(SCENARIOS)], 20, 5, 5, None)
+    with pytest.raises(TypeError):
+        run_fingerprint([{'species': object()}], 20, 5, 5, None)
+
+
+def test_store_rejects_other_run(tmp_path):
+    """Test that checkpoints from a different run are not resumed."""
+    batch = StandBatch.initialize_planted(SCENARIOS, seed=5)
+    CheckpointStore(tmp_path, run_fingerprint(SCENARIOS, 20, 5, 5, None)).save(
+        0, batch, [batch.get_metrics()])
+
+    store = CheckpointStore(tmp_path, run_fingerprint(SCENARIOS, 30, 5, 5, None))
+    with pytest.raises(InvalidDataError):
+        store.load(0)
+
+
+def test_checkpointing_does_not_change_results(engine, tmp_path):
+    """Test that a checkpointed run matches a plain run."""
+    plain = engine.simulate_batch(SCENARIOS, years=30, seed=3, chunk_size=4)
+    checkpointed = engine.simulate_batch(SCENARIOS, years=30, seed=3, chunk_size=4,
+                                         checkpoint_dir=tmp_path / 'ck', checkpoint_interval=2)
+    assert plain.equals(checkpointed)
+    assert len(list((tmp_path / 'ck').glob('chunk_*.json'))) == 2
+
+
+def test_resume_after_interruption(engine, tmp_path, monkeypatch):
+    """Test that resuming an interrupted run skips finished work."""
+    expected = engine.simulate_batch(SCENARIOS, years=30, seed=3, chunk_size=4)
+
+    # Interrupt the run part way through the second chunk
+    original_grow = StandBatch.grow
+    calls = {'count': 0}
+
+    def failing_grow(self, years=5):
+        calls['count'] += 1
+        if calls['count'] == 9:
+            raise RuntimeError("preempted")
+        original_grow(self, years)
+
+    monkeypatch.setattr(StandBatch, 'grow', failing_grow)
+    with pytest.raises(RuntimeError):
+        engine.simulate_batch(SCENARIOS, years=30, seed=3, chunk_size=4, resume=True)
+
+    # Resume: the first chunk is skipped, the second restarts at its checkpoint
+    calls['count'] = 0
+    resumed = engine.simulate_batch(SCENARIOS, years=30, seed=3, chunk_size=4, resume=True)
+    assert calls['count'] == 4
+    assert expected.equals(resumed)
@@ -0,0 +1,36 @@
+"""
+Test suite for crown competition factor functions.
+"""
+import numpy as np
+import pytest
+
+from fvs_python.crown_competition_factor import CrownCompetitionFactorModel, get_ccf_model
+
+
+def test_stand_ccf_array_matches_tree_dicts():
+    """Test the array API against the per-tree dictionary API."""
+    model = CrownCompetitionFactorModel()
+    species_codes = ['LP', 'SA']
+    dbh = np.array([0.0, 0.1, 2.0, 8.0, 12.0, 16.0])
+    species_id = np.array([0, 0, 1, 0, 1, 1])
+    expansion = np.array([10.0, 5.0, 3.0, 2.0, 1.0, 1.5])
+
+    stand_ccf, tree_ccf = model.calculate_stand_ccf_array(dbh, species_id, expansion, species_codes)
+
+    trees = [
+        {'dbh': d, 'species': species_codes[s], 'expansion_factor': e}
+        for d, s, e in zip(dbh, species_id, expansion)
+    ]
+    assert stand_ccf == pytest.approx(model.calculate_stand_ccf(trees))
+    assert tree_ccf[0] == 0.0
+    assert tree_ccf[1] == model.small_tree_ccf
+    np.testing.assert_allclose(
+        tree_ccf[2:],
+        [model.calculate_individual_ccf(d, species_code=species_codes[s])
+         for d, s in zip(dbh[2:], species_id[2:])]
+    )
+
+
+def test_shared_model():
+    """Test that the shared model is created once."""
+    assert get_ccf_model() is get_ccf_model()
@@ -0,0 +1,51 @@
+"""
+Test suite for crown width relationship functions.
+"""
+import numpy as np
+import pytest
+
+from fvs_python.crown_width import CrownWidthModel, _parse_bounds
+
+
+# Covers the linear, power, Bechtold and Bragg forms and both bound types
+SPECIES = ['LP', 'SP', 'SA', 'LL', 'WO', 'RM', 'PD', 'BB']
+DBH = np.array([0.0, 0.05, 1.0, 2.9, 3.0, 4.99, 5.0, 10.0, 29.9, 29.95, 30.0, 45.0, 100.0])
+
+
+def test_parse_bounds():
+    """Test parsing of the bounds column."""
+    assert _parse_bounds('FCW < 55', 'FCW') == (55.0, np.inf)
+    assert _parse_bounds('DBH < 30', 'FCW') == (np.inf, 30.0)
+    assert _parse_bounds('', 'OCW') == (np.inf, np.inf)
+
+
+@pytest.mark.parametrize('species', SPECIES)
+def test_forest_crown_width_array_matches_scalar(species):
+    """Test the array FCW against the scalar equation with per-tree CR and HI."""
+    model = CrownWidthModel(species)
+    crown_ratio = np.linspace(10, 90, len(DBH))
+    hopkins_index = np.linspace(-5, 5, len(DBH))
+    expected = [
+        model.calculate_forest_grown_crown_width(d, cr, hi)
+        for d, cr, hi in zip(DBH, crown_ratio, hopkins_index)
+    ]
+    np.testing.assert_allclose(
+        model.calculate_forest_grown_crown_width_array(DBH, crown_ratio, hopkins_index), expected
+    )
+
+
+@pytest.mark.parametrize('species', SPECIES)
+def test_open_crown_width_array_matches_scalar(species):
+    """Test the array OCW against the scalar equation, including bounds."""
+    model = CrownWidthModel(species)
+    expected = [model.calculate_open_grown_crown_width(d) for d in DBH]
+    np.testing.assert_allclose(model.calculate_open_grown_crown_width_array(DBH), expected)
+
+
+def test_small_tree_scaling():
+    """Test that small trees are scaled linearly from the width at 5 and 3 inches."""
+    model = CrownWidthModel('LP')
+    fcw_at_5 = model.calculate_forest_grown_crown_width(5.0, 40.0)
+    ocw_at_3 = model.calculate_open_grown_crown_width(3.0)
+    assert model.calculate_forest_grown_crown_width(2.5, 40.0) == pytest.approx(fcw_at_5 / 2)
+    assert model.calculate_open_grown_crown_width(1.5) == pytest.approx(ocw_at_3 / 2)
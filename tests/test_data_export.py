@@ -0,0 +1,109 @@
+"""
+Tests for columnar (Parquet/Arrow) data export.
+"""
+import pandas as pd
+import pytest
+from fvs_python.data_export import DataExporter
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+@pytest.fixture
+def yield_table():
+    """Create a small yield table."""
+    rows = []
+    for species in ('LP', 'SP'):
+        for site_index in (60, 70):
+            for age in (0, 5, 10):
+                rows.append({
+                    'age': age, 'tpa': 500 - age, 'mean_dbh': 0.5 + age * 0.4,
+                    'mean_height': 1.0 + age * 3, 'basal_area': age * 2.0,
+                    'volume': age * 10.0, 'ccf': age * 5.0,
+                    'species': species, 'site_index': site_index, 'initial_tpa': 500
+                })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    return DataExporter(tmp_path)
+
+
+def test_parquet_typed_schema(exporter, yield_table):
+    """Test that Parquet export uses the typed result schema."""
+    path = exporter.export_to_parquet(yield_table, 'yield')
+    table = pq.read_table(path)
+
+    assert table.num_rows == len(yield_table)
+    assert table.schema.field('age').type == pa.int32()
+    assert table.schema.field('tpa').type == pa.float64()
+    assert table.schema.field('site_index').type == pa.float64()
+    assert table.schema.field('species').type == pa.string()
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == 'ZSTD'
+
+
+def test_parquet_partitioned(exporter, yield_table):
+    """Test partitioning by species and site index."""
+    path = exporter.export_to_parquet(yield_table, 'yield', partition_cols=['species', 'site_index'])
+
+    assert (path / 'species=LP' / 'site_index=60').is_dir()
+    df = pq.read_table(path).to_pandas()
+    assert len(df) == len(yield_table)
+    assert sorted(df['species'].astype(str).unique()) == ['LP', 'SP']
+
+
+def test_parquet_partitioned_reexport(exporter, yield_table):
+    """Test that exporting again to a dataset replaces all earlier partitions."""
+    exporter.export_to_parquet(yield_table, 'yield', partition_cols=['species'])
+    lp = yield_table[yield_table['species'] == 'LP']
+    path = exporter.export_to_parquet(lp, 'yield', partition_cols=['species'])
+
+    assert not (path / 'species=SP').exists()
+    df = pq.read_table(path).to_pandas()
+    assert len(df) == len(lp)
+    assert sorted(df['species'].astype(str).unique()) == ['LP']
+
+
+def test_parquet_partitioned_keeps_foreign_directory(exporter, yield_table):
+    """Test that a partitioned export never deletes a directory that is not a dataset."""
+    other = exporter.output_dir / 'results'
+    other.mkdir()
+    (other / 'important.csv').write_text('keep')
+
+    with pytest.raises(FileExistsError):
+        exporter.export_to_parquet(yield_table, 'results', partition_cols=['species'])
+    for filename in ('', '.'):
+        with pytest.raises(ValueError):
+            exporter.export_to_parquet(yield_table, filename, partition_cols=['species'])
+
+    assert (other / 'important.csv').read_text() == 'keep'
+    assert sorted(p.name for p in exporter.output_dir.iterdir()) == ['results']
+
+
+def test_parquet_incremental_append(exporter, yield_table):
+    """Test appending row groups one block at a time."""
+    with exporter.parquet_writer('yield') as writer:
+        for _, block in yield_table.groupby('species'):
+            writer.write(block)
+
+    path = exporter.output_dir / 'yield.parquet'
+    assert pq.ParquetFile(path).num_row_groups == 2
+    assert writer.rows_written == len(yield_table)
+
+
+def test_arrow_ipc(exporter, yield_table):
+    """Test Arrow IPC export round trip."""
+    path = exporter.export_to_arrow(yield_table, 'yield')
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+
+    assert table.num_rows == len(yield_table)
+    assert table.schema.field('initial_tpa').type == pa.int32()
+
+
+def test_export_yield_table_parquet(exporter, yield_table):
+    """Test yield table export in Parquet format."""
+    path = exporter.export_yield_table(yield_table, format='parquet', filename='yt')
+    assert path.suffix == '.parquet'
+    assert pq.read_table(path).num_rows == len(yield_table)
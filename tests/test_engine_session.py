@@ -0,0 +1,45 @@
+"""
+Tests for reusable simulation engine sessions.
+"""
+import logging
+from fvs_python.logging_config import ensure_logging, is_logging_configured
+from fvs_python.simulation_engine import SimulationEngine, get_engine
+
+
+def test_context_manager_lifecycle(tmp_path):
+    """Test opening, closing and reopening an engine session."""
+    with SimulationEngine(tmp_path, background_io=True) as engine:
+        assert engine.is_open
+        assert engine.io_writer is not None
+        engine.simulate_stand(trees_per_acre=20, years=5, save_outputs=False, plot_results=False)
+    assert not engine.is_open
+    assert engine.io_writer is None
+
+    engine.open()
+    assert engine.is_open
+    assert engine.io_writer is not None
+    engine.close()
+
+
+def test_logging_configured_once(tmp_path):
+    """Test that engines do not add log files or handlers after the first."""
+    SimulationEngine(tmp_path / 'first')
+    assert is_logging_configured()
+    handlers = list(logging.getLogger('fvs_python').handlers)
+
+    for i in range(3):
+        SimulationEngine(tmp_path / f'engine_{i}').close()
+        assert not list((tmp_path / f'engine_{i}').glob('*.log'))
+
+    assert logging.getLogger('fvs_python').handlers == handlers
+    assert ensure_logging(tmp_path) is None
+
+
+def test_get_engine_reuses_session(tmp_path):
+    """Test that the shared engine for a directory is reused and reopened."""
+    engine = get_engine(tmp_path)
+    assert get_engine(tmp_path) is engine
+
+    engine.close()
+    assert get_engine(str(tmp_path)) is engine
+    assert engine.is_open
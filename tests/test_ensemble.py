@@ -0,0 +1,62 @@
+"""
+Tests for Monte Carlo ensemble simulations.
+"""
+import numpy as np
+import pytest
+from fvs_python.simulation_engine import SimulationEngine
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create an engine writing to a temporary directory."""
+    return SimulationEngine(tmp_path)
+
+
+def test_ensemble_summary(engine):
+    """Test the per-age statistics of an ensemble."""
+    df = engine.simulate_ensemble(trees_per_acre=300, years=20, n_replicates=40, seed=1,
+                                  save_outputs=False)
+
+    assert df['age'].tolist() == [0, 5, 10, 15, 20]
+    assert (df['n_replicates'] == 40).all()
+    for metric in ('tpa', 'basal_area', 'volume'):
+        for stat in ('mean', 'std', 'q5', 'q50', 'q95'):
+            assert f"{metric}_{stat}" in df.columns
+        assert (df[f"{metric}_q5"] <= df[f"{metric}_q50"]).all()
+        assert (df[f"{metric}_q50"] <= df[f"{metric}_q95"]).all()
+    assert (df['tpa_std'].iloc[1:] > 0).all()
+    assert (df['mean_dbh_mean'].diff().iloc[1:] > 0).all()
+
+
+def test_ensemble_matches_batch(engine):
+    """Test that ensemble statistics summarize the equivalent batch run."""
+    scenario = {'species': 'LP', 'trees_per_acre': 200, 'site_index': 70}
+    batch = engine.simulate_batch([scenario] * 10, years=15, seed=3)
+    df = engine.simulate_ensemble(trees_per_acre=200, years=15, n_replicates=10, seed=3,
+                                  quantiles=(0.5,), save_outputs=False)
+
+    grouped = batch.groupby('age')['basal_area']
+    np.testing.assert_allclose(df['basal_area_mean'], grouped.mean())
+    np.testing.assert_allclose(df['basal_area_std'], grouped.std())
+    np.testing.assert_allclose(df['basal_area_q50'], grouped.median())
+
+
+def test_ensemble_reproducible_and_chunked(engine):
+    """Test seeded ensembles and replicates split into chunks."""
+    kwargs = dict(trees_per_acre=150, years=10, n_replicates=12, seed=5, save_outputs=False)
+    first = engine.simulate_ensemble(**kwargs)
+    assert first.equals(engine.simulate_ensemble(**kwargs))
+
+    chunked = engine.simulate_ensemble(chunk_size=5, **kwargs)
+    assert chunked.shape == first.shape
+    assert (chunked['n_replicates'] == 12).all()
+
+
+def test_single_replicate(engine):
+    """Test that one replicate has zero spread and n_replicates is validated."""
+    df = engine.simulate_ensemble(trees_per_acre=100, years=5, n_replicates=1, seed=2,
+                                  save_outputs=False)
+    assert (df['tpa_std'] == 0).all()
+    assert (df['tpa_q5'] == df['tpa_q95']).all()
+    with pytest.raises(ValueError):
+        engine.simulate_ensemble(n_replicates=0, save_outputs=False)
@@ -0,0 +1,62 @@
+"""
+Tests for streaming Excel export.
+"""
+import pandas as pd
+import pytest
+from fvs_python.data_export import DataExporter, ExcelStreamWriter
+
+openpyxl = pytest.importorskip('openpyxl')
+
+
+def make_yield_table(species, n_ages=4):
+    return pd.DataFrame({
+        'age': [a * 5 for a in range(n_ages)] * 2,
+        'tpa': [500.0 - a for a in range(n_ages)] * 2,
+        'volume': [a * 10.0 for a in range(n_ages)] + [a * 30.0 for a in range(n_ages)],
+        'species': species
+    })
+
+
+def test_export_to_excel(tmp_path):
+    """Test that rows round-trip through the write-only workbook."""
+    df = make_yield_table('LP')
+    path = DataExporter(tmp_path).export_to_excel(df, 'yield')
+
+    result = pd.read_excel(path, sheet_name='Data')
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+
+
+def test_blocks_stream_into_one_sheet(tmp_path):
+    """Test streaming DataFrame blocks sheet by sheet."""
+    with ExcelStreamWriter(tmp_path / 'yield.xlsx') as writer:
+        writer.write_sheet('LP', (make_yield_table('LP') for _ in range(3)))
+        writer.write_sheet('SP', make_yield_table('SP'))
+
+    workbook = openpyxl.load_workbook(tmp_path / 'yield.xlsx', read_only=True)
+    assert workbook.sheetnames == ['LP', 'SP']
+    assert len(list(workbook['LP'].iter_rows())) == 1 + 3 * 8
+    assert writer.rows_written == 4 * 8
+
+
+def test_sheet_overflow(tmp_path, monkeypatch):
+    """Test that rows past the sheet limit continue on a new sheet."""
+    monkeypatch.setattr(ExcelStreamWriter, 'MAX_ROWS', 5)
+    with ExcelStreamWriter(tmp_path / 'yield.xlsx') as writer:
+        writer.write_sheet('Data', make_yield_table('LP'))
+
+    workbook = openpyxl.load_workbook(tmp_path / 'yield.xlsx', read_only=True)
+    assert workbook.sheetnames == ['Data', 'Data_2']
+
+
+def test_charts_use_aggregated_summary(tmp_path):
+    """Test that charts are built from a mean-by-age summary sheet."""
+    df = make_yield_table('LP')
+    path = DataExporter(tmp_path).export_yield_table(df, format='excel', filename='yield',
+                                                    include_charts=True)
+
+    summary = pd.read_excel(path, sheet_name='Data_summary')
+    assert list(summary['age']) == [0, 5, 10, 15]
+    assert list(summary['volume']) == [0.0, 20.0, 40.0, 60.0]
+
+    workbook = openpyxl.load_workbook(path)
+    assert len(workbook['Data_summary']._charts) == 2
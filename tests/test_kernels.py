@@ -0,0 +1,95 @@
+"""
+Tests for the StandBatch kernel backends.
+"""
+import numpy as np
+import pytest
+from fvs_python import kernels
+from fvs_python.stand_batch import StandBatch
+
+
+SCENARIOS = [
+    {'species': species, 'site_index': si, 'trees_per_acre': tpa}
+    for species in ('LP', 'SP', 'SA', 'LL') for si in (60, 80) for tpa in (100, 400)
+]
+
+
+@pytest.fixture
+def backend():
+    """Restore the kernel backend after a test."""
+    previous = kernels.get_kernel_backend()
+    yield
+    kernels.set_kernel_backend(previous)
+
+
+@pytest.fixture
+def batch():
+    """Create a grown batch with trees of every growth model."""
+    batch = StandBatch.initialize_planted(SCENARIOS, seed=3)
+    batch.grow(years=15)
+    return batch
+
+
+def test_backend_selection(backend, monkeypatch):
+    """Test selecting backends and the fallback without numba."""
+    assert kernels.set_kernel_backend('numpy') == 'numpy'
+    assert kernels.get_kernel_backend() == 'numpy'
+    with pytest.raises(ValueError):
+        kernels.set_kernel_backend('cuda')
+
+    monkeypatch.setattr(kernels, '_JIT_KERNELS', None)
+    assert kernels.available_backends() == ('numpy',)
+    assert kernels.set_kernel_backend('auto') == 'numpy'
+    with pytest.raises(ImportError):
+        kernels.set_kernel_backend('numba')
+
+
+def _kernel_calls(batch):
+    p = batch.params
+    n = batch.n_records
+    rng = np.random.default_rng(0)
+    sid = batch.species_id
+    site_index = batch.site_index[batch.stand_index]
+    competition_factor = rng.uniform(0, 0.95, n)
+    order = batch._segment_sort(batch.dbh)
+    seg = batch.stand_index[order]
+    tree_ba = batch._basal_area()
+    return {
+        'small_tree_height_growth': (sid, site_index, batch.tree_age, competition_factor, 5, 0.2,
+                                     p.small_tree_coefficients),
+        'large_tree_diameter': (sid, batch.dbh, batch.height, batch.crown_ratio, site_index,
+                                rng.uniform(0, 200, n), rng.uniform(0, 150, n), 0.05, 0.3, 5,
+                                p.dds_coefficients),
+        'weibull_crown_ratio': (sid, rng.uniform(0, 1, n), rng.uniform(0, 15, n), competition_factor,
+                                batch.tree_age, 0.003, 0.5, p.crown_ratio_coefficients),
+        'pbal_rank': (order, seg, tree_ba, batch.tpa, batch.offsets[:-1][seg],
+                      batch._segment_sum(tree_ba), batch._segment_sum(batch.tpa)),
+    }
+
+
+@pytest.mark.parametrize('name', ['small_tree_height_growth', 'large_tree_diameter',
+                                  'weibull_crown_ratio', 'pbal_rank'])
+def test_jit_kernels_match_reference(name, batch, backend):
+    """Test each JIT kernel against the NumPy reference."""
+    pytest.importorskip('numba')
+    args = _kernel_calls(batch)[name]
+    kernels.set_kernel_backend('numpy')
+    expected = getattr(kernels, name)(*args)
+    kernels.set_kernel_backend('numba')
+    actual = getattr(kernels, name)(*args)
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=1e-12)
+
+
+def test_jit_batch_growth_matches_reference(backend):
+    """Test that whole batch simulations agree between backends."""
+    pytest.importorskip('numba')
+    results = {}
+    for name in ('numpy', 'numba'):
+        kernels.set_kernel_backend(name)
+        batch = StandBatch.initialize_planted(SCENARIOS, seed=7)
+        batch.grow(years=40)
+        results[name] = batch
+
+    np.testing.assert_array_equal(results['numba'].stand_index, results['numpy'].stand_index)
+    for attr in ('dbh', 'height', 'crown_ratio', 'tpa'):
+        np.testing.assert_allclose(getattr(results['numba'], attr), getattr(results['numpy'], attr),
+                                   rtol=1e-10)
@@ -0,0 +1,53 @@
+"""
+Test suite for the large tree height growth model.
+"""
+import numpy as np
+import pytest
+
+from fvs_python.large_tree_height_growth import LargeTreeHeightGrowthModel
+
+
+@pytest.fixture(scope='module')
+def trees():
+    rng = np.random.default_rng(7)
+    n = 200
+    return {
+        'dbh': rng.uniform(0.5, 40.0, n),
+        'crown_ratio': rng.uniform(0.0, 1.0, n),
+        'relative_height': rng.uniform(0.0, 1.5, n),
+        'site_index': rng.uniform(30.0, 140.0, n),
+        'tree_height': rng.uniform(5.0, 150.0, n),
+        'tree_age': rng.uniform(1.0, 200.0, n)
+    }
+
+
+@pytest.mark.parametrize('species', ['LP', 'SP', 'SA', 'LL'])
+@pytest.mark.parametrize('known', [(), ('tree_height',), ('tree_age', 'tree_height')])
+def test_height_growth_array_matches_scalar(trees, species, known):
+    """Test the array height growth against the per-tree calculation."""
+    model = LargeTreeHeightGrowthModel(species)
+    optional = {name: trees[name] for name in known}
+    result = model.calculate_height_growth_array(
+        trees['dbh'], trees['crown_ratio'], trees['relative_height'], trees['site_index'],
+        **optional
+    )
+    expected = [
+        model.calculate_height_growth(
+            trees['dbh'][i], trees['crown_ratio'][i], trees['relative_height'][i],
+            trees['site_index'][i], basal_area=100.0, pbal=20.0,
+            **{name: values[i] for name, values in optional.items()}
+        )
+        for i in range(len(trees['dbh']))
+    ]
+    np.testing.assert_allclose(result, expected)
+
+
+def test_age_estimate_domains():
+    """Test the masked inverse Chapman-Richards domains."""
+    model = LargeTreeHeightGrowthModel('LP')
+    coeffs = model._small_tree_coefficients
+    height = np.array([0.0, 30.0, 60.0, 500.0])
+    ages = model._estimate_age_from_height_array(height, 70.0, coeffs)
+    expected = [model._estimate_age_from_height(h, 70.0, coeffs) for h in height]
+    np.testing.assert_allclose(ages, expected)
+    assert ages[-1] == 50.0
@@ -0,0 +1,139 @@
+"""
+Tests for asynchronous logging and simulation log context.
+"""
+import asyncio
+import logging
+import logging.handlers
+import multiprocessing
+import threading
+import pytest
+from fvs_python.logging_config import (
+    setup_logging, stop_queue_listener, configure_worker_logging, get_logger,
+    SimulationLogContext, SimulationContextFilter, get_log_context
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_logging():
+    """Return to synchronous console logging after each test."""
+    yield
+    stop_queue_listener()
+    setup_logging(log_level='INFO')
+
+
+def _worker(log_queue, index):
+    configure_worker_logging(log_queue)
+    get_logger('fvs_python.worker').info(f"worker {index} finished")
+
+
+def test_async_logging_writes_on_listener(tmp_path):
+    """Test that loggers only hold a QueueHandler and records reach the file."""
+    log_file = tmp_path / 'async.log'
+    setup_logging(log_file=log_file, structured=True, async_logging=True)
+
+    handlers = logging.getLogger('fvs_python').handlers
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    logger = get_logger('fvs_python.test')
+    for i in range(100):
+        logger.info(f"message {i}")
+    stop_queue_listener()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 100
+    assert '"message": "message 99"' in lines[-1]
+
+
+def test_worker_processes_merge_into_parent(tmp_path):
+    """Test that records from worker processes are written by the parent."""
+    log_file = tmp_path / 'workers.log'
+    context = multiprocessing.get_context('fork')
+    log_queue = context.Queue()
+    setup_logging(log_file=log_file, log_queue=log_queue)
+
+    workers = [context.Process(target=_worker, args=(log_queue, i)) for i in range(3)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    stop_queue_listener()
+
+    text = log_file.read_text()
+    for i in range(3):
+        assert f"worker {i} finished" in text
+
+
+class _CaptureHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.addFilter(SimulationContextFilter())
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def capture():
+    """Attach a capturing handler with the context filter."""
+    handler = _CaptureHandler()
+    logger = get_logger('fvs_python.context_test')
+    logger.addHandler(handler)
+    yield logger, handler
+    logger.removeHandler(handler)
+
+
+def test_nested_context(capture):
+    """Test that nested contexts merge and restore on exit."""
+    logger, handler = capture
+    with SimulationLogContext(logger, species='LP'):
+        with SimulationLogContext(logger, stand_id=3):
+            assert get_log_context() == {'species': 'LP', 'stand_id': 3}
+            logger.info('inner')
+        logger.info('outer')
+    logger.info('none')
+
+    inner, outer, none = handler.records
+    assert (inner.species, inner.stand_id) == ('LP', 3)
+    assert outer.species == 'LP' and not hasattr(outer, 'stand_id')
+    assert not hasattr(none, 'species')
+
+
+def test_context_isolated_between_threads(capture):
+    """Test that concurrent threads stamp only their own context."""
+    logger, handler = capture
+    barrier = threading.Barrier(4)
+
+    def simulate(species):
+        with SimulationLogContext(logger, species=species):
+            barrier.wait()
+            for i in range(20):
+                logger.info(species)
+
+    threads = [threading.Thread(target=simulate, args=(sp,)) for sp in ('LP', 'SP', 'SA', 'LL')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(handler.records) == 80
+    assert all(record.species == record.getMessage() for record in handler.records)
+
+
+def test_context_isolated_between_tasks(capture):
+    """Test that asyncio tasks stamp only their own context."""
+    logger, handler = capture
+
+    async def simulate(species):
+        with SimulationLogContext(logger, species=species):
+            for i in range(5):
+                await asyncio.sleep(0)
+                logger.info(species)
+
+    async def main():
+        await asyncio.gather(*(simulate(sp) for sp in ('LP', 'SP', 'SA')))
+
+    asyncio.run(main())
+    assert len(handler.records) == 15
+    assert all(record.species == record.getMessage() for record in handler.records)
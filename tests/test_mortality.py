@@ -0,0 +1,131 @@
+"""
+Tests for the SDI-based mortality model.
+"""
+import math
+import random
+import numpy as np
+import pytest
+from fvs_python.mortality import SDIMortalityModel, get_mortality_model
+from fvs_python.stand import Stand
+from fvs_python.stand_batch import StandBatch
+
+
+def _stands(tpa_scale, n_records=200, seed=0):
+    rng = np.random.default_rng(seed)
+    stand_index = np.repeat(np.arange(len(tpa_scale)), n_records)
+    dbh = rng.uniform(3.0, 12.0, len(stand_index))
+    tpa = np.asarray(tpa_scale, dtype=float)[stand_index]
+    return dbh, tpa, stand_index
+
+
+def test_background_rate():
+    """Test equations 5.0.1 and 5.0.2 against the LP coefficients."""
+    model = SDIMortalityModel()
+    p = model.coefficients['LP']
+    ri = 1.0 / (1.0 + math.exp(p['p0'] + p['p1'] * 8.0))
+    rate = model.calculate_background_rate_array(np.array([8.0]), np.array([0]), ['LP'], years=5)
+    assert rate[0] == pytest.approx(1.0 - (1.0 - ri) ** 5)
+
+
+def test_dispersal_rate_bounds():
+    """Test that MR is bounded and small trees get higher rates."""
+    model = SDIMortalityModel()
+    pct = np.linspace(0.0, 100.0, 11)
+    mort = model.calculate_dispersal_rate_array(pct, np.zeros(11, dtype=int), ['LP'])
+    mwt = model.mwt_values['LP']
+    assert np.all(mort >= 0.01 * mwt * 0.1 - 1e-12)
+    assert np.all(mort <= mwt * 0.1)
+    assert mort[0] > mort[-1]
+
+
+def test_background_below_threshold():
+    """Test that open stands only get background mortality."""
+    model = SDIMortalityModel()
+    dbh, tpa, stand_index = _stands([0.1])
+    killed = model.calculate_mortality_array(dbh, tpa, np.zeros(len(dbh), dtype=int),
+                                             stand_index, np.array([480.0]))
+    expected = tpa * model.calculate_background_rate_array(dbh, np.zeros(len(dbh), dtype=int))
+    np.testing.assert_allclose(killed, expected)
+
+
+def test_density_mortality_reaches_target():
+    """Test that dense stands are reduced to their target SDI in one pass."""
+    model = SDIMortalityModel()
+    dbh, tpa, stand_index = _stands([0.1, 4.0, 6.0, 8.0])
+    species_id = np.zeros(len(dbh), dtype=int)
+    max_sdi = np.full(4, 480.0)
+
+    killed = model.calculate_mortality_array(dbh, tpa, species_id, stand_index, max_sdi)
+    before = np.bincount(stand_index, model.calculate_sdi_array(dbh, tpa))
+    after = np.bincount(stand_index, model.calculate_sdi_array(dbh, tpa - killed))
+
+    assert np.all(killed >= 0) and np.all(killed <= tpa)
+    dense = before > model.density_threshold * max_sdi
+    assert dense[1:].all()
+    np.testing.assert_allclose(after[dense], model.calculate_target_sdi(before, max_sdi)[dense], rtol=1e-8)
+    assert np.all(after <= model.sdi_upper * max_sdi)
+
+    # Suppressed trees lose a larger share of their trees per acre
+    densest = stand_index == 3
+    share = killed[densest] / tpa[densest]
+    order = np.argsort(dbh[densest])
+    assert share[order[0]] > share[order[-1]]
+
+
+def test_shared_model():
+    """Test that the shared model is created once."""
+    assert get_mortality_model() is get_mortality_model()
+
+
+def _dense_batch(seed=3):
+    return StandBatch.initialize_planted([
+        {'species': 'LP', 'site_index': 80, 'trees_per_acre': 600},
+        {'species': 'SP', 'site_index': 60, 'trees_per_acre': 100},
+    ], seed=seed)
+
+
+def test_batch_sdi_mortality_deterministic():
+    """Test that deterministic SDI mortality reduces trees per acre, not records."""
+    results = []
+    for seed in (1, 2):
+        batch = _dense_batch(seed=5)
+        batch.mortality_model = 'sdi'
+        batch.grow(years=10)
+        n_records = batch.n_records
+        batch.rng = np.random.default_rng(seed)
+        initial_tpa = batch._segment_sum(batch.tpa)
+        mortality = batch._apply_mortality()
+
+        assert batch.n_records == n_records
+        np.testing.assert_allclose(batch._segment_sum(batch.tpa), initial_tpa - mortality)
+        assert np.all(mortality > 0)
+        results.append(batch.tpa)
+    # The random number generator is not used
+    np.testing.assert_array_equal(results[0], results[1])
+
+
+def test_batch_sdi_mortality_stochastic():
+    """Test that stochastic SDI mortality removes whole records."""
+    batch = _dense_batch()
+    batch.mortality_model = 'sdi'
+    batch.stochastic_mortality = True
+    batch.grow(years=20)
+    assert np.all(batch.tpa == 1.0)
+    assert batch._segment_sum(batch.tpa)[0] < 600
+
+
+def test_unknown_mortality_model():
+    """Test that an unknown mortality model raises."""
+    batch = _dense_batch()
+    batch.mortality_model = 'coin_flip'
+    with pytest.raises(ValueError):
+        batch.grow(years=5)
+
+
+def test_stand_sdi_mortality():
+    """Test the SDI model on a per-tree Stand."""
+    random.seed(11)
+    stand = Stand.initialize_planted(trees_per_acre=100, site_index=70, species='LP')
+    stand.mortality_model = 'sdi'
+    stand.grow(years=10)
+    assert 0 < len(stand.trees) <= 100
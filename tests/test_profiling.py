@@ -0,0 +1,62 @@
+"""
+Tests for the profilers and the profile CLI command.
+"""
+import sys
+import time
+import pytest
+from fvs_python import cli
+from fvs_python.profiling import profile_call
+from fvs_python.timing import timing_enabled
+
+
+def _busy(seconds=0.05):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += sum(range(100))
+    return total
+
+
+def _read_collapsed(path):
+    stacks = {}
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(' ', 1)
+        stacks[stack] = int(count)
+    return stacks
+
+
+@pytest.mark.parametrize('profiler', ['deterministic', 'sampling'])
+def test_profile_call_writes_reports(tmp_path, profiler):
+    """Test that both profilers write a summary and collapsed stacks."""
+    result, files = profile_call(_busy, tmp_path / 'busy', profiler=profiler, interval=0.001)
+    assert result > 0
+    assert files['summary'].exists()
+    assert '_busy' in files['summary'].read_text()
+
+    stacks = _read_collapsed(files['collapsed'])
+    assert stacks
+    assert all(count > 0 for count in stacks.values())
+    assert any('_busy' in stack for stack in stacks)
+    assert ('stats' in files) == (profiler == 'deterministic')
+
+
+def test_profile_call_rejects_unknown_profiler(tmp_path):
+    """Test that an unknown profiler name raises."""
+    with pytest.raises(ValueError):
+        profile_call(_busy, tmp_path / 'busy', profiler='perf')
+
+
+def test_profile_command(tmp_path, monkeypatch, capsys):
+    """Test profiling a simulation from the command line."""
+    monkeypatch.setattr(sys, 'argv', [
+        'fvs-python', 'profile', '--profiler', 'sampling',
+        'run', '--tpa', '10', '--years', '5', '--no-plots', '--no-save',
+        '--output-dir', str(tmp_path)
+    ])
+    assert cli.main() == 0
+
+    out = capsys.readouterr().out
+    assert 'growth' in out and 'mortality' in out
+    assert (tmp_path / 'profile.txt').exists()
+    assert (tmp_path / 'profile.collapsed').exists()
+    assert not timing_enabled()
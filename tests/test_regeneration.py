@@ -0,0 +1,104 @@
+"""
+Tests for regeneration and bulk record insertion.
+"""
+import math
+import random
+import numpy as np
+import pytest
+from fvs_python.checkpoint import CheckpointStore
+from fvs_python.crown_ratio import create_crown_ratio_model
+from fvs_python.regeneration import get_regeneration_model
+from fvs_python.stand import Stand
+from fvs_python.stand_batch import StandBatch
+from fvs_python.tree import Tree
+
+
+def test_seedling_height():
+    """Test the small-tree height equation and the seedling height bounds."""
+    model = get_regeneration_model()
+    c = model.small_tree_coefficients['LP']
+    expected = c['c1'] * 70 ** c['c2'] * (1 - math.exp(c['c3'] * 5)) ** (c['c4'] * 70 ** c['c5'])
+
+    height = model.calculate_seedling_height_array([0, 0, 0], [70, 70, 70], [5, 0, 40], ['LP'])
+    assert height[0] == pytest.approx(expected)
+    assert height[1] == model.parameters['LP']['min_height']
+    assert height[2] == model.parameters['LP']['max_height']
+
+
+def test_regeneration_crown_ratio_array():
+    """Test the array form of equation 4.3.3.1."""
+    model = create_crown_ratio_model('LP')
+    pccf = np.linspace(0, 400, 1000)
+    crown_ratio = model.predict_regeneration_crown_ratio_array(pccf, np.random.default_rng(3))
+    assert np.all((crown_ratio >= 0.2) & (crown_ratio <= 0.9))
+    assert np.median(crown_ratio) == pytest.approx(0.89722 - 0.0000461 * 200, abs=0.01)
+    np.testing.assert_array_equal(
+        crown_ratio, model.predict_regeneration_crown_ratio_array(pccf, np.random.default_rng(3)))
+
+
+def test_tree_from_arrays_matches_constructor():
+    """Test that bulk-created trees match individually constructed ones."""
+    trees = Tree.from_arrays([0.05, 2.0, 8.0], [1.0, 16.0, 300.0], 'SP', [0, 5, 20], 0.99)
+    for tree, (dbh, height, age) in zip(trees, [(0.05, 1.0, 0), (2.0, 16.0, 5), (8.0, 300.0, 20)]):
+        single = Tree(dbh, height, 'SP', age, 0.99)
+        assert (tree.dbh, tree.height, tree.age, tree.crown_ratio) == \
+            (single.dbh, single.height, single.age, single.crown_ratio)
+        assert tree.species == 'SP'
+        assert tree.growth_params == single.growth_params
+    trees[1].grow(site_index=70, competition_factor=0.2)
+    assert trees[1].dbh > 2.0
+
+
+def test_batch_regeneration_inserts_records():
+    """Test that cohorts are inserted after their stands' records."""
+    batch = StandBatch.initialize_planted([
+        {'species': 'LP', 'site_index': 70, 'trees_per_acre': 30},
+        {'species': 'SP', 'site_index': 60, 'trees_per_acre': 20},
+    ], seed=1)
+    batch.grow(years=10)
+    dbh = [batch.dbh[batch.stand_index == i].copy() for i in range(2)]
+
+    added = batch.add_regeneration([1, 0, 1], [30, 10, 5], species=['SP', 'WO', 'LP'], records=[3, 10, 5])
+
+    np.testing.assert_array_equal(added, [10, 35])
+    assert batch.species_codes == ['LP', 'SP', 'WO']
+    assert np.all(np.diff(batch.stand_index) >= 0)
+    assert batch.offsets[-1] == batch.n_records
+    for i in range(2):
+        records = slice(batch.offsets[i], batch.offsets[i + 1])
+        np.testing.assert_array_equal(batch.dbh[records][:len(dbh[i])], dbh[i])
+    new_records = batch.tree_age == 5
+    assert batch.tpa[new_records].sum() == pytest.approx(45)
+    assert np.all(batch.crown_ratio[new_records] >= 0.2)
+    assert [batch.species_codes[s] for s in batch.species_id[batch.offsets[0]:batch.offsets[1]][-10:]] == ['WO'] * 10
+
+    batch.grow(years=5)
+    assert np.all(batch.get_metrics()['tpa'] > 0)
+
+
+def test_batch_regeneration_checkpoint(tmp_path):
+    """Test that records of added species survive a checkpoint."""
+    batch = StandBatch.initialize_planted([{'species': 'LP', 'site_index': 70, 'trees_per_acre': 20}], seed=2)
+    batch.add_regeneration([0], [10], species='SA', records=2)
+    store = CheckpointStore(tmp_path, 'run')
+    store.save(0, batch, [batch.get_metrics()])
+    restored = store.load(0)['batch']
+
+    assert restored.species_codes == batch.species_codes
+    np.testing.assert_array_equal(restored.species_id, batch.species_id)
+    batch.grow(years=5)
+    restored.grow(years=5)
+    np.testing.assert_array_equal(restored.dbh, batch.dbh)
+
+
+def test_stand_regeneration():
+    """Test establishing a cohort in a per-tree Stand."""
+    random.seed(4)
+    stand = Stand.initialize_planted(trees_per_acre=20, site_index=70, species='LP')
+    assert stand.add_regeneration(15.4, age=5) == 15
+    assert stand.add_regeneration(0) == 0
+    assert len(stand.trees) == 35
+    new_trees = stand.trees[20:]
+    assert all(tree.age == 5 and tree.height > 4.5 for tree in new_trees)
+    stand.grow(years=5)
+    assert stand.get_metrics()['tpa'] <= 35
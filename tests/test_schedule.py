@@ -0,0 +1,170 @@
+"""
+Tests for compiled management schedules.
+"""
+import math
+import random
+import numpy as np
+import pytest
+from fvs_python.schedule import HARVEST_KEYS, compile_schedule
+from fvs_python.simulation_engine import SimulationEngine
+
+
+SCENARIOS = [
+    {'species': 'LP', 'site_index': 70, 'trees_per_acre': 400},
+    {'species': 'SP', 'site_index': 60, 'trees_per_acre': 300},
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create an engine writing to a temporary directory."""
+    return SimulationEngine(tmp_path)
+
+
+def test_compile_event_table():
+    """Test that events of all stands are merged into per-cycle dispatches."""
+    compiled = compile_schedule({
+        'events': [
+            {'type': 'thin', 'age': 12, 'residual': 80},
+            {'type': 'ingrowth', 'every': 10, 'trees_per_acre': 20, 'species': 'WO'},
+        ],
+        'report': 10,
+        'volume': [20],
+    }, years=30, time_step=5, n_stands=3, stand_events=[
+        [{'type': 'thin', 'age': 15, 'residual': 60}],
+        None,
+        [{'type': 'thin', 'age': 15, 'residual': 50, 'method': 'above'}],
+    ])
+
+    assert compiled.n_cycles == 6
+    np.testing.assert_array_equal(compiled.report, [1, 0, 1, 0, 1, 0, 1])
+    np.testing.assert_array_equal(compiled.volume, [0, 0, 0, 0, 1, 0, 0])
+    assert compiled.thins
+
+    # Age 12 falls in the cycle ending at age 15, with the stand events
+    actions = [(event.action, event.params.get('method')) for event in compiled.events[3]]
+    assert sorted(actions) == [('thin', 'above'), ('thin', 'below')]
+    below = next(e for e in compiled.events[3] if e.params['method'] == 'below')
+    np.testing.assert_array_equal(below.params['residual'], [60, 80, 80])
+    above = next(e for e in compiled.events[3] if e.params['method'] == 'above')
+    np.testing.assert_array_equal(above.stands, [2])
+
+    for cycle, events in enumerate(compiled.events):
+        ingrowth = [e for e in events if e.action == 'regenerate']
+        assert len(ingrowth) == (1 if cycle in (2, 4, 6) else 0)
+    np.testing.assert_array_equal(compiled.events[2][0].stands, [0, 1, 2])
+
+
+def test_default_schedule_reports_every_cycle():
+    """Test that no schedule means no events and full output."""
+    compiled = compile_schedule(None, years=20, time_step=5)
+    assert compiled.report.all() and compiled.volume.all()
+    assert not compiled.thins
+    assert not any(compiled.events)
+
+
+def test_invalid_events():
+    """Test that invalid events are rejected when compiled."""
+    with pytest.raises(ValueError):
+        compile_schedule({'events': [{'type': 'burn', 'age': 10}]}, 20, 5)
+    with pytest.raises(ValueError):
+        compile_schedule({'events': [{'type': 'thin', 'age': 10, 'residual': 50, 'method': 'crown'}]}, 20, 5)
+    with pytest.raises(ValueError):
+        compile_schedule({'events': [{'type': 'plant', 'trees_per_acre': 50}]}, 20, 5)
+
+
+def test_batch_schedule(engine):
+    """Test thinning, ingrowth and sparse output in a batch simulation."""
+    schedule = {
+        'events': [
+            {'type': 'thin', 'age': 15, 'residual': 5},
+            {'type': 'ingrowth', 'age': 20, 'trees_per_acre': 25, 'records': 5},
+        ],
+        'report': 10,
+        'volume': [30],
+    }
+    df = engine.simulate_batch(SCENARIOS, years=30, seed=4, schedule=schedule)
+
+    assert sorted(df['age'].unique()) == [0, 10, 20, 30]
+    assert set(HARVEST_KEYS) <= set(df.columns)
+    assert df.loc[df['age'] == 30, 'volume'].notna().all()
+    assert df.loc[df['age'] < 30, 'volume'].isna().all()
+
+    # The age-15 thinning is reported with the age-20 row
+    thinned = df[df['removed_tpa'] > 0]
+    assert set(thinned['age']) == {20}
+    assert len(thinned) == 2
+
+    plain = engine.simulate_batch(SCENARIOS, years=30, seed=4)
+    for age in (20, 30):
+        assert (df.loc[df['age'] == age, 'basal_area'].to_numpy() <
+                plain.loc[plain['age'] == age, 'basal_area'].to_numpy()).all()
+
+
+def test_default_schedule_matches_unscheduled(engine):
+    """Test that a schedule without events leaves batch results unchanged."""
+    plain = engine.simulate_batch(SCENARIOS, years=20, seed=9)
+    scheduled = engine.simulate_batch(SCENARIOS, years=20, seed=9, schedule={'events': []})
+    assert plain.equals(scheduled)
+
+
+def test_batch_clearcut_and_replant(engine):
+    """Test a batch that grows without records between clearcut and planting."""
+    df = engine.simulate_batch(SCENARIOS, years=20, seed=3, schedule={'events': [
+        {'type': 'thin', 'age': 10, 'residual': 0, 'target': 'tpa'},
+        {'type': 'plant', 'age': 15, 'trees_per_acre': 200},
+    ]})
+    tpa = df.pivot(index='age', columns='stand_id', values='tpa')
+    assert (tpa.loc[10] == 0).all()
+    assert (tpa.loc[15] == 200).all()
+    assert (tpa.loc[20] > 0).all()
+
+
+def test_scenario_events_apply_to_their_stand(engine):
+    """Test per-scenario events in a batch."""
+    scenarios = [dict(SCENARIOS[0]), dict(SCENARIOS[0], events=[
+        {'type': 'thin', 'age': 10, 'residual': 100, 'target': 'tpa', 'method': 'proportional'}
+    ])]
+    df = engine.simulate_batch(scenarios, years=10, seed=2)
+    final = df[df['age'] == 10].set_index('stand_id')
+    assert final.loc[1, 'tpa'] == pytest.approx(100)
+    assert final.loc[0, 'removed_tpa'] == 0
+    assert final.loc[0, 'tpa'] > 100
+
+
+def test_schedule_checkpoint_resume(engine, tmp_path):
+    """Test resuming a scheduled run that skips reports between checkpoints."""
+    schedule = {'events': [{'type': 'thin', 'age': 10, 'residual': 8}], 'report': [0, 15, 25]}
+    expected = engine.simulate_batch(SCENARIOS, years=25, seed=6, schedule=schedule)
+
+    checkpoint_dir = tmp_path / 'checkpoints'
+    chunks = engine._prepare_batch_run(SCENARIOS, 25, 5, 6, None, checkpoint_dir, False, schedule)[0]
+    store = engine._prepare_batch_run(SCENARIOS, 25, 5, 6, None, checkpoint_dir, True, schedule)[1]
+    partial = engine._iter_batch_chunk(chunks[0][0], 0, chunks[0][1], 25, 5, store, 1,
+                                       schedule=schedule)
+    next(partial)
+    next(partial)
+    partial.close()
+    assert store.load(0)['cycles'] == 3
+
+    resumed = engine.simulate_batch(SCENARIOS, years=25, seed=6, schedule=schedule,
+                                    checkpoint_dir=checkpoint_dir, resume=True)
+    assert expected.equals(resumed)
+
+
+def test_stand_schedule(engine):
+    """Test a scheduled per-tree Stand simulation."""
+    random.seed(5)
+    df = engine.simulate_stand(trees_per_acre=150, years=20, save_outputs=False, plot_results=False,
+                               schedule={'events': [
+                                   {'type': 'thin', 'age': 10, 'residual': 80, 'target': 'tpa'},
+                                   {'type': 'plant', 'age': 15, 'trees_per_acre': 30},
+                               ], 'report': [0, 10, 20], 'volume': False})
+
+    assert df['age'].tolist() == [0, 10, 20]
+    assert df['volume'].isna().all()
+    row = df.set_index('age').loc[10]
+    assert row['tpa'] == 80
+    assert row['removed_tpa'] == row['removed_tpa'] // 1 > 0
+    assert math.isfinite(row['removed_basal_area'])
+    assert df.set_index('age').loc[20, 'tpa'] <= 110
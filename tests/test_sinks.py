@@ -0,0 +1,134 @@
+"""
+Tests for streaming simulation results into sinks.
+"""
+import json
+import sqlite3
+import numpy as np
+import pandas as pd
+import pytest
+from fvs_python.simulation_engine import SimulationEngine
+from fvs_python.data_export import DataExporter
+from fvs_python.sinks import MemorySink, CSVSink, NDJSONSink, SQLiteSink, create_sink
+
+
+SCENARIOS = [
+    {'species': 'LP', 'site_index': si, 'trees_per_acre': tpa}
+    for si in (60, 70) for tpa in (20, 40)
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Create an engine writing to a temporary directory."""
+    return SimulationEngine(tmp_path)
+
+
+def make_rows(n):
+    return [{'age': i * 5, 'tpa': 100.0 - i, 'species': 'LP'} for i in range(n)]
+
+
+def test_buffer_is_bounded():
+    """Test that rows are written once the buffer fills."""
+    sink = MemorySink(buffer_size=3)
+    for row in make_rows(7):
+        sink.write(row)
+        assert len(sink._buffer) < 3
+    assert sink.rows_written == 6
+    sink.close()
+    assert sink.rows_written == 7
+    assert len(sink.to_dataframe()) == 7
+
+
+def test_csv_sink(tmp_path):
+    """Test appending rows to a CSV file."""
+    path = tmp_path / 'rows.csv'
+    with CSVSink(path, buffer_size=2) as sink:
+        sink.write_many(make_rows(5))
+    df = pd.read_csv(path)
+    assert list(df.columns) == ['age', 'tpa', 'species']
+    assert len(df) == 5
+
+
+def test_sqlite_sink(tmp_path):
+    """Test inserting rows into SQLite."""
+    path = tmp_path / 'rows.sqlite'
+    with create_sink(path, buffer_size=2) as sink:
+        assert isinstance(sink, SQLiteSink)
+        sink.write_many(make_rows(5))
+    with sqlite3.connect(path) as connection:
+        assert connection.execute('SELECT COUNT(*), SUM(age) FROM results').fetchone() == (5, 50)
+
+
+def test_parquet_sink(tmp_path):
+    """Test writing Parquet row groups."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = tmp_path / 'rows.parquet'
+    with create_sink(path, buffer_size=2) as sink:
+        sink.write_many(make_rows(5))
+    assert pq.ParquetFile(path).num_row_groups == 3
+    assert pq.read_table(path).num_rows == 5
+
+
+def test_ndjson_sink(tmp_path):
+    """Test writing one JSON object per line."""
+    path = tmp_path / 'rows.jsonl'
+    with create_sink(path, buffer_size=2) as sink:
+        assert isinstance(sink, NDJSONSink)
+        sink.write_many(make_rows(5))
+    lines = path.read_text().splitlines()
+    assert len(lines) == 5
+    assert json.loads(lines[4]) == {'age': 20, 'tpa': 96.0, 'species': 'LP'}
+
+
+def test_export_to_ndjson(tmp_path):
+    """Test NDJSON export of a DataFrame with numpy column types."""
+    df = pd.DataFrame({
+        'age': np.arange(5, dtype=np.int32),
+        'volume': np.linspace(0, 1, 5),
+        'species': ['LP'] * 5
+    })
+    path = DataExporter(tmp_path).export_to_ndjson(df, 'yield', chunk_size=2)
+    assert path.suffix == '.ndjson'
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert records == df.to_dict('records')
+
+
+@pytest.mark.parametrize('encoder', ['orjson', 'json'])
+def test_ndjson_writes_nan_as_null(tmp_path, monkeypatch, encoder):
+    """Test that both NDJSON encoders write non-finite values as null."""
+    from fvs_python import data_export
+    if encoder == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(data_export, 'orjson', None)
+
+    path = tmp_path / 'rows.ndjson'
+    with data_export.NDJSONWriter(path) as writer:
+        writer.write_rows([{'age': 0, 'volume': float('nan'), 'tpa': np.float32('inf')}])
+    assert path.read_text() == '{"age":0,"volume":null,"tpa":null}\n'
+
+
+def test_unsupported_sink(tmp_path):
+    """Test that unknown file types are rejected."""
+    with pytest.raises(ValueError):
+        create_sink(tmp_path / 'rows.txt')
+
+
+def test_batch_rows_match_simulate_batch(engine):
+    """Test that streamed batch rows hold the same results as simulate_batch."""
+    expected = engine.simulate_batch(SCENARIOS, years=20, seed=3, chunk_size=3)
+    rows = pd.DataFrame(list(engine.iter_batch_results(SCENARIOS, years=20, seed=3, chunk_size=3)))
+
+    # Streamed rows are ordered by cycle within each chunk
+    rows = rows.sort_values(['stand_id', 'age']).reset_index(drop=True)
+    pd.testing.assert_frame_equal(rows[expected.columns], expected, check_dtype=False)
+
+
+def test_iter_yield_table(engine):
+    """Test that yield table rows stream one scenario at a time."""
+    rows = engine.iter_yield_table(species='LP', site_indices=[70], planting_densities=[20, 30],
+                                   years=10)
+    first = next(rows)
+    assert first['age'] == 0
+    assert first['initial_tpa'] == 20
+    assert len(list(rows)) == 5
@@ -2,9 +2,11 @@
 Unit tests for stand-level growth and dynamics.
 All tests use 1 acre as the standard area for simplicity.
 """
+import logging
 import pytest
 from pathlib import Path
 from fvs_python.stand import Stand
+from fvs_python.logging_config import set_transition_events
 from tests.utils import (
     setup_test_output, 
     plot_stand_development, 
@@ -300,4 +302,37 @@ def test_25_year_survival():
         period_mortality.append(period_start - period_end)
     
     # Early mortality should be highest
-    assert period_mortality[0] > period_mortality[-1] 
\ No newline at end of file
+    assert period_mortality[0] > period_mortality[-1] 
+
+class _EventHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_model_transition_summary():
+    """Test that transitions are counted per cycle and per-tree events are opt-in."""
+    handler = _EventHandler()
+    tree_logger = logging.getLogger('fvs_python.tree')
+    tree_logger.addHandler(handler)
+    old_level = tree_logger.level
+    tree_logger.setLevel(logging.DEBUG)
+    try:
+        stand = Stand.initialize_planted(trees_per_acre=50)
+        stand.grow(years=15)
+        assert [h['age'] for h in stand.transition_history] == [5, 10, 15]
+        assert sum(h['small_to_blended'] for h in stand.transition_history) > 0
+        assert not any('transitioned' in m for m in handler.messages)
+
+        set_transition_events(True)
+        stand.grow(years=5)
+        events = sum('transitioned' in m for m in handler.messages)
+        counts = stand.transition_history[-1]
+        assert events == counts['small_to_blended'] + counts['blended_to_large']
+    finally:
+        set_transition_events(False)
+        tree_logger.setLevel(old_level)
+        tree_logger.removeHandler(handler)
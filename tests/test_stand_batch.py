@@ -0,0 +1,126 @@
+"""
+Unit tests for the cross-stand batch kernel.
+Batch results are checked against the per-tree Stand implementation.
+"""
+import random
+import numpy as np
+import pytest
+from fvs_python.stand import Stand
+from fvs_python.stand_batch import StandBatch
+
+
+@pytest.fixture(scope="function")
+def stands():
+    """Create a mix of small stands, including an empty one."""
+    random.seed(42)
+    grown = Stand.initialize_planted(trees_per_acre=30, site_index=70, species='LP')
+    grown.grow(years=10)
+    return [
+        grown,
+        Stand.initialize_planted(trees_per_acre=20, site_index=60, species='SP'),
+        Stand([], site_index=70, species='LP'),
+        Stand.initialize_planted(trees_per_acre=15, site_index=80, species='SA'),
+    ]
+
+
+def test_offsets(stands):
+    """Test that segment offsets index each stand's records."""
+    batch = StandBatch.from_stands(stands)
+    assert batch.n_stands == 4
+    n_first = len(stands[0].trees)
+    assert list(batch.offsets) == [0, n_first, n_first + 20, n_first + 20, n_first + 35]
+
+
+def test_competition_metrics_match_stand(stands):
+    """Test that segment reductions reproduce Stand competition metrics."""
+    batch = StandBatch.from_stands(stands)
+    metrics = batch.calculate_competition_metrics()
+    expected = [m for stand in stands for m in stand._calculate_competition_metrics()]
+
+    for key in ('competition_factor', 'pbal', 'rank', 'relsdi'):
+        assert np.allclose(metrics[key], [m[key] for m in expected])
+
+
+def test_growth_matches_tree(stands):
+    """Test that one vectorized growth cycle matches Tree.grow."""
+    batch = StandBatch.from_stands(stands)
+    batch._grow_trees(batch.calculate_competition_metrics()['competition_factor'])
+
+    for stand in stands:
+        for tree, metrics in zip(stand.trees, stand._calculate_competition_metrics()):
+            tree.grow(site_index=stand.site_index,
+                      competition_factor=metrics['competition_factor'])
+
+    trees = [tree for stand in stands for tree in stand.trees]
+    assert np.allclose(batch.dbh, [t.dbh for t in trees])
+    assert np.allclose(batch.height, [t.height for t in trees])
+    assert np.allclose(batch.crown_ratio, [t.crown_ratio for t in trees])
+
+
+def test_transition_counts_match_stand(stands):
+    """Test that per-stand transition counts match the Tree transition flags."""
+    batch = StandBatch.from_stands(stands)
+    transitions = batch._grow_trees(batch.calculate_competition_metrics()['competition_factor'])
+
+    for i, stand in enumerate(stands):
+        for tree, metrics in zip(stand.trees, stand._calculate_competition_metrics()):
+            tree.grow(site_index=stand.site_index,
+                      competition_factor=metrics['competition_factor'])
+        assert transitions['small_to_blended'][i] == sum(t.last_transitions[0] for t in stand.trees)
+        assert transitions['blended_to_large'][i] == sum(t.last_transitions[1] for t in stand.trees)
+    assert transitions['small_to_blended'].sum() > 0
+
+
+def test_grow_clearcut_batch():
+    """Test growing a batch without records, e.g. after a clearcut."""
+    batch = StandBatch.initialize_planted([
+        {'species': 'LP', 'site_index': 70, 'trees_per_acre': 100},
+        {'species': 'SP', 'site_index': 60, 'trees_per_acre': 100},
+    ], seed=1)
+    batch.thin(0, target='tpa')
+    batch.grow(years=5)
+
+    assert batch.n_records == 0
+    np.testing.assert_array_equal(batch.age, [5, 5])
+    np.testing.assert_array_equal(batch.transition_history[-1]['small_to_blended'], [0, 0])
+    np.testing.assert_array_equal(batch.get_metrics()['tpa'], [0, 0])
+
+
+def test_metrics_match_stand(stands):
+    """Test that batch stand metrics match Stand.get_metrics."""
+    batch = StandBatch.from_stands(stands)
+    metrics = batch.get_metrics()
+
+    for i, stand in enumerate(stands):
+        expected = stand.get_metrics()
+        for key, value in expected.items():
+            assert metrics[key][i] == pytest.approx(value)
+
+
+def test_grow_batch():
+    """Test growing planted stands together."""
+    batch = StandBatch.initialize_planted([
+        {'species': 'LP', 'site_index': 70, 'trees_per_acre': 50},
+        {'species': 'SP', 'site_index': 60, 'trees_per_acre': 10},
+    ], seed=1)
+    initial = batch.get_metrics()
+    batch.grow(years=20)
+    final = batch.get_metrics()
+
+    assert list(batch.age) == [20, 20]
+    assert np.all(final['tpa'] <= initial['tpa'])
+    assert np.all(final['mean_dbh'] > initial['mean_dbh'])
+    assert np.all(np.diff(batch.stand_index) >= 0)
+    assert batch.offsets[-1] == batch.n_records
+
+
+def test_grow_batch_reproducible():
+    """Test that a seeded batch gives identical results."""
+    scenarios = [{'species': 'LP', 'site_index': 70, 'trees_per_acre': 40}] * 3
+    results = []
+    for _ in range(2):
+        batch = StandBatch.initialize_planted(scenarios, seed=7)
+        batch.grow(years=15)
+        results.append(batch.get_metrics())
+    for key in results[0]:
+        assert np.array_equal(results[0][key], results[1][key])
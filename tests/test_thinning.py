@@ -0,0 +1,117 @@
+"""
+Tests for vectorized thinning operations.
+"""
+import math
+import random
+import numpy as np
+import pytest
+from fvs_python.stand import Stand
+from fvs_python.stand_batch import StandBatch
+from fvs_python.thinning import calculate_thinning_array, tree_density_array
+
+
+def _records(n_stands=3, n_records=50, seed=0):
+    rng = np.random.default_rng(seed)
+    stand_index = np.repeat(np.arange(n_stands), n_records)
+    dbh = rng.uniform(2.0, 14.0, len(stand_index))
+    tpa = rng.uniform(1.0, 10.0, len(stand_index))
+    return dbh, tpa, stand_index
+
+
+@pytest.mark.parametrize('target', ['basal_area', 'sdi', 'tpa', 'ccf'])
+@pytest.mark.parametrize('method', ['below', 'above', 'proportional'])
+def test_thinning_reaches_residual(method, target):
+    """Test that every stand is thinned exactly to its residual density."""
+    dbh, tpa, stand_index = _records()
+    density = tree_density_array(target, dbh, np.zeros(len(dbh), dtype=int))
+    before = np.bincount(stand_index, density * tpa)
+    residual = before * np.array([0.4, 0.7, 1.2])
+
+    removed = calculate_thinning_array(density, tpa, dbh, stand_index, residual, method)
+    after = np.bincount(stand_index, density * (tpa - removed))
+
+    assert np.all(removed >= 0) and np.all(removed <= tpa + 1e-12)
+    np.testing.assert_allclose(after[:2], residual[:2])
+    assert after[2] == pytest.approx(before[2])
+
+
+def test_thinning_from_below_and_above():
+    """Test that thinning from below (above) removes the smallest (largest) trees."""
+    dbh, tpa, stand_index = _records(n_stands=1)
+    density = tree_density_array('basal_area', dbh, np.zeros(len(dbh), dtype=int))
+    residual = np.array([0.5 * np.sum(density * tpa)])
+
+    below = calculate_thinning_array(density, tpa, dbh, stand_index, residual, 'below')
+    assert dbh[below == tpa].max() <= dbh[below == 0].min()
+    assert np.sum((below > 0) & (below < tpa)) <= 1
+
+    above = calculate_thinning_array(density, tpa, dbh, stand_index, residual, 'above')
+    assert dbh[above == tpa].min() >= dbh[above == 0].max()
+
+
+def test_proportional_thinning_with_dbh_limits():
+    """Test that proportional thinning takes an equal share of eligible records."""
+    dbh, tpa, stand_index = _records(n_stands=1)
+    density = np.ones(len(dbh))
+    eligible = dbh < 8.0
+    residual = np.array([tpa.sum() - 0.5 * tpa[eligible].sum()])
+
+    removed = calculate_thinning_array(density, tpa, dbh, stand_index, residual, 'proportional', eligible)
+    np.testing.assert_allclose(removed[eligible], 0.5 * tpa[eligible])
+    assert np.all(removed[~eligible] == 0)
+
+
+def test_unknown_method_and_target():
+    """Test that unknown methods and targets raise."""
+    with pytest.raises(ValueError):
+        tree_density_array('volume', [5.0], [0])
+    with pytest.raises(ValueError):
+        calculate_thinning_array([1.0], [1.0], [5.0], [0], [0.0], 'random')
+
+
+def test_batch_thin_reports_removed_records():
+    """Test thinning a StandBatch and the harvest report of removed records."""
+    batch = StandBatch.initialize_planted([
+        {'species': 'LP', 'site_index': 70, 'trees_per_acre': 500},
+        {'species': 'SP', 'site_index': 60, 'trees_per_acre': 300},
+    ], seed=7)
+    batch.grow(years=20)
+    before = batch.get_metrics()
+    volume = batch.calculate_volume()
+    tree_volume = {(s, d): v for s, d, v in zip(batch.stand_index, batch.dbh, volume)}
+
+    harvest = batch.thin([0.6 * before['basal_area'][0], np.inf], method='below')
+    after = batch.get_metrics()
+
+    assert after['basal_area'][0] == pytest.approx(0.6 * before['basal_area'][0])
+    assert after['basal_area'][1] == pytest.approx(before['basal_area'][1])
+    np.testing.assert_allclose(harvest['basal_area'], before['basal_area'] - after['basal_area'], atol=1e-9)
+    np.testing.assert_allclose(harvest['tpa'], before['tpa'] - after['tpa'], atol=1e-9)
+    assert harvest['tpa'][1] == 0
+
+    records = harvest['records']
+    assert np.all(records['stand_index'] == 0)
+    assert records['dbh'].max() <= batch.dbh[batch.stand_index == 0].min()
+    expected = sum(tree_volume[(s, d)] * t for s, d, t in
+                   zip(records['stand_index'], records['dbh'], records['tpa']))
+    assert harvest['volume'][0] == pytest.approx(expected)
+    assert np.all(np.diff(batch.offsets) == batch.record_counts)
+
+    batch.grow(years=5)
+    assert np.all(batch.get_metrics()['tpa'] > 0)
+
+
+def test_stand_thin():
+    """Test thinning a per-tree Stand."""
+    random.seed(8)
+    stand = Stand.initialize_planted(trees_per_acre=200, site_index=70, species='LP')
+    stand.grow(years=15)
+    dbh = sorted(tree.dbh for tree in stand.trees)
+
+    harvest = stand.thin(100, target='tpa', method='below')
+
+    assert harvest['tpa'] == len(dbh) - 100
+    assert len(stand.trees) == 100
+    assert min(tree.dbh for tree in stand.trees) >= max(tree.dbh for tree in harvest['trees'])
+    assert harvest['basal_area'] == pytest.approx(sum(math.pi * (d / 24) ** 2 for d in dbh[:harvest['tpa']]))
+    assert harvest['volume'] > 0
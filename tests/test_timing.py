@@ -0,0 +1,93 @@
+"""
+Tests for phase timing instrumentation.
+"""
+import time
+import pytest
+from fvs_python.stand import Stand
+from fvs_python.stand_batch import StandBatch
+from fvs_python.simulation_engine import SimulationEngine
+from fvs_python.timing import PhaseTimer, enable_timing, phase, timed
+
+
+@pytest.fixture
+def timing():
+    """Enable timing for one test."""
+    enable_timing(True)
+    yield
+    enable_timing(False)
+
+
+def test_disabled_records_nothing():
+    """Test that phases are not recorded while timing is disabled."""
+    timer = PhaseTimer()
+    with timer.activate():
+        with phase('growth'):
+            pass
+    assert timer.report() == {}
+
+
+def test_nested_timers_receive_phases(timing):
+    """Test that every active timer receives a phase."""
+    outer, inner = PhaseTimer(), PhaseTimer()
+
+    @timed('export_csv')
+    def export():
+        time.sleep(0.01)
+
+    with outer.activate():
+        with inner.activate():
+            with phase('growth'):
+                pass
+        export()
+
+    assert inner.report()['growth']['calls'] == 1
+    assert 'export_csv' not in inner.report()
+    assert outer.report()['export_csv']['total_s'] >= 0.01
+    assert list(outer.report()) == ['export_csv', 'growth']
+
+
+def test_stand_report(timing):
+    """Test the per-stand report of Stand.grow."""
+    stand = Stand.initialize_planted(trees_per_acre=20)
+    stand.grow(years=10)
+    report = stand.timer.report()
+
+    for name in ('competition', 'growth', 'crown_ratio', 'mortality', 'metrics', 'volume'):
+        assert name in report
+    assert report['growth']['calls'] == 2
+    assert report['crown_ratio']['calls'] >= 20
+
+
+def test_batch_and_engine_reports(timing, tmp_path):
+    """Test that batch phases reach both the batch and the engine reports."""
+    engine = SimulationEngine(tmp_path)
+    engine.simulate_batch([{'species': 'LP', 'site_index': 70, 'trees_per_acre': 20}],
+                          years=10, seed=1)
+    engine.simulate_stand(trees_per_acre=20, years=10, save_outputs=False, plot_results=False)
+    report = engine.timing_report()
+
+    assert report['growth']['calls'] == 4
+    # 3 batch cycles, 3 stand cycles, plus Stand.grow's own before/after summary metrics
+    assert report['metrics']['calls'] == 10
+    assert 'volume' in report and 'initialize' in report
+    assert 'phase' in engine.timer.format_report()
+
+    batch = StandBatch.initialize_planted([{'species': 'LP', 'site_index': 70, 'trees_per_acre': 20}])
+    batch.grow(years=5)
+    assert batch.timer.report()['crown_ratio']['calls'] == 1
+
+
+def test_timer_copy_and_pickle(timing):
+    """Test that timers (and the stands holding them) can be copied and pickled."""
+    import copy
+    import pickle
+    timer = PhaseTimer()
+    with timer.phase('growth'):
+        pass
+    for clone in (copy.deepcopy(timer), pickle.loads(pickle.dumps(timer))):
+        assert clone.report()['growth']['calls'] == 1
+        clone.add('growth', 0.0)
+    assert timer.report()['growth']['calls'] == 1
+
+    batch = StandBatch.initialize_planted([{'species': 'LP', 'site_index': 70, 'trees_per_acre': 5}])
+    assert copy.deepcopy(batch).n_records == 5
@@ -0,0 +1,94 @@
+"""
+Tests for per-cycle tree-list output.
+"""
+import numpy as np
+from fvs_python.simulation_engine import SimulationEngine
+from fvs_python.stand import Stand
+from fvs_python.stand_batch import StandBatch
+from fvs_python.tree_list import TreeListRecorder, TreeListReader, TREE_RECORD_DTYPE
+
+
+def test_record_and_read_stand(tmp_path):
+    """Test recording a Stand and reading it back by cycle."""
+    path = tmp_path / 'trees.bin'
+    stand = Stand.initialize_planted(trees_per_acre=20)
+
+    with TreeListRecorder(path) as recorder:
+        recorder.record_stand(stand, cycle=0, stand_id=7)
+        stand.grow(years=5)
+        recorder.record_stand(stand, cycle=1, stand_id=7)
+
+    reader = TreeListReader(path)
+    assert reader.cycles == [0, 1]
+    assert path.stat().st_size == len(reader) * TREE_RECORD_DTYPE.itemsize
+
+    records = reader.read(cycle=1)
+    assert isinstance(records, np.memmap)
+    assert len(records) == len(stand.trees)
+    assert np.all(records['stand_id'] == 7)
+    assert np.all(records['age'] == 5)
+    assert np.allclose(records['dbh'], [t.dbh for t in stand.trees])
+    assert np.allclose(records['volume'], [t.get_volume() for t in stand.trees])
+
+
+def test_record_batch(tmp_path):
+    """Test recording all stands of a batch in one block."""
+    path = tmp_path / 'trees.bin'
+    batch = StandBatch.initialize_planted([
+        {'species': 'LP', 'site_index': 70, 'trees_per_acre': 10, 'stand_id': 100},
+        {'species': 'SP', 'site_index': 60, 'trees_per_acre': 5, 'stand_id': 200},
+    ], seed=1)
+
+    with TreeListRecorder(path) as recorder:
+        recorder.record_batch(batch, cycle=0)
+
+    reader = TreeListReader(path)
+    assert len(reader.read(stand_id=100)) == 10
+    assert len(reader.read(cycle=0, stand_id=200)) == 5
+
+
+def test_append_to_existing(tmp_path):
+    """Test appending blocks to an existing tree list."""
+    path = tmp_path / 'trees.bin'
+    ones = np.ones(3)
+    with TreeListRecorder(path) as recorder:
+        recorder.record(0, 1, 0, ones, ones, ones, ones, ones)
+    with TreeListRecorder(path, append=True) as recorder:
+        recorder.record(1, 1, 5, ones * 2, ones, ones, ones, ones)
+
+    reader = TreeListReader(path)
+    assert len(reader) == 6
+    assert np.all(reader.read(cycle=1)['dbh'] == 2)
+
+
+def test_append_drops_partial_block(tmp_path):
+    """Test that appending discards records and index lines of an interrupted block."""
+    path = tmp_path / 'trees.bin'
+    ones = np.ones(4)
+    with TreeListRecorder(path) as recorder:
+        for cycle in range(3):
+            recorder.record(cycle, 1, 5 * cycle, ones, ones, ones, ones, ones)
+    with open(path, 'ab') as f:
+        f.write(b'\0' * (TREE_RECORD_DTYPE.itemsize + 5))
+    with open(path.with_name(path.name + '.idx'), 'ab') as f:
+        f.write(b'3 12')
+
+    assert len(TreeListReader(path)) == 12
+    with TreeListRecorder(path, append=True) as recorder:
+        recorder.record(3, 1, 15, ones * 3, ones, ones, ones, ones)
+
+    reader = TreeListReader(path)
+    assert reader.cycles == [0, 1, 2, 3]
+    assert path.stat().st_size == 16 * TREE_RECORD_DTYPE.itemsize
+    assert np.all(reader.read(cycle=3)['dbh'] == 3)
+
+
+def test_engine_size_distribution_plots(tmp_path):
+    """Test that simulate_stand can feed size distribution plots from the tree list."""
+    engine = SimulationEngine(tmp_path)
+    engine.simulate_stand(trees_per_acre=20, years=10, save_outputs=False,
+                          plot_results=True, tree_list=True)
+
+    reader = TreeListReader(tmp_path / 'tree_list_LP_TPA20_SI70.bin')
+    assert reader.cycles == [0, 1, 2]
+    assert (tmp_path / 'LP_TPA20_SI70_size_distribution_age10.png').exists()